@@ -1,2 +1,5 @@
 from .decorators import runtime_validation
 from .settings import config
+from .trusted import trust, distrust
+from .compiled import compile_validator as compile, check, stream
+from .overrides import overrides, disabled
@@ -0,0 +1,125 @@
+import queue
+import logging
+import threading
+
+from .exceptions import RuntimeTypeError
+
+
+logger = logging.getLogger('enforce')
+
+
+class BackgroundValidator:
+    """
+    Validates calls of enforced functions on a background thread after they have already returned
+
+    Calls wait in a bounded queue; when it overflows, their validation is dropped
+    The queue follows changes of the configured size, calls which are already queued are kept
+    With the 'sample' overflow policy, only a sample of calls is queued once the queue is half full
+    Violations are passed to a sink instead of being raised
+    """
+
+    def __init__(self, lock):
+        self.lock = lock
+        self.queue = None
+        self.thread = None
+        self.start_lock = threading.Lock()
+        self.counters_lock = threading.Lock()
+        self.submitted = 0
+        self.dropped = 0
+        self.violations = 0
+
+    def submit(self, enforcer, parameters, result):
+        """
+        Queues the validation of a call, returns False if it was dropped
+        """
+        options = enforcer.settings.background_options
+
+        if self.thread is None:
+            self.start(options['queue_size'])
+        elif self.queue.maxsize != options['queue_size']:
+            self.resize(options['queue_size'])
+
+        with self.counters_lock:
+            self.submitted += 1
+            submitted = self.submitted
+
+        if options['overflow'] == 'sample' and self.queue.qsize() * 2 >= self.queue.maxsize:
+            if submitted % options['sample_rate']:
+                self.count_dropped()
+                return False
+
+        try:
+            self.queue.put_nowait((enforcer, parameters, result))
+        except queue.Full:
+            self.count_dropped()
+            return False
+
+        return True
+
+    def count_dropped(self):
+        with self.counters_lock:
+            self.dropped += 1
+
+    def start(self, queue_size):
+        with self.start_lock:
+            if self.thread is not None:
+                return
+
+            self.queue = queue.Queue(maxsize=queue_size)
+
+            thread = threading.Thread(target=self.run, name='enforce-background-validation', daemon=True)
+            thread.start()
+
+            self.thread = thread
+
+    def resize(self, queue_size):
+        """
+        Changes the maximum size of the queue, calls over the new size are kept until they are validated
+        """
+        with self.queue.mutex:
+            self.queue.maxsize = queue_size
+            self.queue.not_full.notify_all()
+
+    def run(self):
+        while True:
+            enforcer, parameters, result = self.queue.get()
+            try:
+                self.validate(enforcer, parameters, result)
+            except Exception:
+                logger.exception('Background validation failed')
+            finally:
+                self.queue.task_done()
+
+    def validate(self, enforcer, parameters, result):
+        with self.lock:
+            enforcer.reset()
+            try:
+                enforcer.validate_inputs(parameters)
+                enforcer.validate_outputs(result)
+            except RuntimeTypeError as error:
+                with self.counters_lock:
+                    self.violations += 1
+                self.report(enforcer, error)
+
+    def report(self, enforcer, error):
+        sink = enforcer.settings.background_options['sink']
+
+        if sink is None:
+            name = getattr(enforcer.reference, '__qualname__', repr(enforcer.reference))
+            logger.warning('Runtime type violation in %s:%s', name, error)
+        else:
+            sink(enforcer.reference, error)
+
+    def flush(self):
+        """
+        Waits until all the queued calls are validated
+        """
+        if self.queue is not None:
+            self.queue.join()
+
+    def stats(self):
+        """
+        Returns counters of submitted, dropped and violating calls
+        """
+        with self.counters_lock:
+            return {'submitted': self.submitted, 'dropped': self.dropped, 'violations': self.violations}
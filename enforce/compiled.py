@@ -0,0 +1,215 @@
+import typing
+from itertools import islice
+from threading import RLock
+from collections import OrderedDict
+
+from .nodes import SimpleNode
+from .settings import Settings
+from .exceptions import RuntimeTypeError
+from .validator import init_validator
+
+
+# Compiled validators shared by all users of the same type hint, the least recently used are dropped first
+_COMPILED_VALIDATORS = OrderedDict()
+
+MAX_COMPILED_VALIDATORS = 1024
+
+_COMPILE_LOCK = RLock()
+
+
+class CompiledValidator:
+    """
+    A reusable validator of values against a single type hint
+    It can be safely shared between threads
+    Forward references (e.g. of recursive type hints) are resolved in the given namespace
+    """
+
+    def __init__(self, hint: typing.Any, namespace: typing.Optional[typing.Dict]=None):
+        self.hint = hint
+        self.namespace = namespace
+        self.validator = init_validator({'value': hint}, namespace=namespace)
+        self.validator.settings = Settings(enabled=True)
+        self.lock = RLock()
+
+    def is_valid(self, value: typing.Any) -> bool:
+        """
+        Returns if the value matches the type hint
+        """
+        with self.lock:
+            return self.validate(value)[0]
+
+    def check(self, value: typing.Any) -> typing.Any:
+        """
+        Returns the validated value or raises RuntimeTypeError if it does not match the type hint
+        """
+        with self.lock:
+            valid, data, actual_type = self.validate(value)
+
+        if not valid:
+            raise RuntimeTypeError(self.format_error('Value', actual_type))
+
+        return data
+
+    def validate_many(self, values: typing.Iterable) -> typing.List:
+        """
+        Returns a list of validated values
+        Raises RuntimeTypeError for the first value which does not match the type hint, reporting its index
+        """
+        output = []
+
+        with self.lock:
+            for i, value in enumerate(values):
+                valid, data, actual_type = self.validate(value)
+
+                if not valid:
+                    raise RuntimeTypeError(self.format_error('Item {}'.format(i), actual_type))
+
+                output.append(data)
+
+        return output
+
+    def validate_chunk(self, values: typing.Sequence) -> typing.List[typing.Tuple[bool, typing.Any, str]]:
+        """
+        Validates a sequence of values under a single lock acquisition
+        If the type hint is a leaf (it depends only on the type of data), every distinct type is validated only once
+
+        Returns a list of validation statuses, validated data and actual type names
+        """
+        verdicts = {} if self.is_leaf else None
+        output = []
+
+        with self.lock:
+            for value in values:
+                if verdicts is not None and not isinstance(value, type):
+                    value_type = type(value)
+                    try:
+                        valid, actual_type = verdicts[value_type]
+                    except KeyError:
+                        valid, _, actual_type = self.validate(value)
+                        verdicts[value_type] = (valid, actual_type)
+
+                    output.append((valid, value, actual_type))
+                else:
+                    output.append(self.validate(value))
+
+        return output
+
+    @property
+    def is_leaf(self) -> bool:
+        """
+        Returns if the type hint is validated only by the type of data, without looking inside it
+        """
+        root = self.validator.roots['value']
+        return type(root) is SimpleNode and not root.original_children and not self.validator.globals
+
+    def validate(self, value):
+        """
+        Validates the value, returning a validation status, the validated data and an actual type name
+        """
+        validator = self.validator
+        validator.reset()
+
+        try:
+            valid = validator.validate(value, 'value')
+        finally:
+            validator.end_pass()
+
+        actual_type = validator.errors[-1][1] if not valid else None
+
+        return valid, validator.data_out['value'], actual_type
+
+    def format_error(self, subject, actual_type):
+        """
+        Generates an exception message for a value of the given actual type
+        """
+        error_message = "       {0} was not of type {1}. Actual type was {2}."
+        output = "\n  The following runtime type errors were encountered:"
+        output += '\n' + error_message.format(subject, self.hint, actual_type)
+
+        return output
+
+    def __repr__(self):
+        return 'CompiledValidator({})'.format(self.hint)
+
+
+def compile_validator(hint: typing.Any, namespace: typing.Optional[typing.Dict]=None) -> CompiledValidator:
+    """
+    Returns a validator for the given type hint
+    Validators are built only once per type hint and namespace, as long as they stay in the cache
+    """
+    # Cached validators keep their namespaces alive, so their ids cannot be reused
+    key = (hint, id(namespace))
+
+    try:
+        compiled = _COMPILED_VALIDATORS[key]
+        _COMPILED_VALIDATORS.move_to_end(key)
+        return compiled
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable type hints cannot be cached
+        return CompiledValidator(hint, namespace)
+
+    with _COMPILE_LOCK:
+        compiled = _COMPILED_VALIDATORS.get(key)
+
+        if compiled is None:
+            compiled = CompiledValidator(hint, namespace)
+            _COMPILED_VALIDATORS[key] = compiled
+
+            while len(_COMPILED_VALIDATORS) > MAX_COMPILED_VALIDATORS:
+                _COMPILED_VALIDATORS.popitem(last=False)
+
+    return compiled
+
+
+def check(value: typing.Any, hint: typing.Any, namespace: typing.Optional[typing.Dict]=None) -> typing.Any:
+    """
+    Returns the validated value or raises RuntimeTypeError if it does not match the type hint
+    """
+    return compile_validator(hint, namespace).check(value)
+
+
+def stream(iterable: typing.Iterable,
+           hint: typing.Any,
+           *,
+           on_failure: typing.Union[str, typing.Callable[[int, typing.Any], typing.Any]]='raise',
+           chunk_size: typing.Optional[int]=None,
+           namespace: typing.Optional[typing.Dict]=None) -> typing.Iterator:
+    """
+    Returns a generator of validated items of the iterable
+    Items are pulled from the iterable only when requested, at most one chunk at a time
+
+    Invalid items either raise RuntimeTypeError ('raise'), are silently dropped ('drop')
+    or are dropped after being passed together with their index to the given callable
+    Chunked validation holds the validator lock once per chunk and validates leaf hints once per type in a chunk
+    """
+    if not callable(on_failure) and on_failure not in ('raise', 'drop'):
+        raise ValueError('Failure policy must be \'raise\', \'drop\' or a callable')
+
+    if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size < 1):
+        raise ValueError('Chunk size must be a positive integer')
+
+    compiled = compile_validator(hint, namespace)
+
+    return _stream(iter(iterable), compiled, on_failure, chunk_size or 1)
+
+
+def _stream(iterator, compiled, on_failure, chunk_size):
+    index = 0
+
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+
+        if not chunk:
+            return
+
+        for item, (valid, data, actual_type) in zip(chunk, compiled.validate_chunk(chunk)):
+            if valid:
+                yield data
+            elif on_failure == 'raise':
+                raise RuntimeTypeError(compiled.format_error('Item {}'.format(index), actual_type))
+            elif on_failure != 'drop':
+                on_failure(index, item)
+
+            index += 1
@@ -1,25 +1,48 @@
+import time
 import inspect
 import typing
 import functools
 from multiprocessing import RLock
 from functools import wraps
 
-from wrapt import decorator, ObjectProxy
+from wrapt import decorator, ObjectProxy, FunctionWrapper
 
-from .settings import Settings
+from .settings import Settings, is_noop
 #from .wrappers import Proxy
 from .enforcers import apply_enforcer, Parameters, GenericProxy
+from .exceptions import RuntimeTypeError, BatchRuntimeTypeError
 from .types import is_type_of_type
+from .background import BackgroundValidator
+from .governor import GOVERNOR, GovernorLevel
+from .sampling import sample
+from .registry import REGISTRY
+from .overrides import get_overrides
 
 
 BuildLock = RLock()
 RunLock = RLock()
 
+BackgroundValidation = BackgroundValidator(RunLock)
 
-def runtime_validation(data=None, *, enabled=None, group=None):
+
+def runtime_validation(data=None, *, enabled=None, group=None, incremental=False, background=False, warmup=None,
+                       mode=None):
     """
     This decorator enforces runtime parameter and return value type checking validation
     It uses the standard Python 3.5 syntax for type hinting declaration
+
+    In incremental mode, lists and dictionaries are treated as append-only containers
+    and only their items added since the last successful validation are checked
+
+    In background mode, the function is called without waiting for validation,
+    its calls are validated on a background thread and violations are reported instead of being raised
+
+    With warmup set to a number of calls, after so many consecutive successful calls
+    only the types of arguments and of the result are checked, until a failure or a new type is seen
+
+    Mode sets the variance of the function's type checks, overriding the mode of its group and the global one
+
+    Groups in no-op mode (see ENFORCE_NOOP) are not decorated at all, the original object is returned
     """
     with RunLock:
         if enabled is not None and not isinstance(enabled, bool):
@@ -28,14 +51,31 @@ def runtime_validation(data=None, *, enabled=None, group=None):
         if group is not None and not isinstance(group, str):
             raise TypeError('Group parameter must be string')
 
+        if not isinstance(incremental, bool):
+            raise TypeError('Incremental parameter must be boolean')
+
+        if not isinstance(background, bool):
+            raise TypeError('Background parameter must be boolean')
+
+        if warmup is not None and (isinstance(warmup, bool) or not isinstance(warmup, int) or warmup < 1):
+            raise TypeError('Warmup parameter must be a positive integer')
+
+        if mode is not None and not isinstance(mode, str):
+            raise TypeError('Mode parameter must be string')
+
+        if is_noop(group):
+            return data if data is not None else lambda wrapped: wrapped
+
         if enabled is None and group is None:
             enabled = True
 
         # see https://wrapt.readthedocs.io/en/latest/decorators.html#decorators-with-optional-arguments
         if data is None:
-            return functools.partial(runtime_validation, enabled=enabled, group=group)
+            return functools.partial(runtime_validation, enabled=enabled, group=group,
+                                     incremental=incremental, background=background, warmup=warmup, mode=mode)
 
-        configuration = Settings(enabled=enabled, group=group)
+        configuration = Settings(enabled=enabled, group=group, incremental=incremental,
+                                 background=background, warmup=warmup, mode=mode)
 
         # ????
         if data.__class__ is type and is_type_of_type(data, tuple, covariant=True):
@@ -81,43 +121,217 @@ def get_universal_decorator():
         the original function and then it checks for the output type. Only then it returns the
         output of original function.
         """
+        enforcer = wrapped.__enforcer__
+        settings = enforcer.settings
+
+        # Overrides of the current context can both enable bypassed functions and disable others
+        if get_overrides() is None:
+            if enforcer.bypassed:
+                return wrapped(*args, **kwargs)
+        elif settings is not None and not settings.enabled:
+            return wrapped(*args, **kwargs)
+
+        # Calls which are not sampled are not validated at all, they do not even wait for the lock
+        if settings is not None and not settings.sample():
+            return wrapped(*args, **kwargs)
+
+        if settings is not None and settings.background:
+            return call_in_background_mode(wrapped, instance, args, kwargs)
+
+        governor = GOVERNOR.get(settings) if settings is not None else None
+        shallow = False
+
+        if governor is not None:
+            level = governor.level
+
+            if level is GovernorLevel.off or (level is GovernorLevel.sampled and
+                                              not sample(settings.governor_options['sample_rate'])):
+                return call_without_validation(wrapped, args, kwargs, governor)
+
+            shallow = level is GovernorLevel.shallow
+
         with RunLock:
             enforcer = wrapped.__enforcer__
+            enforcer.validator.shallow = shallow
             skip = False
 
-            # In order to avoid problems with TypeVar-s, validator must be reset
-            enforcer.reset()
+            if governor is not None:
+                start = time.perf_counter()
+                call_start = call_end = None
 
-            instance_method = False
-            if instance is not None and not inspect.isclass(instance):
-                instance_method = True
+            try:
+                # In order to avoid problems with TypeVar-s, validator must be reset
+                enforcer.reset()
 
-            if hasattr(wrapped, '__no_type_check__'):
-                skip = True
+                instance_method = False
+                if instance is not None and not inspect.isclass(instance):
+                    instance_method = True
 
-            if instance_method:
-                parameters = Parameters([instance, *args], kwargs, skip)
-            else:
-                parameters = Parameters(args, kwargs, skip)
+                if hasattr(wrapped, '__no_type_check__'):
+                    skip = True
+
+                if instance_method:
+                    parameters = Parameters([instance, *args], kwargs, skip)
+                else:
+                    parameters = Parameters(args, kwargs, skip)
+
+                # First, check argument types (every key not labelled 'return')
+                _args, _kwargs, _ = enforcer.validate_inputs(parameters)
 
-            # First, check argument types (every key not labelled 'return')
-            _args, _kwargs, _ = enforcer.validate_inputs(parameters)
+                if instance_method:
+                    if len(_args) > 1:
+                        _args = _args[1:]
+                    else:
+                        _args = tuple()
 
-            if instance_method:
-                if len(_args) > 1:
-                    _args = _args[1:]
+                if governor is None:
+                    result = wrapped(*_args, **_kwargs)
                 else:
-                    _args = tuple()
+                    call_start = time.perf_counter()
+                    result = wrapped(*_args, **_kwargs)
+                    call_end = time.perf_counter()
 
-            result = wrapped(*_args, **_kwargs)
+                # we *only* return result if all type checks passed
+                if skip:
+                    return result
 
-            # we *only* return result if all type checks passed
-            if skip:
-                return result
-            else:
                 return enforcer.validate_outputs(result)
+            finally:
+                # Calls which fail validation are measured as well, up to the failure
+                if governor is not None:
+                    record_call(governor, wrapped, start, call_start, call_end)
+
+    def wrap(wrapped):
+        wrapper = EnforcedFunctionWrapper(wrapped, universal)
+        REGISTRY.register(wrapper)
+        return wrapper
+
+    return wrap
+
+
+def call_in_background_mode(wrapped, instance, args, kwargs):
+    """
+    Calls the function immediately and queues the validation of its arguments and result
+    Only references to the arguments are kept, so their later changes may affect the validation
+    """
+    result = wrapped(*args, **kwargs)
+
+    enforcer = wrapped.__enforcer__
+
+    if hasattr(wrapped, '__no_type_check__') or not enforcer.settings.enabled:
+        return result
+
+    if instance is not None and not inspect.isclass(instance):
+        parameters = Parameters([instance, *args], dict(kwargs), False)
+    else:
+        parameters = Parameters(tuple(args), dict(kwargs), False)
+
+    BackgroundValidation.submit(enforcer, parameters, result)
+
+    return result
+
+
+def record_call(governor, wrapped, start, call_start, call_end):
+    """
+    Passes the validation and call times of a governed call to its governor
+    Call times are None if the call did not start or did not return
+    """
+    end = time.perf_counter()
+
+    if call_start is None:
+        validation_time, call_time = end - start, 0.0
+    elif call_end is None:
+        validation_time, call_time = call_start - start, end - call_start
+    else:
+        validation_time, call_time = (call_start - start) + (end - call_end), call_end - call_start
+
+    governor.record(get_function_name(wrapped), validation_time, call_time)
+
+
+def call_without_validation(wrapped, args, kwargs, governor):
+    """
+    Calls the function skipped by its governor, only measuring the time of the call
+    """
+    start = time.perf_counter()
+    result = wrapped(*args, **kwargs)
+    governor.record(get_function_name(wrapped), 0.0, time.perf_counter() - start, validated=False)
+
+    return result
+
+
+def get_function_name(wrapped):
+    reference = wrapped.__enforcer__.reference
+    return getattr(reference, '__qualname__', None) or repr(reference)
+
+
+class EnforcedFunctionWrapper(FunctionWrapper):
+    """
+    A wrapper of enforced functions which also supports batches of calls
+
+    Batches are validated under a single lock acquisition
+    and arguments of simple (leaf) types are validated only once per their type in a batch
+    """
+
+    def map(self, iterable: typing.Iterable) -> typing.List:
+        """
+        Calls the function with every item of the iterable as a single argument
+        """
+        return self.starmap((item,) for item in iterable)
+
+    def starmap(self, iterable: typing.Iterable) -> typing.List:
+        """
+        Calls the function with every item of the iterable unpacked as positional arguments
+        Returns a list of results or raises BatchRuntimeTypeError with the index of the first failed call
+        """
+        wrapped = self.__wrapped__
+        results = []
+
+        settings = wrapped.__enforcer__.settings
+
+        # The whole batch is either validated or not
+        if get_overrides() is None:
+            bypassed = wrapped.__enforcer__.bypassed
+        else:
+            bypassed = settings is not None and not settings.enabled
+
+        if bypassed or (settings is not None and not settings.sample()):
+            return [wrapped(*args) for args in iterable]
+
+        with RunLock:
+            enforcer = wrapped.__enforcer__
+
+            if hasattr(wrapped, '__no_type_check__'):
+                return [wrapped(*args) for args in iterable]
+
+            # Only validators with TypeVars keep the state between the calls
+            stateful = bool(enforcer.validator.globals)
+
+            input_cache = set()
+            output_cache = set()
+
+            enforcer.validator.shallow = False
+            enforcer.reset()
+
+            for index, args in enumerate(iterable):
+                if stateful and index:
+                    enforcer.reset()
+
+                try:
+                    _args, _kwargs, _ = enforcer.validate_inputs(Parameters(args, {}, False), input_cache)
+                    result = wrapped(*_args, **_kwargs)
+                    results.append(enforcer.validate_outputs(result, output_cache))
+                except RuntimeTypeError as error:
+                    raise BatchRuntimeTypeError(index, results, error) from error
+
+        return results
+
+    def stats(self) -> typing.Optional[typing.Dict]:
+        """
+        Returns statistics of the warm-up of the function or None if it does not warm up
+        """
+        guard = self.__wrapped__.__enforcer__.warmup_guard
 
-    return decorator(universal)
+        return guard.stats() if guard is not None else None
 
 
 def get_wrapper_builder(configuration, excluded_fields=None):
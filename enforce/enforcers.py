@@ -5,9 +5,14 @@ from collections import namedtuple, OrderedDict
 from wrapt import ObjectProxy
 
 from .types import EnhancedTypeVar, is_type_of_type
+from .nodes import SimpleNode, ATOMIC_TYPES
 from .wrappers import Proxy, EnforceProxy
 from .exceptions import RuntimeTypeError
 from .validator import init_validator, Validator
+from .trusted import is_trusted, is_immutable, trust
+from .settings import PolicyChoices
+from .violations import VIOLATIONS
+from .warmup import WarmupGuard
 
 
 # This TypeVar is used to indicate that he result of output validation
@@ -35,7 +40,13 @@ class Enforcer:
 
         self.reference = None
 
+        # Set by the registry of wrappers while the function is disabled
+        self.bypassed = False
+
         self._callable_signature = None
+        self._positional_names = None
+        self._leaf_names = None
+        self._warmup_guard = None
 
     @property
     def callable_signature(self):
@@ -54,9 +65,54 @@ class Enforcer:
 
         return self._callable_signature
 
-    def validate_inputs(self, input_data: Parameters) -> Parameters:
+    @property
+    def positional_names(self):
+        """
+        Returns a tuple of parameter names if all the parameters of the function can be passed positionally
+        Otherwise, returns an empty tuple
+        """
+        if self._positional_names is None:
+            names = ()
+            if isinstance(self.signature, inspect.Signature):
+                parameters = self.signature.parameters.values()
+                if all(p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD) for p in parameters):
+                    names = tuple(p.name for p in parameters)
+            self._positional_names = names
+
+        return self._positional_names
+
+    @property
+    def leaf_names(self):
+        """
+        Returns a set of parameter names (including 'return') with hints which depend only on the type of data
+        Such hints do not change validated data, so their results can be cached by the data type
+        """
+        if self._leaf_names is None:
+            names = set()
+            if not self.validator.globals and self.validator.parent is None:
+                for name, root in self.validator.roots.items():
+                    if type(root) is SimpleNode and not root.original_children:
+                        names.add(name)
+            self._leaf_names = frozenset(names)
+
+        return self._leaf_names
+
+    @property
+    def warmup_guard(self):
+        """
+        Returns the warm-up guard of the function or None if it does not warm up
+        Validators with TypeVars must always see the data in order to bind their type variables
+        """
+        if self._warmup_guard is None and self.settings is not None and self.settings.warmup and self.trust_enabled:
+            self._warmup_guard = WarmupGuard(self.settings.warmup)
+
+        return self._warmup_guard
+
+    def validate_inputs(self, input_data: Parameters, type_cache: typing.Optional[set]=None) -> Parameters:
         """
         Calls a validator for each function argument
+
+        If a type cache is given, arguments of leaf type hints are validated only once per their type
         """
         if self.settings is not None and not self.settings.enabled:
             return input_data
@@ -68,39 +124,147 @@ class Enforcer:
         kwargs = input_data.kwargs
         skip = input_data.skip
 
-        binded_arguments = self.signature.bind(*args, **kwargs)
-        binded_arguments.apply_defaults()
+        # Batches and shallow validation do not take part in the warm-up
+        guard = self.warmup_guard if type_cache is None and not self.validator.shallow else None
+
+        if guard is not None and guard.enter(args, kwargs, self.settings.warmup_check_rate):
+            return input_data
+
+        positional_names = self.positional_names
 
-        for name in self.hints.keys():
-            # First, check argument types (every key not labeled 'return')
-            if name != 'return':
-                argument = binded_arguments.arguments.get(name)
-                if not self.validator.validate(argument, name):
-                    break
-                binded_arguments.arguments[name] = self.validator.data_out[name]
+        # Binding is not needed when every parameter receives a positional argument
+        if not kwargs and positional_names and len(args) == len(positional_names):
+            binded_arguments = None
+            arguments = dict(zip(positional_names, args))
         else:
-            valdated_data = Parameters(binded_arguments.args, binded_arguments.kwargs, skip)
-            return valdated_data
+            binded_arguments = self.signature.bind(*args, **kwargs)
+            binded_arguments.apply_defaults()
+            arguments = binded_arguments.arguments
+
+        trust_enabled = self.trust_enabled
+        trust_mode = self.validator.mode if trust_enabled else None
+        leaf_names = self.leaf_names if type_cache is not None else ()
+        transformed = False
+
+        try:
+            for name, hint in self.hints.items():
+                # First, check argument types (every key not labeled 'return')
+                if name != 'return':
+                    argument = arguments.get(name)
+                    if name in leaf_names:
+                        key = (name, type(argument))
+                        if key in type_cache:
+                            continue
+                    if trust_enabled and is_trusted(argument, hint, trust_mode):
+                        continue
+                    if not self.validator.validate(argument, name):
+                        break
+                    arguments[name] = self.validator.data_out[name]
+                    transformed = transformed or arguments[name] is not argument
+                    if name in leaf_names and not isinstance(argument, type):
+                        type_cache.add(key)
+            else:
+                if guard is not None:
+                    guard.validated_inputs(transformed)
+
+                if binded_arguments is None:
+                    return Parameters(tuple(arguments[name] for name in positional_names), {}, skip)
 
-        exception_text = parse_errors(self.validator.errors, self.hints)
-        raise RuntimeTypeError(exception_text)
+                valdated_data = Parameters(binded_arguments.args, binded_arguments.kwargs, skip)
+                return valdated_data
+        finally:
+            self.validator.end_pass()
 
-    def validate_outputs(self, output_data: T) -> T:
+        if guard is not None:
+            guard.fail()
+
+        self.report_violation()
+        return input_data
+
+    def validate_outputs(self, output_data: T, type_cache: typing.Optional[set]=None) -> T:
         """
         Calls a validator on a function return value
+
+        If a type cache is given, return values of a leaf type hint are validated only once per their type
         """
         if self.settings is not None and not self.settings.enabled:
             return output_data
 
+        # Batches and shallow validation do not take part in the warm-up
+        guard = self.warmup_guard if type_cache is None and not self.validator.shallow else None
+
+        if guard is not None and guard.skip_output(output_data):
+            return output_data
+
         if 'return' in self.hints.keys():
-            if not self.validator.validate(output_data, 'return'):
-                exception_text = parse_errors(self.validator.errors, self.hints, True)
-                raise RuntimeTypeError(exception_text)
+            cached = type_cache is not None and 'return' in self.leaf_names
+
+            if cached:
+                key = ('return', type(output_data))
+                if key in type_cache:
+                    return output_data
+
+            try:
+                valid = self.validator.validate(output_data, 'return')
+            finally:
+                self.validator.end_pass()
+
+            if not valid:
+                if guard is not None:
+                    guard.fail()
+
+                self.report_violation(return_type=True)
+                return output_data
             else:
-                return self.validator.data_out['return']
+                result = self.validator.data_out['return']
+
+                if guard is not None:
+                    guard.validated_output(output_data, result is not output_data)
+
+                if cached and not isinstance(output_data, type):
+                    type_cache.add(key)
+
+                # Shallowly validated values cannot be trusted, neither can values which may change later
+                if (self.trust_enabled and not self.validator.shallow and
+                        self.settings is not None and self.settings.trust_returns):
+                    if type(result) not in ATOMIC_TYPES and is_immutable(result):
+                        trust(result, self.hints['return'], mode=self.validator.mode)
+
+                return result
         else:
+            if guard is not None:
+                guard.validated_output(output_data, False)
+
             return output_data
 
+    def report_violation(self, return_type=False):
+        """
+        Raises RuntimeTypeError for the last failed validation or records it, depending on the group policy
+        """
+        policy = self.settings.policy if self.settings is not None else PolicyChoices.raise_error
+
+        if policy is PolicyChoices.raise_error:
+            exception_text = parse_errors(self.validator.errors, self.hints, return_type)
+            raise RuntimeTypeError(exception_text)
+
+        name, actual_type = self.validator.errors[-1]
+        function_name = getattr(self.reference, '__qualname__', None) or repr(self.reference)
+
+        # Functions with the same name in different modules are told apart by the module
+        module = getattr(self.reference, '__module__', None)
+        if module:
+            function_name = '{}.{}'.format(module, function_name)
+
+        VIOLATIONS.record(function_name, name, self.hints.get(name), actual_type, log=policy is PolicyChoices.log)
+
+    @property
+    def trust_enabled(self):
+        """
+        Returns if trusted values can bypass validation
+        Validators with TypeVars must always see the data in order to bind their type variables
+        """
+        return not self.generic and not self.validator.globals and self.validator.parent is None
+
     def reset(self):
         """
         Clears validator internal state
@@ -219,12 +383,14 @@ def generate_new_enforcer(func, generic, parent_root, instance_of, settings):
         if type(func) is Proxy:
             signature = inspect.signature(func.__wrapped__)
             hints = typing.get_type_hints(func.__wrapped__)
+            namespace = getattr(func.__wrapped__, '__globals__', None)
         else:
             signature = inspect.signature(func)
             hints = typing.get_type_hints(func)
+            namespace = getattr(func, '__globals__', None)
 
         bound = False
-        validator = init_validator(hints, parent_root)
+        validator = init_validator(hints, parent_root, namespace)
 
     return Enforcer(validator, signature, hints, generic, bound, settings)
 
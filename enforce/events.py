@@ -0,0 +1,653 @@
+import re
+import codecs
+import typing
+from json.decoder import scanstring
+
+from .nodes import SimpleNode, MappingNode, TypedDictNode, UnionNode, OptionalNode, ForwardRefNode
+from .settings import Settings, ExtraKeysChoices
+from .exceptions import RuntimeTypeError
+from .validator import init_validator
+from .utils import visit
+
+
+# A pseudo node for values which are collected for a deferred validation by their container
+_MATERIALIZE = object()
+
+
+class ContainerState:
+    """
+    A candidate interpretation of a container which is being received as a sequence of events
+    Every state belongs to a state of the enclosing container (its owner) or to None if it is the root
+    """
+
+    def __init__(self, owner):
+        self.owner = owner
+
+    def key(self, validator, key):
+        """
+        Returns a list of nodes for the value of the given key or None if the key is not accepted
+        """
+        return [None]
+
+    def element(self, validator, index):
+        """
+        Returns a list of nodes for the array element with the given index
+        """
+        return [None]
+
+    def accept(self, value):
+        """
+        Receives the completed value of the last key or element
+        """
+        pass
+
+    def end(self, validator):
+        """
+        Returns if the container is valid as a whole
+        """
+        return True
+
+    @property
+    def value(self):
+        return None
+
+    @property
+    def error(self):
+        return None
+
+
+class UnconstrainedState(ContainerState):
+    """
+    A container which accepts any content
+    """
+    pass
+
+
+class ArrayState(ContainerState):
+    """
+    A list with elements of the same type
+    """
+
+    def __init__(self, owner, node):
+        super().__init__(owner)
+        self.elements = [node.original_children[0]]
+
+    def element(self, validator, index):
+        return self.elements
+
+
+class MappingState(ContainerState):
+    """
+    A dictionary with keys and values of the same types
+    """
+
+    def __init__(self, owner, node):
+        super().__init__(owner)
+        self.key_node = node.original_children[0]
+        self.values = [node.original_children[1]]
+
+    def key(self, validator, key):
+        if visit(self.key_node.validate(key, validator)).valid:
+            return self.values
+        return None
+
+
+class TypedDictState(ContainerState):
+    """
+    A dictionary with a fixed schema of keys
+    """
+
+    def __init__(self, owner, node):
+        super().__init__(owner)
+        self.node = node
+        self.seen_keys = set()
+        self.missing_keys = ()
+
+    def key(self, validator, key):
+        try:
+            index = self.node.keys.index(key)
+        except ValueError:
+            if validator.settings.extra_keys is ExtraKeysChoices.forbid:
+                return None
+            return [None]
+
+        self.seen_keys.add(key)
+
+        return [self.node.children[index]]
+
+    def end(self, validator):
+        self.missing_keys = [key for key in self.node.required_keys if key not in self.seen_keys]
+        return not self.missing_keys
+
+    @property
+    def error(self):
+        if self.missing_keys:
+            return 'missing keys: ' + ', '.join(repr(key) for key in sorted(self.missing_keys))
+        return None
+
+
+class MaterializedState(ContainerState):
+    """
+    A container of a type which cannot be validated event by event
+    Its content is collected and validated as a whole once the container ends
+    """
+
+    def __init__(self, owner, node, is_map):
+        super().__init__(owner)
+        self.node = node
+        self.data = {} if is_map else []
+        self.current_key = None
+
+    def key(self, validator, key):
+        self.current_key = key
+        return [_MATERIALIZE]
+
+    def element(self, validator, index):
+        return [_MATERIALIZE]
+
+    def accept(self, value):
+        if type(self.data) is dict:
+            self.data[self.current_key] = value
+        else:
+            self.data.append(value)
+
+    def end(self, validator):
+        if self.node is None:
+            return True
+
+        try:
+            return visit(self.node.validate(self.data, validator)).valid
+        finally:
+            # The memo would otherwise keep the collected content alive until the validator is reset
+            validator.end_pass()
+
+    @property
+    def value(self):
+        return self.data
+
+
+class Frame:
+    """
+    An open container with all of its still valid interpretations
+    """
+
+    def __init__(self, is_map, states):
+        self.is_map = is_map
+        self.states = states
+        self.index = 0
+        self.key = None
+        self.slot = []
+
+
+class EventValidator:
+    """
+    Validates a document against a type hint while it is received as a sequence of parsing events:
+    start_map, key, start_array, scalar and end (of the last started container)
+
+    Every open container keeps all of its interpretations which are still possible (e.g. branches of Unions)
+    RuntimeTypeError is raised by the first event which makes the document invalid
+    Types which cannot be validated event by event (e.g. Tuples or Callables) are collected and validated when they end
+    """
+
+    def __init__(self, hint: typing.Any, namespace: typing.Optional[typing.Dict]=None):
+        self.hint = hint
+        self.validator = init_validator({'document': hint}, namespace=namespace)
+        self.validator.settings = Settings(enabled=True)
+        self.root = self.validator.roots['document']
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Prepares the validator for a new document
+        """
+        self.validator.reset()
+        self.frames = []
+        self.complete = False
+
+    def start_map(self) -> None:
+        self.start_container(True)
+
+    def start_array(self) -> None:
+        self.start_container(False)
+
+    def key(self, name: str) -> None:
+        frame = self.frames[-1] if self.frames else None
+
+        if frame is None or not frame.is_map or frame.slot:
+            raise ValueError('A key can be received only directly in a map')
+
+        frame.key = name
+        states = []
+        slot = []
+
+        for state in frame.states:
+            nodes = state.key(self.validator, name)
+            if nodes is not None:
+                states.append(state)
+                slot.extend((state, node) for node in nodes)
+
+        frame.states = states
+        frame.slot = slot
+
+        if not states:
+            self.fail('unexpected key ' + repr(name))
+
+    def scalar(self, value: typing.Any) -> None:
+        survivors = []
+
+        for owner, node in self.take_slot():
+            if node is None or node is _MATERIALIZE or visit(node.validate(value, self.validator)).valid:
+                survivors.append((owner, value))
+
+        self.complete_value(survivors, type(value).__name__)
+
+    def end(self) -> None:
+        if not self.frames:
+            raise ValueError('There is no container to end')
+
+        frame = self.frames.pop()
+        survivors = []
+        errors = []
+
+        for state in frame.states:
+            if state.end(self.validator):
+                survivors.append((state.owner, state.value))
+            elif state.error is not None:
+                errors.append(state.error)
+
+        actual_type = errors[0] if errors else ('dict' if frame.is_map else 'list')
+
+        self.complete_value(survivors, actual_type)
+
+    def feed(self, events: typing.Iterable[typing.Tuple[str, typing.Any]]) -> None:
+        """
+        Passes a sequence of (event, value) pairs to the respective methods
+        Both 'end_map' and 'end_array' events end the last container
+        """
+        for event, value in events:
+            if event == 'scalar':
+                self.scalar(value)
+            elif event == 'key':
+                self.key(value)
+            elif event == 'start_map':
+                self.start_map()
+            elif event == 'start_array':
+                self.start_array()
+            elif event in ('end', 'end_map', 'end_array'):
+                self.end()
+            else:
+                raise ValueError('Unknown event \'{}\''.format(event))
+
+    def close(self) -> bool:
+        """
+        Verifies that the whole document was received
+        """
+        if not self.complete:
+            raise ValueError('Document is incomplete')
+
+        return True
+
+    def start_container(self, is_map):
+        states = []
+
+        for owner, node in self.take_slot():
+            if node is None:
+                states.append(UnconstrainedState(owner))
+            elif node is _MATERIALIZE:
+                states.append(MaterializedState(owner, None, is_map))
+            else:
+                for concrete_node in expand_node(node, self.validator):
+                    state = self.get_container_state(owner, concrete_node, is_map)
+                    if state is not None:
+                        states.append(state)
+
+        if not states:
+            self.complete_value([], 'dict' if is_map else 'list')
+
+        self.frames.append(Frame(is_map, states))
+
+    def get_container_state(self, owner, node, is_map):
+        """
+        Returns a state of a container for the given node or None if the node does not accept such containers
+        """
+        node_type = type(node)
+        validator = self.validator
+
+        if node_type is SimpleNode:
+            if not node.validate_data(validator, {} if is_map else []).valid:
+                return None
+            if node.original_children:
+                return None if is_map else ArrayState(owner, node)
+            return UnconstrainedState(owner)
+
+        if node_type is MappingNode:
+            if not is_map or not node.validate_data(validator, {}).valid:
+                return None
+            return MappingState(owner, node)
+
+        if node_type is TypedDictNode:
+            if not is_map:
+                return None
+            return TypedDictState(owner, node)
+
+        return MaterializedState(owner, node, is_map)
+
+    def take_slot(self):
+        """
+        Returns (owner state, node) pairs expected for the next value
+        """
+        if self.complete:
+            raise ValueError('Document is already complete')
+
+        if not self.frames:
+            return [(None, self.root)]
+
+        frame = self.frames[-1]
+
+        if frame.is_map:
+            if not frame.slot:
+                raise ValueError('A value in a map must follow its key')
+            slot = frame.slot
+            frame.slot = []
+            return slot
+
+        slot = []
+        for state in frame.states:
+            slot.extend((state, node) for node in state.element(self.validator, frame.index))
+
+        return slot
+
+    def complete_value(self, survivors, actual_type):
+        """
+        Passes the completed value to all of its owners, dropping the owners for which the value was invalid
+        """
+        if not self.frames:
+            if not survivors:
+                self.fail(actual_type)
+            self.complete = True
+            return
+
+        frame = self.frames[-1]
+        owners = set()
+
+        for owner, value in survivors:
+            if id(owner) not in owners:
+                owners.add(id(owner))
+                owner.accept(value)
+
+        frame.states = [state for state in frame.states if id(state) in owners]
+
+        if not frame.states:
+            self.fail(actual_type)
+
+        if not frame.is_map:
+            frame.index += 1
+
+    def fail(self, actual_type):
+        """
+        Raises an exception for the current position in the document
+        """
+        path = '$'
+        for frame in self.frames:
+            if frame.is_map:
+                path += '[' + repr(frame.key) + ']'
+            else:
+                path += '[' + str(frame.index) + ']'
+
+        error_message = "       Document was not of type {0}. The first invalid value was at {1} ({2})."
+        output = "\n  The following runtime type errors were encountered:"
+        output += '\n' + error_message.format(self.hint, path, actual_type)
+
+        raise RuntimeTypeError(output)
+
+
+def expand_node(node, validator, seen=None):
+    """
+    Returns a list of nodes which are alternatives for the given choice node (Unions, Optionals and forward references)
+    """
+    node_type = type(node)
+
+    if node_type not in (UnionNode, OptionalNode, ForwardRefNode):
+        return [node]
+
+    if seen is None:
+        seen = set()
+
+    if id(node) in seen:
+        return []
+
+    seen.add(id(node))
+
+    if node_type is ForwardRefNode:
+        if node.target is None:
+            node.target = validator.resolve_forward_ref(node.expected_data_type)
+        children = [node.target]
+    else:
+        children = node.children
+
+    nodes = []
+    for child in children:
+        nodes.extend(expand_node(child, validator, seen))
+
+    return nodes
+
+
+class JSONTokenizer:
+    """
+    An incremental JSON tokenizer
+    Text can be fed in arbitrary chunks and the events are returned as soon as their tokens are complete
+    """
+
+    NUMBER = re.compile(r'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?')
+    NUMBER_CHARACTERS = re.compile(r'[-+.eE0-9]*')
+    STRING_END = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+    WHITESPACE = re.compile(r'[ \t\n\r]*')
+    LITERALS = (('true', True), ('false', False), ('null', None))
+
+    def __init__(self):
+        self.buffer = ''
+        self.position = 0
+        self.offset = 0
+        self.stack = []
+        self.expected = 'value'
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+
+    def feed(self, text: typing.Union[str, bytes]) -> typing.List[typing.Tuple[str, typing.Any]]:
+        """
+        Adds a chunk of text (or UTF-8 encoded bytes) and returns all the events which became complete
+        """
+        if isinstance(text, bytes):
+            text = self.decoder.decode(text)
+
+        self.offset += self.position
+        self.buffer = self.buffer[self.position:] + text
+        self.position = 0
+
+        return self.tokenize(final=False)
+
+    def close(self) -> typing.List[typing.Tuple[str, typing.Any]]:
+        """
+        Returns the remaining events, verifying that the document is complete
+        """
+        events = self.tokenize(final=True)
+
+        if self.expected != 'done':
+            self.error('Unexpected end of data')
+
+        return events
+
+    def tokenize(self, final):
+        events = []
+        buffer = self.buffer
+        length = len(buffer)
+
+        while True:
+            position = self.WHITESPACE.match(buffer, self.position).end()
+            self.position = position
+
+            if position == length:
+                break
+
+            character = buffer[position]
+            expected = self.expected
+
+            if expected == 'done':
+                self.error('Extra data')
+
+            elif expected in ('value', 'value_or_end'):
+                if character == ']' and expected == 'value_or_end':
+                    self.end_container(events, '[')
+                elif character == '{':
+                    self.stack.append('{')
+                    events.append(('start_map', None))
+                    self.position += 1
+                    self.expected = 'key_or_end'
+                elif character == '[':
+                    self.stack.append('[')
+                    events.append(('start_array', None))
+                    self.position += 1
+                    self.expected = 'value_or_end'
+                elif character == '"':
+                    value = self.read_string(final)
+                    if value is None:
+                        break
+                    events.append(('scalar', value[0]))
+                    self.end_value()
+                elif character == '-' or '0' <= character <= '9':
+                    value = self.read_number(final)
+                    if value is None:
+                        break
+                    events.append(('scalar', value[0]))
+                    self.end_value()
+                else:
+                    value = self.read_literal(final)
+                    if value is None:
+                        break
+                    events.append(('scalar', value[0]))
+                    self.end_value()
+
+            elif expected in ('key', 'key_or_end'):
+                if character == '}' and expected == 'key_or_end':
+                    self.end_container(events, '{')
+                elif character == '"':
+                    value = self.read_string(final)
+                    if value is None:
+                        break
+                    events.append(('key', value[0]))
+                    self.expected = 'colon'
+                else:
+                    self.error('Expecting property name enclosed in double quotes')
+
+            elif expected == 'colon':
+                if character != ':':
+                    self.error('Expecting \':\' delimiter')
+                self.position += 1
+                self.expected = 'value'
+
+            else:
+                if character == ',':
+                    self.position += 1
+                    self.expected = 'key' if self.stack[-1] == '{' else 'value'
+                elif character in '}]':
+                    self.end_container(events, '{' if character == '}' else '[')
+                else:
+                    self.error('Expecting \',\' delimiter')
+
+        return events
+
+    def read_string(self, final):
+        """
+        Returns a tuple with the string starting at the current position or None if more data is needed
+        """
+        match = self.STRING_END.match(self.buffer, self.position + 1)
+
+        if match is None:
+            if final:
+                self.error('Unterminated string')
+            return None
+
+        try:
+            value, self.position = scanstring(self.buffer, self.position + 1, True)
+        except ValueError as error:
+            self.error(str(error))
+
+        return (value,)
+
+    def read_number(self, final):
+        """
+        Returns a tuple with the number starting at the current position or None if more data is needed
+        """
+        candidate_end = self.NUMBER_CHARACTERS.match(self.buffer, self.position).end()
+
+        if candidate_end == len(self.buffer) and not final:
+            return None
+
+        match = self.NUMBER.match(self.buffer, self.position)
+
+        if match is None or match.end() != candidate_end:
+            self.error('Invalid number')
+
+        text = match.group()
+        self.position = match.end()
+
+        if '.' in text or 'e' in text or 'E' in text:
+            return (float(text),)
+
+        return (int(text),)
+
+    def read_literal(self, final):
+        """
+        Returns a tuple with true, false or null value at the current position or None if more data is needed
+        """
+        rest = self.buffer[self.position:self.position + 5]
+
+        for name, value in self.LITERALS:
+            if rest.startswith(name):
+                self.position += len(name)
+                return (value,)
+
+            if name.startswith(rest) and not final:
+                return None
+
+        self.error('Expecting value')
+
+    def end_container(self, events, opening):
+        if not self.stack or self.stack[-1] != opening:
+            self.error('Unexpected closing bracket')
+
+        self.stack.pop()
+        self.position += 1
+        events.append(('end_map' if opening == '{' else 'end_array', None))
+        self.end_value()
+
+    def end_value(self):
+        self.expected = 'comma_or_end' if self.stack else 'done'
+
+    def error(self, message):
+        raise ValueError('{} at position {}'.format(message, self.offset + self.position))
+
+
+def iter_json_events(chunks: typing.Iterable[typing.Union[str, bytes]]) -> typing.Iterator[typing.Tuple[str, typing.Any]]:
+    """
+    Returns a generator of parsing events for a JSON document received in chunks
+    """
+    tokenizer = JSONTokenizer()
+
+    for chunk in chunks:
+        for event in tokenizer.feed(chunk):
+            yield event
+
+    for event in tokenizer.close():
+        yield event
+
+
+def validate_json(chunks: typing.Iterable[typing.Union[str, bytes]],
+                  hint: typing.Any,
+                  namespace: typing.Optional[typing.Dict]=None) -> bool:
+    """
+    Validates a JSON document received in chunks against the type hint without building the document
+    Raises RuntimeTypeError as soon as an invalid value is found
+    """
+    event_validator = EventValidator(hint, namespace)
+    event_validator.feed(iter_json_events(chunks))
+    return event_validator.close()
@@ -1,2 +1,13 @@
 class RuntimeTypeError(Exception):
     pass
+
+
+class BatchRuntimeTypeError(RuntimeTypeError):
+    """
+    Raised when one of the calls in a batch of calls of an enforced function fails
+    It keeps the index of the failed call and the results of all the previous calls
+    """
+    def __init__(self, index, results, error):
+        super().__init__('\n  Call {} of the batch failed:'.format(index) + str(error))
+        self.index = index
+        self.results = results
@@ -0,0 +1,192 @@
+import enum
+import time
+import logging
+import threading
+
+from .settings import Settings
+
+
+logger = logging.getLogger('enforce')
+
+
+class GovernorLevel(enum.Enum):
+    """
+    All possible depths of validation of a governed group, from the most to the least expensive
+    """
+    full = 0
+    sampled = 1
+    shallow = 2
+    off = 3
+
+
+class GroupGovernor:
+    """
+    Measures the validation overhead of a group and adapts its validation level to the group budget
+
+    The overhead is the fraction of time spent validating out of the total time of calls (validation included)
+    At the end of every window, the level steps down if the overhead is over the budget
+    and steps up if it is under the budget multiplied by the recovery factor
+    From the sampled level, the overhead of full validation is projected from the validated calls
+    """
+
+    def __init__(self, group, budget):
+        self.group = group
+        self.budget = budget
+        self.level = GovernorLevel.full
+        self.settings = Settings()
+        self.lock = threading.Lock()
+
+        self.window_start = time.perf_counter()
+        self.calls = 0
+        self.validated = 0
+        self.validation_time = 0.0
+        self.call_time = 0.0
+
+        self.overhead = 0.0
+        self.transitions = 0
+        self.functions = {}
+
+    def record(self, function, validation_time, call_time, validated=True):
+        """
+        Adds the times of a single call, evaluating the level once per window
+        Level changes are reported after the lock is released, so that the sink can use the governor
+        """
+        # Options are read from the snapshot of the current settings epoch
+        options = self.settings.governor_options
+        transition = None
+
+        with self.lock:
+            self.calls += 1
+            self.validation_time += validation_time
+            self.call_time += call_time
+
+            if validated:
+                self.validated += 1
+
+            try:
+                totals = self.functions[function]
+            except KeyError:
+                totals = self.functions[function] = [0, 0.0, 0.0]
+
+            totals[0] += 1
+            totals[1] += validation_time
+            totals[2] += call_time
+
+            now = time.perf_counter()
+
+            if now - self.window_start >= options['window']:
+                transition = self.evaluate(options)
+                self.start_window(now)
+
+        if transition is not None:
+            self.report(transition, options)
+
+    def evaluate(self, options):
+        """
+        Updates the overhead of the window and returns the level transition or None if the level stays
+        """
+        total_time = self.validation_time + self.call_time
+        self.overhead = self.validation_time / total_time if total_time > 0 else 0.0
+
+        if self.overhead > self.budget:
+            if self.level is not GovernorLevel.off:
+                return self.change_level(GovernorLevel(self.level.value + 1))
+            return None
+
+        if self.level is GovernorLevel.full:
+            return None
+
+        overhead = self.overhead
+
+        if self.level is GovernorLevel.sampled and self.validated:
+            projected_time = self.validation_time * self.calls / self.validated
+            overhead = projected_time / (projected_time + self.call_time)
+
+        if overhead <= self.budget * options['recovery']:
+            return self.change_level(GovernorLevel(self.level.value - 1))
+
+        return None
+
+    def change_level(self, level):
+        previous, self.level = self.level, level
+        self.transitions += 1
+
+        return previous, level, self.overhead
+
+    def report(self, transition, options):
+        previous, level, overhead = transition
+
+        if options['sink'] is not None:
+            options['sink'](self.group, previous, level, overhead)
+        else:
+            logger.info('Validation of group %s changed from %s to %s at overhead %.4f',
+                        self.group, previous.name, level.name, overhead)
+
+    def start_window(self, now):
+        self.window_start = now
+        self.calls = 0
+        self.validated = 0
+        self.validation_time = 0.0
+        self.call_time = 0.0
+
+    def stats(self):
+        """
+        Returns the current level, the overhead of the last window and the total times of every function
+        """
+        with self.lock:
+            return {
+                'level': self.level.name,
+                'budget': self.budget,
+                'overhead': self.overhead,
+                'transitions': self.transitions,
+                'functions': {name: {'calls': calls, 'validation_time': validation_time, 'call_time': call_time}
+                              for name, (calls, validation_time, call_time) in self.functions.items()}
+            }
+
+
+class Governor:
+    """
+    Keeps governors of all groups with a budget
+    """
+
+    def __init__(self):
+        self.groups = {}
+        self.lock = threading.Lock()
+
+    def get(self, settings):
+        """
+        Returns the governor of the group of the settings or None if the group has no budget
+        A governor starts over at the full level whenever the budget of its group changes
+        """
+        budget = settings.budget
+
+        if budget is None:
+            return None
+
+        governor = self.groups.get(settings.group)
+
+        if governor is None or governor.budget != budget:
+            with self.lock:
+                governor = self.groups.get(settings.group)
+
+                if governor is None or governor.budget != budget:
+                    governor = GroupGovernor(settings.group, budget)
+                    self.groups[settings.group] = governor
+
+        return governor
+
+    def stats(self):
+        """
+        Returns statistics of all the governed groups
+        """
+        return {group: governor.stats() for group, governor in list(self.groups.items())}
+
+    def reset(self):
+        """
+        Drops all the measurements and levels
+        """
+        with self.lock:
+            self.groups = {}
+
+
+GOVERNOR = Governor()
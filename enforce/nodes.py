@@ -1,9 +1,12 @@
+import sys
 import typing
 import inspect
+from itertools import islice
 
 from .wrappers import EnforceProxy
-from .types import is_type_of_type, is_named_tuple
+from .types import is_type_of_type, is_named_tuple, TypeChecks
 from .exceptions import RuntimeTypeError
+from .utils import IdentityTable, sample_items
 
 
 TYPE_NAME_ALIASES = {
@@ -18,11 +21,71 @@ TYPE_NAME_ALIASES = {
 }
 
 
+# Types of data which is never worth memoizing as it cannot contain other data
+ATOMIC_TYPES = frozenset([int, float, complex, bool, str, bytes, type(None)])
+
+
 ValidationResult = typing.NamedTuple('ValidationResult', [('valid', bool), ('data', typing.Any), ('type_name', str)])
 
 
+# The state of an append-only container after its last successful validation
+# Samples are the items (or key-value pairs) which are compared by identity in order to detect changes
+IncrementalState = typing.NamedTuple('IncrementalState', [('length', int), ('mode', typing.Any), ('samples', tuple)])
+
+
+class BranchStatistics:
+    """
+    Counts how often each branch of a choice node matches
+    and periodically reorders branches, so that the most frequently matching branch is tried first
+
+    Ties preserve the declaration order, so the order depends only on the sequence of matches
+    """
+
+    REORDER_PERIOD = 256
+
+    def __init__(self, reorder_period=None):
+        self.reorder_period = reorder_period or self.REORDER_PERIOD
+        self.hits = {}
+        self.order = []
+        self.matches_since_reorder = 0
+
+    def add_branch(self, branch):
+        """
+        Registers a new branch at the end of the current order
+        """
+        self.hits[branch] = 0
+        self.order.append(branch)
+
+    def record(self, branch):
+        """
+        Counts a match of the branch, reordering branches once every reorder period
+        """
+        self.hits[branch] += 1
+        self.matches_since_reorder += 1
+
+        if self.matches_since_reorder >= self.reorder_period:
+            self.reorder()
+
+    def reorder(self):
+        """
+        Sorts branches by the number of matches in descending order
+        A new list is created, so any iteration over the previous order is not affected
+        """
+        self.matches_since_reorder = 0
+        self.order = sorted(self.hits, key=lambda branch: (-self.hits[branch], branch))
+
+
 class BaseNode:
 
+    # Types of containers which can be validated incrementally by this node
+    incremental_types = ()
+
+    # Maximum number of items sampled in order to detect changes of an append-only container
+    INCREMENTAL_SAMPLES = 16
+
+    # Maximum number of append-only containers tracked by a single node
+    INCREMENTAL_CONTAINERS = 64
+
     def __init__(self, expected_data_type, is_sequence, is_container=False, type_var=False, covariant=None, contravariant=None):
         # is_sequence specifies if it is a sequence node
         # If it is not, then it must be a choice node, i.e. every children is a potential alternative
@@ -45,9 +108,119 @@ class BaseNode:
         self.original_children = []
         self.children = []
 
+        # Incremental validation state of append-only containers, it is kept across validation passes
+        self.increments = None
+
+        # Type hints of the items of containers which can be validated in parallel
+        # and if it is safe to do so on threads (False) and on processes (True)
+        self.item_hints = None
+        self.parallel_safe = {}
+
     def validate(self, data, validator, force=False):
         """
         Triggers all the stages of data validation, returning true or false as a result
+        Nodes with children validate the same non-atomic object only once per validation pass
+        """
+        if self.original_children and type(data) not in ATOMIC_TYPES:
+            return self.validate_memoized(data, validator, force)
+
+        return self.validate_stages(data, validator, force)
+
+    def validate_memoized(self, data, validator, force=False):
+        """
+        Validates data only if it was not yet validated by this node during the current validation pass
+        Data is kept in the memo together with its result, so that its identity cannot be reused
+        """
+        key = (id(data), id(self))
+        memo = validator.memo
+
+        try:
+            _, validation_result = memo[key]
+        except KeyError:
+            pass
+        else:
+            if validation_result is None:
+                # The data is still being validated by this node further up, i.e. the data is cyclic
+                # It is considered valid here, as the outer validation decides the final result
+                yield ValidationResult(True, data, extract_type_name(data))
+            else:
+                if validation_result.valid:
+                    self.set_out_data(validator, data, validation_result.data)
+                yield validation_result
+            return
+
+        memo[key] = (data, None)
+
+        if type(data) in self.incremental_types and validator.incremental and not validator.shallow:
+            validation_result = yield self.validate_increment(data, validator, force)
+        else:
+            validation_result = yield self.validate_stages(data, validator, force)
+
+        memo[key] = (data, validation_result)
+
+        yield validation_result
+
+    def validate_increment(self, data, validator, force=False):
+        """
+        Validates only the items appended to the container since its last successful validation
+
+        The previously validated part is assumed unchanged if the container did not shrink
+        and its sampled items are still the same objects
+        Otherwise, or if any appended item is invalid, the whole container is validated again
+        """
+        if self.increments is None:
+            self.increments = IdentityTable(max_size=self.INCREMENTAL_CONTAINERS)
+
+        mode = validator.mode
+        state = self.increments.get(data)
+
+        if state is not None and state.mode is mode and len(data) >= state.length:
+            samples = self.sample_items(data, state.length)
+
+            if len(samples) == len(state.samples) and all(a is b for a, b in zip(samples, state.samples)):
+                child_validation_results = yield self.validate_appended_items(validator, data, state.length)
+
+                if all(result.valid for result in child_validation_results):
+                    self_validation_result = ValidationResult(True, data, extract_type_name(data))
+                    actual_type = self.get_actual_data_type(self_validation_result, child_validation_results, True)
+
+                    self.increments.set(data, IncrementalState(len(data), mode, self.sample_items(data, len(data))))
+                    self.set_out_data(validator, data, data)
+
+                    yield ValidationResult(True, data, actual_type)
+                    return
+
+        self.increments.pop(data)
+
+        validation_result = yield self.validate_stages(data, validator, force)
+
+        # Containers with transformed items (e.g. wrapped callables) must always be validated in full
+        if validation_result.valid and self.is_unchanged(data, validation_result.data):
+            self.increments.set(data, IncrementalState(len(data), mode, self.sample_items(data, len(data))))
+
+        yield validation_result
+
+    def validate_appended_items(self, validator, data, offset):
+        """
+        Validates the items of the container starting from the given offset, stopping at the first invalid one
+        """
+        yield []
+
+    def sample_items(self, data, length):
+        """
+        Returns a tuple of items from the first 'length' items of the container used to detect its changes
+        """
+        return ()
+
+    def is_unchanged(self, data, data_out):
+        """
+        Returns if the validated data is the same as the incoming data
+        """
+        return data_out is data
+
+    def validate_stages(self, data, validator, force=False):
+        """
+        Runs all the stages of data validation
         """
         # Validation steps:
         # 1. Pre-process (clean) incoming data
@@ -71,6 +244,13 @@ class BaseNode:
             yield self_validation_result
             return
 
+        # Shallow validation checks only the type of homogeneous containers, not their items
+        if self.item_hints is not None and validator.shallow and self_validation_result.valid:
+            type_name = self_validation_result.type_name
+            self.set_out_data(validator, data, clean_data)
+            yield ValidationResult(True, clean_data, TYPE_NAME_ALIASES.get(type_name, type_name))
+            return
+
         propagated_data = self.map_data(validator, self_validation_result)
 
         # 4
@@ -111,15 +291,19 @@ class BaseNode:
         # Note, if len(self.children) changes during iteration, errors *will* occur
         children_validation_results = []
 
-        number_of_children = len(self.children)
+        # The same node can be reached again while validating nested data (recursive types)
+        # and children can be replaced in the process, so the current list is kept locally
+        children = self.children
 
-        if len(propagated_data) < len(self.children):
+        number_of_children = len(children)
+
+        if len(propagated_data) < len(children):
             for i, data in enumerate(propagated_data):
-                validation_result = yield self.children[i].validate(data, validator, self.is_type_var)
+                validation_result = yield children[i].validate(data, validator, self.is_type_var)
                 children_validation_results.append(validation_result)
-        elif len(propagated_data) > len(self.children):
-            number_of_extra_elements = len(propagated_data) - len(self.children)
-            for i, child in enumerate(self.children):
+        elif len(propagated_data) > len(children):
+            number_of_extra_elements = len(propagated_data) - len(children)
+            for i, child in enumerate(children):
                 validation_result = yield child.validate(propagated_data[i], validator, self.is_type_var)
                 children_validation_results.append(validation_result)
             if self.bound or not self.expected_data_type is typing.Any:
@@ -127,7 +311,7 @@ class BaseNode:
                     data = propagated_data[number_of_children + i]
                     children_validation_results.append(ValidationResult(False, data, extract_type_name(data)))
         else:
-            for i, child in enumerate(self.children):
+            for i, child in enumerate(children):
                 validation_result = yield child.validate(propagated_data[i], validator, self.is_type_var)
                 children_validation_results.append(validation_result)
         
@@ -214,25 +398,26 @@ class BaseNode:
 
 class SimpleNode(BaseNode):
 
+    incremental_types = (list,)
+
     def __init__(self, expected_data_type, **kwargs):
         super().__init__(expected_data_type, is_sequence=True, type_var=False, **kwargs)
+        self.type_checks = TypeChecks(expected_data_type)
 
     def validate_data(self, validator, data, sticky=False):
-        if self.bound:
-            expected_data_type = self.in_type
-        else:
-            expected_data_type = self.expected_data_type
-
         # TODO: Is everything we are interested in converting to type, is an instance of Type?
         if not isinstance(data, type):
             input_type = type(data)
         else:
             input_type = data
 
-        covariant = self.covariant or validator.settings.covariant
-        contravariant = self.contravariant or validator.settings.contravariant
+        covariant = self.covariant or validator.covariant
+        contravariant = self.contravariant or validator.contravariant
 
-        result = is_type_of_type(input_type, expected_data_type, covariant=covariant, contravariant=contravariant)
+        if self.bound:
+            result = is_type_of_type(input_type, self.in_type, covariant=covariant, contravariant=contravariant)
+        else:
+            result = self.type_checks.check(input_type, covariant, contravariant)
 
         type_name = input_type.__name__
 
@@ -254,6 +439,236 @@ class SimpleNode(BaseNode):
             self.children = len(data) * self.original_children
         return propagated_data
 
+    def validate_children(self, validator, propagated_data):
+        from .parallel import should_validate_in_parallel, validate_in_parallel
+
+        if not should_validate_in_parallel(self, validator, propagated_data):
+            children_validation_results = yield super().validate_children(validator, propagated_data)
+            yield children_validation_results
+            return
+
+        type_names, invalid_index = validate_in_parallel(self, validator, propagated_data)
+
+        children_validation_results = [ValidationResult(True, None, type_name) for type_name in type_names]
+
+        if invalid_index is not None:
+            data = propagated_data[invalid_index]
+            validation_result = yield self.original_children[0].validate(data, validator, self.is_type_var)
+            children_validation_results.append(validation_result)
+
+        yield children_validation_results
+
+    def validate_appended_items(self, validator, data, offset):
+        child = self.original_children[0]
+        children_validation_results = []
+
+        for item in islice(data, offset, None):
+            validation_result = yield child.validate(item, validator, self.is_type_var)
+            children_validation_results.append(validation_result)
+            if not validation_result.valid:
+                break
+
+        yield children_validation_results
+
+    def sample_items(self, data, length):
+        return sample_items(data, length, self.INCREMENTAL_SAMPLES)
+
+    def validate_column(self, validator, column):
+        """
+        Validates a sequence of values against this node as a whole
+        Every distinct type is checked only once, so only leaf nodes (without children) can be validated this way
+        Returns the indices of invalid values
+        """
+        column_types = set(map(type, column))
+
+        if any(issubclass(column_type, type) for column_type in column_types):
+            # Types are validated as themselves rather than as instances of their metaclass
+            return [i for i, data in enumerate(column) if not self.validate_data(validator, data).valid]
+
+        verdicts = {column_type: self.validate_data(validator, column_type).valid for column_type in column_types}
+
+        if all(verdicts.values()):
+            return []
+
+        return [i for i, data in enumerate(column) if not verdicts[type(data)]]
+
+
+def is_column_leaf(node):
+    """
+    Returns if the node can validate a whole column of values at once (see validate_column)
+    """
+    node_type = type(node)
+
+    if node_type in (SimpleNode, EnumNode):
+        return not node.original_children and not node.bound
+
+    if node_type is LiteralNode:
+        return True
+
+    if node_type is OptionalNode:
+        return is_column_leaf(node.original_children[0])
+
+    return False
+
+
+class NamedTupleListNode(SimpleNode):
+    """
+    Validates lists of typed NamedTuples column by column rather than row by row
+
+    Classes of all rows are verified in a single pass first, then every field is validated as a column
+    Failures are reported as (row, field) pairs, only the first of them are included in the error message
+    """
+
+    incremental_types = ()
+
+    # Maximum number of failures included in the error message
+    REPORTED_FAILURES = 10
+
+    def __init__(self, expected_data_type, record_type, **kwargs):
+        super().__init__(expected_data_type, **kwargs)
+        self.record_type = record_type
+        self.field_indices = {field: i for i, field in enumerate(record_type._fields)}
+        self.failures = []
+
+    def map_data(self, validator, self_validation_result):
+        data = self_validation_result.data
+        if isinstance(data, list):
+            return data
+        return []
+
+    def validate_children(self, validator, propagated_data):
+        record_type = self.record_type
+        fields = record_type._fields
+        children = self.children
+
+        failures = []
+        verdicts = {record_type: True}
+        valid_rows = []
+
+        for row_index, row in enumerate(propagated_data):
+            row_type = type(row)
+            try:
+                is_record = verdicts[row_type]
+            except KeyError:
+                is_record = verdicts[row_type] = self.is_record_type(row_type)
+
+            if is_record:
+                valid_rows.append(row_index)
+            else:
+                failures.append((row_index, None))
+
+        if len(valid_rows) == len(propagated_data):
+            rows = propagated_data
+        else:
+            rows = [propagated_data[i] for i in valid_rows]
+
+        columns = list(zip(*rows)) if rows else [() for _ in fields]
+
+        for field_index, field in enumerate(fields):
+            child = children[field_index]
+            column = columns[field_index]
+
+            if is_column_leaf(child):
+                invalid_indices = child.validate_column(validator, column)
+            else:
+                invalid_indices = []
+                for i, data in enumerate(column):
+                    validation_result = yield child.validate(data, validator, self.is_type_var)
+                    if not validation_result.valid:
+                        invalid_indices.append(i)
+
+            failures.extend((valid_rows[i], field) for i in invalid_indices)
+
+        field_indices = self.field_indices
+        failures.sort(key=lambda failure: (failure[0], -1 if failure[1] is None else field_indices[failure[1]]))
+        self.failures = failures
+
+        type_name = record_type.__name__
+        if failures:
+            reported = failures[:self.REPORTED_FAILURES]
+            type_name += ' with invalid fields (row, field): ' + ', '.join(str(failure) for failure in reported)
+            if len(failures) > len(reported):
+                type_name += ' and {} more'.format(len(failures) - len(reported))
+
+        yield [ValidationResult(valid=not failures, data=propagated_data, type_name=type_name)]
+
+    def is_record_type(self, row_type):
+        """
+        Returns if the given class can be used in place of the expected NamedTuple class
+        As with NamedTupleNode, typed NamedTuples with the same name and fields are accepted
+        """
+        if row_type is self.record_type:
+            return True
+
+        return (is_named_tuple(row_type) and
+                hasattr(row_type, '_field_types') and
+                row_type.__name__ == self.record_type.__name__ and
+                row_type._fields == self.record_type._fields)
+
+    def reset(self):
+        super().reset()
+        self.failures = []
+
+
+class EnumNode(SimpleNode):
+    """
+    A node for Enum types
+    Members of the expected Enum are accepted by a single identity check of their type,
+    any other data goes through the usual type checking
+    """
+
+    def validate_data(self, validator, data, sticky=False):
+        if type(data) is self.expected_data_type:
+            return ValidationResult(valid=True, data=data, type_name=self.expected_data_type.__name__)
+
+        return super().validate_data(validator, data, sticky)
+
+
+class LiteralNode(BaseNode):
+    """
+    A node for Literal types
+    Data is valid if it is one of the allowed values, which is checked by a single lookup in a precomputed set
+    Values are stored together with their types, so that 1, 1.0 and True are not interchangeable
+    """
+
+    def __init__(self, expected_data_type, values, **kwargs):
+        super().__init__(expected_data_type, is_sequence=True, **kwargs)
+        self.values = frozenset((type(value), value) for value in values)
+        self.value_types = frozenset(type(value) for value in values)
+
+    def validate_data(self, validator, data, sticky=False):
+        data_type = type(data)
+
+        try:
+            valid = (data_type, data) in self.values
+        except TypeError:
+            valid = False
+
+        if valid or data_type not in self.value_types:
+            type_name = extract_type_name(data)
+        else:
+            type_name = 'Literal[' + repr(data) + ']'
+
+        return ValidationResult(valid=valid, data=data, type_name=type_name)
+
+    def validate_column(self, validator, column):
+        """
+        Returns the indices of values of the column which are not allowed
+        """
+        values = self.values
+        invalid_indices = []
+
+        for i, data in enumerate(column):
+            try:
+                valid = (type(data), data) in values
+            except TypeError:
+                valid = False
+
+            if not valid:
+                invalid_indices.append(i)
+
+        return invalid_indices
+
 
 class UnionNode(BaseNode):
     """
@@ -261,8 +676,17 @@ class UnionNode(BaseNode):
     It is also used with type variables
     """
 
+    # Maximum number of runtime types remembered by the dispatch index per mode, the rest is dispatched every time
+    DISPATCH_INDEX_SIZE = 1024
+
     def __init__(self, **kwargs):
         super().__init__(typing.Any, is_sequence=False, is_container=True, **kwargs)
+        # Branches which can be resolved by the type of data alone and all the others (ambiguous)
+        # Ambiguous branches are tried in the order of their match frequency
+        self.leaf_branches = []
+        self.branch_statistics = BranchStatistics()
+        # Maps the variance mode to a dictionary of runtime types and indices of leaf branches they match
+        self.dispatch_index = {}
 
     def validate_data(self, validator, data, sticky=False):
         return ValidationResult(valid=True, data=data, type_name=extract_type_name(data))
@@ -270,6 +694,84 @@ class UnionNode(BaseNode):
     def map_data(self, validator, self_validation_result):
         return [self_validation_result.data for _ in self.children]
 
+    def validate_children(self, validator, propagated_data):
+        """
+        Jumps straight to the first leaf branch matching the type of data
+        Only if there is no such branch, ambiguous branches are tried one by one till the first match
+        """
+        children = self.children
+        data = propagated_data[0]
+
+        matching_leaves = self.get_matching_leaves(validator, data)
+
+        if matching_leaves:
+            validation_result = yield children[matching_leaves[0]].validate(data, validator, self.is_type_var)
+            yield [validation_result]
+            return
+
+        children_validation_results = []
+
+        for i in self.branch_statistics.order:
+            validation_result = yield children[i].validate(data, validator, self.is_type_var)
+            children_validation_results.append(validation_result)
+            if validation_result.valid:
+                self.branch_statistics.record(i)
+                break
+
+        if not children_validation_results:
+            children_validation_results.append(ValidationResult(False, data, extract_type_name(data)))
+
+        yield children_validation_results
+
+    def get_matching_leaves(self, validator, data):
+        """
+        Returns indices of leaf branches which accept the type of data
+        Results are computed once per runtime type and type checking mode, for a limited number of types
+        """
+        if not isinstance(data, type):
+            input_type = type(data)
+        else:
+            input_type = data
+
+        mode = (validator.covariant, validator.contravariant)
+
+        try:
+            type_index = self.dispatch_index[mode]
+        except KeyError:
+            type_index = self.dispatch_index[mode] = {}
+
+        try:
+            return type_index[input_type]
+        except KeyError:
+            pass
+
+        children = self.children
+        matching_leaves = tuple(i for i in self.leaf_branches if children[i].validate_data(validator, input_type).valid)
+
+        if len(type_index) < self.DISPATCH_INDEX_SIZE:
+            type_index[input_type] = matching_leaves
+
+        return matching_leaves
+
+    def add_child(self, child):
+        """
+        Sorts child nodes into leaf and ambiguous branches
+        Leaf branches are simple types without nested types, their validity depends only on the type of data
+        """
+        if type(child) in (SimpleNode, EnumNode) and not child.original_children and child.expected_data_type is not typing.Any:
+            self.leaf_branches.append(len(self.original_children))
+        else:
+            self.branch_statistics.add_branch(len(self.original_children))
+
+        super().add_child(child)
+
+    @property
+    def ambiguous_branches(self):
+        """
+        Returns indices of ambiguous branches in the order they are currently tried
+        """
+        return self.branch_statistics.order
+
     def reduce_data(self, validator, self_validation_result, child_validation_result):
         return next((result.data for result in self_validation_result if result.data is not None), None)
 
@@ -285,6 +787,74 @@ class UnionNode(BaseNode):
         return child_types.pop()
 
 
+class OptionalNode(BaseNode):
+    """
+    A node for Optional types (Unions with None)
+    None is accepted by a single identity check, any other data is validated by the only child node
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(typing.Any, is_sequence=True, is_container=True, **kwargs)
+
+    def validate_data(self, validator, data, sticky=False):
+        return ValidationResult(valid=True, data=data, type_name=extract_type_name(data))
+
+    def map_data(self, validator, self_validation_result):
+        data = self_validation_result.data
+
+        if data is None:
+            return []
+
+        return [data]
+
+    def get_actual_data_type(self, self_validation_result, child_validation_results, valid):
+        if child_validation_results:
+            return child_validation_results[0].type_name
+
+        return self_validation_result.type_name
+
+    def reduce_data(self, validator, child_validation_results, self_validation_result):
+        if child_validation_results:
+            return child_validation_results[0].data
+
+        return self_validation_result.data
+
+    def validate_column(self, validator, column):
+        """
+        Validates all the values of the column which are not None by the only child node at once
+        """
+        child = self.original_children[0]
+        indices = [i for i, data in enumerate(column) if data is not None]
+
+        if len(indices) == len(column):
+            return child.validate_column(validator, column)
+
+        return [indices[i] for i in child.validate_column(validator, [column[i] for i in indices])]
+
+
+class ForwardRefNode(BaseNode):
+    """
+    A node for forward references (type hints given as strings)
+    The reference is resolved by the validator on the first use and all references
+    with the same name share the resolved node, so recursive types become cycles in the tree
+    """
+
+    def __init__(self, forward_ref, **kwargs):
+        super().__init__(forward_ref, is_sequence=True, is_container=True, **kwargs)
+        self.target = None
+
+    def validate(self, data, validator, force=False):
+        if self.target is None:
+            self.target = validator.resolve_forward_ref(self.expected_data_type)
+
+        validation_result = yield self.target.validate(data, validator, force)
+
+        if validation_result.valid:
+            self.set_out_data(validator, data, validation_result.data)
+
+        yield validation_result
+
+
 class TypeVarNode(BaseNode):
     def __init__(self, **kwargs):
         super().__init__(expected_data_type=None, is_sequence=True, type_var=True, **kwargs)
@@ -328,14 +898,15 @@ class TupleNode(BaseNode):
     def __init__(self, variable_length=False, **kwargs):
         self.variable_length = variable_length
         super().__init__(typing.Tuple, is_sequence=True, is_container=True, **kwargs)
+        self.type_checks = TypeChecks(self.expected_data_type)
 
     def validate_data(self, validator, data, sticky=False):
-        covariant = self.covariant or validator.settings.covariant
-        contravariant = self.contravariant or validator.settings.contravariant
+        covariant = self.covariant or validator.covariant
+        contravariant = self.contravariant or validator.contravariant
 
         input_type = type(data)
 
-        if is_type_of_type(input_type, self.expected_data_type, covariant=covariant, contravariant=contravariant):
+        if self.type_checks.check(input_type, covariant, contravariant):
             if self.variable_length:
                 return ValidationResult(valid=True, data=data, type_name=extract_type_name(input_type))
             else:
@@ -461,8 +1032,8 @@ class CallableNode(BaseNode):
             proxy = EnforceProxy(data)
             return apply_enforcer(proxy)
         else:
-            covariant = self.covariant or validator.settings.covariant
-            contravariant = self.contravariant or validator.settings.contravariant
+            covariant = self.covariant or validator.covariant
+            contravariant = self.contravariant or validator.contravariant
 
             if is_type_of_type(type(enforcer), Enforcer, covariant=covariant, contravariant=contravariant):
                 return data
@@ -524,8 +1095,8 @@ class GenericNode(BaseNode):
         except AttributeError:
             enforcer = GenericProxy(data_type).__enforcer__
         else:
-            covariant = self.covariant or validator.settings.covariant
-            contravariant = self.contravariant or validator.settings.contravariant
+            covariant = self.covariant or validator.covariant
+            contravariant = self.contravariant or validator.contravariant
 
             if not is_type_of_type(type(enforcer), Enforcer, covariant=covariant, contravariant=contravariant):
                 enforcer =  GenericProxy(data_type).__enforcer__
@@ -540,8 +1111,8 @@ class GenericNode(BaseNode):
         except AttributeError:
             return GenericProxy(data)
         else:
-            covariant = self.covariant or validator.settings.covariant
-            contravariant = self.contravariant or validator.settings.contravariant
+            covariant = self.covariant or validator.covariant
+            contravariant = self.contravariant or validator.contravariant
 
             if is_type_of_type(type(enforcer), Enforcer, covariant=covariant, contravariant=contravariant):
                 return data
@@ -552,8 +1123,8 @@ class GenericNode(BaseNode):
         enforcer = data.__enforcer__
         input_type = enforcer.signature
 
-        covariant = self.covariant or validator.settings.covariant
-        contravariant = self.contravariant or validator.settings.contravariant
+        covariant = self.covariant or validator.covariant
+        contravariant = self.contravariant or validator.contravariant
 
         if not is_type_of_type(input_type,
                                self.expected_data_type.signature,
@@ -581,8 +1152,12 @@ class GenericNode(BaseNode):
 
 class MappingNode(BaseNode):
 
+    # Only insertion ordered dictionaries have a well defined tail of appended items
+    incremental_types = (dict,) if sys.version_info >= (3, 6) else ()
+
     def __init__(self, data_type, **kwargs):
         super().__init__(data_type, is_sequence=True, is_container=True, **kwargs)
+        self.type_checks = TypeChecks(data_type)
 
     def validate_data(self, validator, data, sticky=False):
         if not isinstance(data, type):
@@ -590,20 +1165,36 @@ class MappingNode(BaseNode):
         else:
             input_type = data
 
-        covariant = self.covariant or validator.settings.covariant
-        contravariant = self.contravariant or validator.settings.contravariant
+        covariant = self.covariant or validator.covariant
+        contravariant = self.contravariant or validator.contravariant
 
-        result = is_type_of_type(input_type, self.expected_data_type, covariant=covariant, contravariant=contravariant)
+        result = self.type_checks.check(input_type, covariant, contravariant)
 
         type_name = input_type.__name__
         return ValidationResult(valid=result, data=data, type_name=type_name)
 
     def validate_children(self, validator, propagated_data):
+        from .parallel import should_validate_in_parallel, validate_in_parallel
+
         key_validator = self.children[0]
         value_validator = self.children[1]
 
         children_validation_results = []
 
+        if should_validate_in_parallel(self, validator, propagated_data):
+            type_names, invalid_index = validate_in_parallel(self, validator, propagated_data)
+
+            # Items validated in parallel are not transformed, so their results carry no data
+            for key_type_name, value_type_name in type_names:
+                out_name = [TYPE_NAME_ALIASES.get(n, n) for n in (key_type_name, value_type_name)]
+                children_validation_results.append(ValidationResult(valid=True, data=None, type_name=out_name))
+
+            # Only the first invalid item is validated again, in order to report its type
+            if invalid_index is None:
+                propagated_data = []
+            else:
+                propagated_data = propagated_data[invalid_index:invalid_index + 1]
+
         for i, data in enumerate(propagated_data):
             key_validation_result = yield key_validator.validate(data[0], validator, self.is_type_var)
             value_validation_result = yield value_validator.validate(data[1], validator, self.is_type_var)
@@ -630,8 +1221,42 @@ class MappingNode(BaseNode):
         return output
 
     def reduce_data(self, validator, child_validation_results, self_validation_result):
+        if any(result.data is None for result in child_validation_results):
+            return dict(self_validation_result.data)
+
         return {result.data[0]: result.data[1] for result in child_validation_results}
 
+    def validate_appended_items(self, validator, data, offset):
+        key_validator = self.original_children[0]
+        value_validator = self.original_children[1]
+
+        children_validation_results = []
+
+        for key, value in islice(data.items(), offset, None):
+            key_validation_result = yield key_validator.validate(key, validator, self.is_type_var)
+            value_validation_result = yield value_validator.validate(value, validator, self.is_type_var)
+
+            is_valid = key_validation_result.valid and value_validation_result.valid
+            out_name = (key_validation_result.type_name, value_validation_result.type_name)
+            out_name = [TYPE_NAME_ALIASES.get(n, n) for n in out_name]
+
+            children_validation_results.append(ValidationResult(valid=is_valid, data=(key, value), type_name=out_name))
+
+            if not is_valid:
+                break
+
+        yield children_validation_results
+
+    def sample_items(self, data, length):
+        return sample_items(data, length, self.INCREMENTAL_SAMPLES)
+
+    def is_unchanged(self, data, data_out):
+        if len(data) != len(data_out):
+            return False
+
+        return all(key is key_out and value is value_out
+                   for (key, value), (key_out, value_out) in zip(data.items(), data_out.items()))
+
     def get_actual_data_type(self, self_validation_result, child_validation_results, valid):
         """
         Returns a name of an actual type of given data
@@ -665,6 +1290,93 @@ class MappingNode(BaseNode):
         return actual_type
 
 
+class TypedDictNode(BaseNode):
+    """
+    A node for TypedDict types
+    Every key of the schema has its own child node and its value is looked up directly,
+    so the validation costs depend only on the size of the schema
+    Keys which are not a part of the schema are either ignored or rejected depending on the settings
+    """
+
+    def __init__(self, data_type, keys, required_keys, **kwargs):
+        super().__init__(data_type, is_sequence=True, is_container=True, **kwargs)
+        self.keys = keys
+        self.required_keys = required_keys
+        self.type_checks = TypeChecks(dict)
+
+    def validate_data(self, validator, data, sticky=False):
+        covariant = self.covariant or validator.covariant
+        contravariant = self.contravariant or validator.contravariant
+
+        input_type = type(data)
+
+        result = self.type_checks.check(input_type, covariant, contravariant)
+
+        return ValidationResult(valid=result, data=data, type_name=extract_type_name(input_type))
+
+    def map_data(self, validator, self_validation_result):
+        if self_validation_result.valid:
+            return self_validation_result.data
+        return {}
+
+    def validate_children(self, validator, propagated_data):
+        from .settings import ExtraKeysChoices
+
+        children_validation_results = []
+
+        number_of_present_keys = 0
+
+        for i, key in enumerate(self.keys):
+            try:
+                value = propagated_data[key]
+            except KeyError:
+                if key in self.required_keys:
+                    children_validation_results.append(ValidationResult(False, (key, None), repr(key) + ' -> missing'))
+                continue
+
+            number_of_present_keys += 1
+
+            validation_result = yield self.children[i].validate(value, validator, self.is_type_var)
+
+            out_data = (key, validation_result.data)
+            out_name = repr(key) + ' -> ' + str(validation_result.type_name)
+
+            children_validation_results.append(ValidationResult(validation_result.valid, out_data, out_name))
+
+        if len(propagated_data) > number_of_present_keys and validator.settings.extra_keys is ExtraKeysChoices.forbid:
+            for key, value in propagated_data.items():
+                if key not in self.keys:
+                    children_validation_results.append(ValidationResult(False, (key, value), repr(key) + ' -> unexpected'))
+
+        yield children_validation_results
+
+    def reduce_data(self, validator, child_validation_results, self_validation_result):
+        data = self_validation_result.data
+
+        updated_items = [result.data for result in child_validation_results if result.data[1] is not data[result.data[0]]]
+
+        if not updated_items:
+            return data
+
+        data_out = data.copy()
+        data_out.update(updated_items)
+
+        return data_out
+
+    def get_actual_data_type(self, self_validation_result, child_validation_results, valid):
+        """
+        Returns a name of an actual type of given data with a description of all invalid keys
+        """
+        actual_type = self_validation_result.type_name
+
+        invalid_keys = [result.type_name for result in child_validation_results if not result.valid]
+
+        if invalid_keys:
+            actual_type = actual_type + ' with invalid keys: ' + ', '.join(invalid_keys)
+
+        return actual_type
+
+
 def extract_type_name(data):
     if isinstance(data, type):
         type_name = data.__name__
@@ -0,0 +1,81 @@
+import typing
+from contextlib import contextmanager
+
+from .utils import ContextLocal
+
+
+# Overrides of the global settings in the current context, None when there are none
+# Groups and sampling are mappings of group names, unset options are None
+Overrides = typing.NamedTuple('Overrides', [('enabled', typing.Optional[bool]),
+                                            ('groups', typing.Mapping),
+                                            ('mode', typing.Any),
+                                            ('sampling', typing.Mapping)])
+
+
+_OVERRIDES = ContextLocal('enforce_overrides')
+
+
+def get_overrides() -> typing.Optional[Overrides]:
+    """
+    Returns the overrides of the current context or None
+    """
+    return _OVERRIDES.get()
+
+
+@contextmanager
+def overrides(*,
+              enabled: typing.Optional[bool]=None,
+              groups: typing.Optional[typing.Dict[str, bool]]=None,
+              mode: typing.Optional[str]=None,
+              sampling: typing.Optional[typing.Dict[str, float]]=None):
+    """
+    Overrides the global settings within the block, only in the current thread or asyncio task
+
+    Options are the same as the global switch, group statuses, type checking mode and sampling rates of config()
+    Nested blocks override the options of the outer ones, groups and sampling rates are merged
+    """
+    from .settings import ModeChoices
+
+    if enabled is not None and not isinstance(enabled, bool):
+        raise TypeError('Enabled override must be boolean')
+
+    if mode is not None:
+        try:
+            mode = ModeChoices[mode]
+        except KeyError:
+            raise KeyError('Mode must be one of mode choices')
+
+    for group_name, status in (groups or {}).items():
+        if not isinstance(status, bool):
+            raise TypeError('Group status override must be boolean')
+
+    for group_name, rate in (sampling or {}).items():
+        if isinstance(rate, bool) or not isinstance(rate, (int, float)) or not 0 <= rate <= 1:
+            raise ValueError('Sampling rate must be a number between 0 and 1')
+
+    outer = _OVERRIDES.get()
+
+    merged_groups = dict(outer.groups) if outer is not None else {}
+    merged_sampling = dict(outer.sampling) if outer is not None else {}
+
+    # Options of this block take precedence over the options of the outer one
+    merged_groups.update(groups or {})
+    merged_sampling.update(sampling or {})
+
+    if outer is not None:
+        enabled = outer.enabled if enabled is None else enabled
+        mode = outer.mode if mode is None else mode
+
+    token = _OVERRIDES.set(Overrides(enabled, merged_groups, mode, merged_sampling))
+
+    try:
+        yield
+    finally:
+        _OVERRIDES.reset(token)
+
+
+def disabled():
+    """
+    Disables all enforcement within the block, only in the current thread or asyncio task
+    """
+    return overrides(enabled=False)
@@ -0,0 +1,225 @@
+import threading
+from collections import deque, OrderedDict
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+
+from . import nodes
+from .settings import Settings, config
+from .validator import init_validator
+from .utils import visit
+
+
+# Nodes which neither transform data nor call other enforced functions (which would need the RunLock)
+PARALLEL_SAFE_NODES = frozenset([
+    nodes.SimpleNode,
+    nodes.NamedTupleListNode,
+    nodes.EnumNode,
+    nodes.LiteralNode,
+    nodes.UnionNode,
+    nodes.OptionalNode,
+    nodes.ForwardRefNode,
+    nodes.TupleNode,
+    nodes.MappingNode,
+    nodes.TypedDictNode
+])
+
+
+# Validators of workers, every worker thread (or process) builds its own node trees
+# Only the most recently used validators are kept by each worker
+_WORKER_STATE = threading.local()
+
+MAX_WORKER_VALIDATORS = 256
+
+# Global settings last applied in a worker process
+_WORKER_OPTIONS = None
+
+
+def should_validate_in_parallel(node, validator, items):
+    """
+    Returns if the items of a container should be validated on the configured executor
+    """
+    if node.item_hints is None:
+        return False
+
+    options = validator.settings.parallel
+
+    if options['executor'] is None or len(items) < options['threshold']:
+        return False
+
+    if validator.globals or validator.parent is not None:
+        return False
+
+    processes = isinstance(options['executor'], ProcessPoolExecutor)
+
+    try:
+        return node.parallel_safe[processes]
+    except KeyError:
+        pass
+
+    parallel_safe = all(is_parallel_safe(child, validator, processes=processes) for child in node.original_children)
+    node.parallel_safe[processes] = parallel_safe
+
+    return parallel_safe
+
+
+def is_parallel_safe(node, validator, seen=None, processes=False):
+    """
+    Returns if the node and all of its descendants can be validated outside of the RunLock
+    Processes cannot receive namespaces, so they cannot resolve forward references
+    """
+    if seen is None:
+        seen = set()
+
+    if id(node) in seen:
+        return True
+
+    seen.add(id(node))
+
+    if type(node) not in PARALLEL_SAFE_NODES:
+        return False
+
+    if type(node) is nodes.ForwardRefNode:
+        if processes:
+            return False
+        if node.target is None:
+            node.target = validator.resolve_forward_ref(node.expected_data_type)
+        return is_parallel_safe(node.target, validator, seen)
+
+    return all(is_parallel_safe(child, validator, seen, processes) for child in node.original_children)
+
+
+def validate_in_parallel(node, validator, items):
+    """
+    Validates the items in chunks on the configured executor
+
+    Returns a sorted list of type names of all the valid items and an index of the first invalid item (or None)
+    Only a limited number of chunks is submitted at a time, so that the items are not all copied (or pickled) at once
+    All the pending chunks after the first invalid one are cancelled if they have not started yet
+    """
+    options = validator.settings.parallel
+    executor = options['executor']
+    chunk_size = options['chunk_size']
+    pending_chunks = options['pending_chunks']
+
+    # Workers use the mode of the function, which can come from its group, its decorator or the current overrides
+    mode = validator.mode.name
+
+    if isinstance(executor, ProcessPoolExecutor):
+        # Processes have their own global settings and cannot receive module namespaces
+        namespace = None
+        worker_options = {'extra_keys': validator.settings.extra_keys.name}
+    else:
+        namespace = get_namespace(validator)
+        worker_options = None
+
+    iterator = iter(items)
+    futures = deque()
+    exhausted = False
+
+    type_names = set()
+    invalid_index = None
+    chunk_index = 0
+
+    while True:
+        while not exhausted and len(futures) < pending_chunks:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                exhausted = True
+                break
+            futures.append(executor.submit(validate_chunk, node.item_hints, namespace, worker_options, chunk, mode))
+
+        if not futures:
+            break
+
+        chunk_type_names, chunk_invalid_index = futures.popleft().result()
+        type_names.update(chunk_type_names)
+
+        if chunk_invalid_index is not None:
+            invalid_index = chunk_index * chunk_size + chunk_invalid_index
+
+            for future in futures:
+                future.cancel()
+            break
+
+        chunk_index += 1
+
+    return sorted(type_names), invalid_index
+
+
+def validate_chunk(hints, namespace, options, items, mode=None):
+    """
+    Validates a chunk of items in a worker
+    Items of Dicts are (key, value) pairs, which are validated against a pair of hints
+
+    Returns a list of type names of valid items and an index of the first invalid item (or None)
+    """
+    global _WORKER_OPTIONS
+
+    # Worker processes receive the same options with every chunk, but apply them only once
+    if options is not None and options != _WORKER_OPTIONS:
+        config(options)
+        _WORKER_OPTIONS = options
+
+    roots, validator = get_worker_validator(hints, namespace, mode)
+    type_names = set()
+
+    try:
+        if len(roots) == 1:
+            root = roots[0]
+            for i, item in enumerate(items):
+                result = visit(root.validate(item, validator))
+                if not result.valid:
+                    return list(type_names), i
+                type_names.add(result.type_name)
+        else:
+            key_root, value_root = roots
+            for i, (key, value) in enumerate(items):
+                key_result = visit(key_root.validate(key, validator))
+                value_result = visit(value_root.validate(value, validator))
+                if not key_result.valid or not value_result.valid:
+                    return list(type_names), i
+                type_names.add((key_result.type_name, value_result.type_name))
+    finally:
+        validator.end_pass()
+
+    return list(type_names), None
+
+
+def get_worker_validator(hints, namespace, mode=None):
+    """
+    Returns root nodes and a validator for the hints, which are built once per worker
+    """
+    try:
+        cache = _WORKER_STATE.validators
+    except AttributeError:
+        cache = _WORKER_STATE.validators = OrderedDict()
+
+    # Cached validators keep their namespaces alive, so their ids cannot be reused
+    key = (hints, id(namespace), mode)
+
+    try:
+        entry = cache[key]
+    except KeyError:
+        pass
+    else:
+        cache.move_to_end(key)
+        return entry
+
+    validator = init_validator({i: hint for i, hint in enumerate(hints)}, namespace=namespace)
+    validator.settings = Settings(enabled=True, mode=mode)
+    validator.resolve_mode()
+
+    roots = [validator.roots[i] for i in range(len(hints))]
+    cache[key] = (roots, validator)
+
+    while len(cache) > MAX_WORKER_VALIDATORS:
+        cache.popitem(last=False)
+
+    return roots, validator
+
+
+def get_namespace(validator):
+    while validator.namespace is None and validator.parent is not None:
+        validator = validator.parent
+
+    return validator.namespace
@@ -1,3 +1,4 @@
+import enum
 import typing
 from collections import namedtuple
 
@@ -7,8 +8,14 @@ try:
 except ImportError:
     UnionMeta = typing.Union
 
+# Forward references are public starting from Python 3.7
+try:
+    from typing import ForwardRef
+except ImportError:
+    ForwardRef = typing._ForwardRef
+
 from . import nodes
-from .types import EnhancedTypeVar, is_named_tuple
+from .types import EnhancedTypeVar, is_named_tuple, is_literal, get_literal_values, is_typed_dict, get_typed_dict_keys
 
 
 ParserChoice = namedtuple('ParserChoice', ['validator', 'parser'])
@@ -56,6 +63,28 @@ def _parse_namedtuple(node, hint, validator, parsers):
     yield _yield_parsing_result(node, new_node)
 
 
+def _parse_literal(node, hint, validator, parsers):
+    new_node = yield nodes.LiteralNode(hint, get_literal_values(hint))
+    validator.all_nodes.append(new_node)
+    yield _yield_parsing_result(node, new_node)
+
+
+def _parse_enum(node, hint, validator, parsers):
+    new_node = yield nodes.EnumNode(hint)
+    validator.all_nodes.append(new_node)
+    yield _yield_parsing_result(node, new_node)
+
+
+def _parse_forward_ref(node, hint, validator, parsers):
+    """
+    Forward references are resolved lazily during the validation
+    This allows recursive type hints without expanding them indefinitely
+    """
+    new_node = yield nodes.ForwardRefNode(hint)
+    validator.all_nodes.append(new_node)
+    yield _yield_parsing_result(node, new_node)
+
+
 def _parse_default(node, hint, validator, parsers):
     if str(hint).startswith('typing.Union'):
         yield _parse_union(node, hint, validator, parsers)
@@ -71,17 +100,41 @@ def _parse_union(node, hint, validator, parsers):
     Union type has to be parsed into multiple nodes
     in order to enable further validation of nested types
     """
-    new_node = yield nodes.UnionNode()
     try:
         union_params = hint.__union_params__
     except AttributeError:
         union_params = hint.__args__
+
+    if type(None) in union_params:
+        yield _parse_optional(node, union_params, validator, parsers)
+        return
+
+    new_node = yield nodes.UnionNode()
     validator.all_nodes.append(new_node)
     for element in union_params:
         yield get_parser(new_node, element, validator, parsers)
     yield _yield_parsing_result(node, new_node)
 
 
+def _parse_optional(node, union_params, validator, parsers):
+    """
+    Parses Optional type (Union with None)
+    None is handled by the node itself and all the other Union parameters
+    are parsed into a single child node
+    """
+    params = tuple(param for param in union_params if param is not type(None))
+
+    new_node = yield nodes.OptionalNode()
+    validator.all_nodes.append(new_node)
+
+    if len(params) == 1:
+        yield get_parser(new_node, params[0], validator, parsers)
+    else:
+        yield _parse_union(new_node, typing.Union[params], validator, parsers)
+
+    yield _yield_parsing_result(node, new_node)
+
+
 def _parse_type_var(node, hint, validator, parsers):
     try:
         new_node = validator.parent.roots[hint.__name__]
@@ -163,17 +216,43 @@ def _parse_generic(node, hint, validator, parsers):
 
 
 def _parse_list(node, hint, validator, parsers):
+    if hint.__args__ and _is_typed_named_tuple(hint.__args__[0]):
+        yield _parse_named_tuple_list(node, hint, validator, parsers)
+        return
+
     new_node = yield nodes.SimpleNode(hint.__extra__)
     validator.all_nodes.append(new_node)
 
     # add its type as child
     # We need to index first element only as Lists always have 1 argument
     if hint.__args__:
+        new_node.item_hints = hint.__args__[:1]
         yield get_parser(new_node, hint.__args__[0], validator, parsers)
 
     yield _yield_parsing_result(node, new_node)
 
 
+def _parse_named_tuple_list(node, hint, validator, parsers):
+    """
+    Lists of typed NamedTuples are validated column by column
+    Every field of a NamedTuple becomes a child node in the order of the fields definition
+    """
+    record_type = hint.__args__[0]
+    field_types = record_type._field_types
+
+    new_node = yield nodes.NamedTupleListNode(hint.__extra__, record_type)
+    validator.all_nodes.append(new_node)
+
+    for field in record_type._fields:
+        yield get_parser(new_node, field_types.get(field, typing.Any), validator, parsers)
+
+    yield _yield_parsing_result(node, new_node)
+
+
+def _is_typed_named_tuple(hint):
+    return isinstance(hint, type) and is_named_tuple(hint) and hasattr(hint, '_field_types')
+
+
 def _parse_set(node, hint, validator, parsers):
     new_node = yield nodes.SimpleNode(hint.__extra__)
     validator.all_nodes.append(new_node)
@@ -181,6 +260,7 @@ def _parse_set(node, hint, validator, parsers):
     # add its type as child
     # We need to index first element only as Sets always have 1 argument
     if hint.__args__:
+        new_node.item_hints = hint.__args__[:1]
         yield get_parser(new_node, hint.__args__[0], validator, parsers)
 
     yield _yield_parsing_result(node, new_node)
@@ -191,6 +271,7 @@ def _parse_dict(node, hint, validator, parsers):
 
     if hint_args:
         new_node = yield nodes.MappingNode(hint.__extra__)
+        new_node.item_hints = hint_args[:2]
         validator.all_nodes.append(new_node)
 
         yield get_parser(new_node, hint_args[0], validator, parsers)
@@ -202,6 +283,27 @@ def _parse_dict(node, hint, validator, parsers):
         yield _parse_default(node, hint, validator, parsers)
 
 
+def _parse_typed_dict(node, hint, validator, parsers):
+    """
+    Every key of a TypedDict is parsed into its own child node
+    in the order of the TypedDict definition
+    """
+    try:
+        field_types = typing.get_type_hints(hint)
+    except (NameError, TypeError):
+        field_types = hint.__annotations__
+
+    required_keys, _ = get_typed_dict_keys(hint)
+
+    new_node = yield nodes.TypedDictNode(hint, tuple(field_types), required_keys)
+    validator.all_nodes.append(new_node)
+
+    for field_type in field_types.values():
+        yield get_parser(new_node, field_type, validator, parsers)
+
+    yield _yield_parsing_result(node, new_node)
+
+
 def _yield_unified_node(node, hints, validator, parsers):
     new_node = yield nodes.UnionNode()
     validator.all_nodes.append(new_node)
@@ -227,6 +329,8 @@ TYPE_PARSERS = {
     typing.CallableMeta: _parse_callable,
     typing.TypeVar: _parse_type_var,
     EnhancedTypeVar: _parse_type_var,
+    enum.EnumMeta: _parse_enum,
+    ForwardRef: _parse_forward_ref,
     complex: _parse_complex,
     bytes: _parse_bytes
     }
@@ -234,4 +338,6 @@ TYPE_PARSERS = {
 
 ALIASED_TYPE_PARSERS = (
     ParserChoice(validator=is_named_tuple, parser=_parse_namedtuple),
+    ParserChoice(validator=is_literal, parser=_parse_literal),
+    ParserChoice(validator=is_typed_dict, parser=_parse_typed_dict),
     )
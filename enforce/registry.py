@@ -0,0 +1,37 @@
+import weakref
+import threading
+
+
+class WrapperRegistry:
+    """
+    Keeps weak references to all the enforced functions in order to bypass them while they are disabled
+
+    A disabled function is bypassed by its wrapper before any other work is done, unless there are overrides
+    """
+
+    def __init__(self):
+        self.wrappers = weakref.WeakSet()
+        self.lock = threading.RLock()
+
+    def register(self, wrapper):
+        """
+        Adds a new wrapper, bypassing it right away if its function is disabled
+        """
+        with self.lock:
+            self.wrappers.add(wrapper)
+            self.update(wrapper)
+
+    def refresh(self):
+        """
+        Bypasses all the disabled wrappers and stops bypassing all the enabled ones
+        """
+        with self.lock:
+            for wrapper in list(self.wrappers):
+                self.update(wrapper)
+
+    def update(self, wrapper):
+        enforcer = wrapper.__wrapped__.__enforcer__
+        enforcer.bypassed = enforcer.settings is not None and not enforcer.settings.globally_enabled
+
+
+REGISTRY = WrapperRegistry()
@@ -0,0 +1,73 @@
+import zlib
+import random
+from contextlib import contextmanager
+
+from .utils import ContextLocal
+
+
+# The current request id together with its precomputed sampling fraction
+_REQUEST = ContextLocal('enforce_request')
+
+
+def get_fraction(request_id):
+    """
+    Maps a request id to a number in [0, 1), the same id always gets the same number
+    """
+    if not isinstance(request_id, bytes):
+        request_id = str(request_id).encode('utf-8')
+
+    return zlib.crc32(request_id) / 4294967296
+
+
+def set_request_id(request_id):
+    """
+    Sets the id of the current request, returns a token for reset_request_id
+    None clears the current request id
+    """
+    if request_id is None:
+        return _REQUEST.set(None)
+
+    return _REQUEST.set((request_id, get_fraction(request_id)))
+
+
+def reset_request_id(token):
+    """
+    Restores the request id which was current before the matching set_request_id
+    """
+    _REQUEST.reset(token)
+
+
+def get_request_id():
+    """
+    Returns the id of the current request or None
+    """
+    request = _REQUEST.get()
+    return request[0] if request is not None else None
+
+
+@contextmanager
+def request(request_id):
+    """
+    Sets the id of the current request for the duration of the block
+    """
+    token = set_request_id(request_id)
+    try:
+        yield
+    finally:
+        reset_request_id(token)
+
+
+def sample(rate):
+    """
+    Returns if a call should be validated, given the sampling rate of its group
+
+    Within a request, the decision depends only on its id and the rate,
+    so a request is validated in every group with a rate higher than its fraction
+    Calls outside of requests are sampled randomly
+    """
+    request = _REQUEST.get()
+
+    if request is None:
+        return random.random() < rate
+
+    return request[1] < rate
@@ -1,7 +1,19 @@
+import os
 import enum
+import json
+import typing
+import logging
+import threading
 import collections
+from types import MappingProxyType
 
 from .utils import merge_dictionaries
+from .sampling import sample
+from .registry import REGISTRY
+
+
+logger = logging.getLogger('enforce')
+from .overrides import get_overrides
 
 
 class ModeChoices(enum.Enum):
@@ -14,23 +26,197 @@ class ModeChoices(enum.Enum):
     bivariant = 3
 
 
+class PolicyChoices(enum.Enum):
+    """
+    All possible outcomes of a type violation
+    """
+    raise_error = 'raise'
+    log = 'log'
+    count = 'count'
+
+
+class ExtraKeysChoices(enum.Enum):
+    """
+    All possible policies for keys of TypedDicts which are not a part of their schema
+    """
+    ignore = 0
+    forbid = 1
+
+
+# Containers with at least 'threshold' items are validated in chunks of 'chunk_size' items on the executor
+# At most 'pending_chunks' chunks are submitted to the executor at a time
+DEFAULT_PARALLEL_OPTIONS = {
+    'executor': None,
+    'threshold': 100000,
+    'chunk_size': 10000,
+    'pending_chunks': 16
+}
+
+
+# Calls of functions in background mode are validated from a queue of 'queue_size' calls
+# The 'overflow' policy is either 'drop' or 'sample' (1 of 'sample_rate' calls is queued once the queue is half full)
+# Violations are passed to the 'sink' callable together with the function or logged if it is None
+DEFAULT_BACKGROUND_OPTIONS = {
+    'queue_size': 1024,
+    'overflow': 'drop',
+    'sample_rate': 10,
+    'sink': None
+}
+
+
+# Logged violations are kept in a ring buffer of 'capacity' violations and written every 'interval' seconds
+# At most 'rate_limit' new violations per second are logged, they are passed to the 'sink' callable in lists,
+# appended to the 'file' or logged if both are None
+DEFAULT_VIOLATION_OPTIONS = {
+    'capacity': 1024,
+    'rate_limit': 100,
+    'interval': 1.0,
+    'sink': None,
+    'file': None
+}
+
+
+# Governed groups are evaluated every 'window' seconds, they step down a level when over their budget
+# and step up when under the budget multiplied by 'recovery'; at the sampled level, 'sample_rate' of calls is validated
+# Level changes are passed to the 'sink' callable or logged if it is None
+DEFAULT_GOVERNOR_OPTIONS = {
+    'window': 1.0,
+    'recovery': 0.5,
+    'sample_rate': 0.1,
+    'sink': None
+}
+
+
+# Warmed up functions are still fully validated once every 'check_rate' calls
+DEFAULT_WARMUP_OPTIONS = {
+    'check_rate': 1000
+}
+
+
+# Environment variables read once at import
+# ENFORCE_NOOP disables decoration of all functions ('1', 'true', 'all') or of a comma separated list of groups
+# ENFORCE_CONFIG is a path to a JSON file with options applied by config() at import
+NOOP_VARIABLE = 'ENFORCE_NOOP'
+CONFIG_VARIABLE = 'ENFORCE_CONFIG'
+
+
+SettingsSnapshot = typing.NamedTuple('SettingsSnapshot', [('epoch', int),
+                                                          ('enabled', bool),
+                                                          ('groups', typing.Mapping),
+                                                          ('mode', ModeChoices),
+                                                          ('modes', typing.Mapping),
+                                                          ('covariant', bool),
+                                                          ('contravariant', bool),
+                                                          ('extra_keys', ExtraKeysChoices),
+                                                          ('trust_returns', bool),
+                                                          ('policies', typing.Mapping),
+                                                          ('sampling', typing.Mapping),
+                                                          ('budgets', typing.Mapping),
+                                                          ('parallel', typing.Mapping),
+                                                          ('background', typing.Mapping),
+                                                          ('violations', typing.Mapping),
+                                                          ('governor', typing.Mapping),
+                                                          ('warmup', typing.Mapping),
+                                                          ('noop', typing.Any)])
+
+
 class Settings:
-    def __init__(self, enabled=None, group=None):
+    """
+    Settings of a decorated function or class
+
+    Global settings are read from the snapshot published by the last config() update
+    Decisions which depend on the group are resolved once per snapshot epoch
+    Overrides of the current context (see enforce.overrides) take precedence over the snapshot
+    """
+
+    def __init__(self, enabled=None, group=None, incremental=False, background=False, warmup=None, mode=None):
         self.group = group or 'default'
+        self.incremental = incremental
+        self.background = background
+        self.warmup = warmup
         self._enabled = enabled
 
+        if mode is not None:
+            try:
+                mode = ModeChoices[mode]
+            except KeyError:
+                raise KeyError('Mode must be one of mode choices')
+
+        self.local_mode = mode
+
+        self._epoch = None
+        self._resolved_enabled = False
+        self._mode = ModeChoices.invariant
+        self._covariant = False
+        self._contravariant = False
+        self._sampling_rate = None
+        self._budget = None
+        self._policy = PolicyChoices.raise_error
+
+    def resolve(self):
+        """
+        Resolves the group dependent settings from the current snapshot
+        """
+        snapshot = _SNAPSHOT
+
+        if not snapshot.enabled:
+            self._resolved_enabled = False
+        elif self._enabled is None:
+            self._resolved_enabled = snapshot.groups.get(self.group, False)
+        else:
+            self._resolved_enabled = self._enabled
+
+        # A mode set on the decorator takes precedence over the mode of the group, which takes precedence over the global one
+        self._mode = self.local_mode or snapshot.modes.get(self.group) or snapshot.mode
+        self._covariant = self._mode in (ModeChoices.covariant, ModeChoices.bivariant)
+        self._contravariant = self._mode in (ModeChoices.contravariant, ModeChoices.bivariant)
+
+        self._sampling_rate = snapshot.sampling.get(self.group)
+        self._budget = snapshot.budgets.get(self.group)
+        self._policy = snapshot.policies.get(self.group, PolicyChoices.raise_error)
+
+        self._epoch = snapshot.epoch
+
     @property
     def enabled(self):
         """
         Returns if this instance of settings is enabled
         """
-        if not _GLOBAL_SETTINGS['enabled']:
+        overrides = get_overrides()
+
+        if overrides is not None:
+            return self.enabled_with(overrides)
+
+        if self._epoch != _SNAPSHOT.epoch:
+            self.resolve()
+
+        return self._resolved_enabled
+
+    @property
+    def globally_enabled(self):
+        """
+        Returns if this instance of settings is enabled regardless of the overrides of the current context
+        """
+        if self._epoch != _SNAPSHOT.epoch:
+            self.resolve()
+
+        return self._resolved_enabled
+
+    def enabled_with(self, overrides):
+        snapshot = _SNAPSHOT
+
+        if not (snapshot.enabled if overrides.enabled is None else overrides.enabled):
             return False
 
-        if self._enabled is None:
-            return _GLOBAL_SETTINGS['groups'].get(self.group, False)
+        if self._enabled is not None:
+            return self._enabled
 
-        return self._enabled
+        status = overrides.groups.get(self.group)
+
+        if status is None:
+            return snapshot.groups.get(self.group, False)
+
+        return status
 
     @enabled.setter
     def enabled(self, value):
@@ -38,6 +224,63 @@ class Settings:
         Only changes the local enabled
         """
         self._enabled = value
+        self._epoch = None
+        REGISTRY.refresh()
+
+    @property
+    def sampling_rate(self):
+        """
+        Returns the fraction of calls validated in the group
+        """
+        rate = self.get_sampling_rate()
+
+        return rate if rate is not None else 1.0
+
+    def get_sampling_rate(self):
+        overrides = get_overrides()
+
+        if overrides is not None and self.group in overrides.sampling:
+            return overrides.sampling[self.group]
+
+        if self._epoch != _SNAPSHOT.epoch:
+            self.resolve()
+
+        return self._sampling_rate
+
+    @property
+    def budget(self):
+        """
+        Returns the maximum fraction of time the group may spend validating or None if it is not governed
+        """
+        if self._epoch != _SNAPSHOT.epoch:
+            self.resolve()
+
+        return self._budget
+
+    @property
+    def warmup_check_rate(self):
+        """
+        Returns how often calls of warmed up functions are still fully validated
+        """
+        return _SNAPSHOT.warmup['check_rate']
+
+    @property
+    def governor_options(self):
+        """
+        Returns options of the validation overhead governor
+        """
+        return _SNAPSHOT.governor
+
+    def sample(self):
+        """
+        Returns if the current call should be validated according to the sampling rate of the group
+        """
+        rate = self.get_sampling_rate()
+
+        if rate is None or rate == 1:
+            return True
+
+        return sample(rate)
 
     @property
     def mode(self):
@@ -45,26 +288,136 @@ class Settings:
         Returns currently selected type checking mode
         If it is None, then it will return invariant
         """
-        return _GLOBAL_SETTINGS['mode'] or ModeChoices.invariant
+        overrides = get_overrides()
+
+        if overrides is not None and overrides.mode is not None:
+            return overrides.mode
+
+        if self._epoch != _SNAPSHOT.epoch:
+            self.resolve()
+
+        return self._mode
 
     @property
     def covariant(self):
         """
         Returns if covariant type checking mode is enabled
         """
-        return _GLOBAL_SETTINGS['mode'] in (ModeChoices.covariant, ModeChoices.bivariant)
+        overrides = get_overrides()
+
+        if overrides is not None and overrides.mode is not None:
+            return overrides.mode in (ModeChoices.covariant, ModeChoices.bivariant)
+
+        if self._epoch != _SNAPSHOT.epoch:
+            self.resolve()
+
+        return self._covariant
 
     @property
     def contravariant(self):
         """
         Returns if contravariant type checking mode is enabled
         """
-        return _GLOBAL_SETTINGS['mode'] in (ModeChoices.contravariant, ModeChoices.bivariant)
+        overrides = get_overrides()
+
+        if overrides is not None and overrides.mode is not None:
+            return overrides.mode in (ModeChoices.contravariant, ModeChoices.bivariant)
+
+        if self._epoch != _SNAPSHOT.epoch:
+            self.resolve()
+
+        return self._contravariant
+
+    @property
+    def extra_keys(self):
+        """
+        Returns currently selected policy for unknown keys of TypedDicts
+        """
+        return _SNAPSHOT.extra_keys
+
+    @property
+    def parallel(self):
+        """
+        Returns options of parallel validation of large containers
+        """
+        return _SNAPSHOT.parallel
+
+    @property
+    def policy(self):
+        """
+        Returns the policy for type violations of the group
+        """
+        if self._epoch != _SNAPSHOT.epoch:
+            self.resolve()
+
+        return self._policy
+
+    @property
+    def violation_options(self):
+        """
+        Returns options of logging of type violations
+        """
+        return _SNAPSHOT.violations
+
+    @property
+    def background_options(self):
+        """
+        Returns options of background validation
+        """
+        return _SNAPSHOT.background
+
+    @property
+    def trust_returns(self):
+        """
+        Returns if validated return values should be trusted by other enforced functions
+        """
+        return _SNAPSHOT.trust_returns
 
     def __bool__(self):
         return bool(self.enabled)
 
 
+def is_noop(group=None):
+    """
+    Returns if functions of the group should be left undecorated
+    Functions without a group belong to the 'default' group
+    """
+    noop = _SNAPSHOT.noop
+
+    if noop is True:
+        return True
+
+    return bool(noop) and (group or 'default') in noop
+
+
+def parse_noop(value):
+    """
+    Converts the value of the no-op environment variable to True (all groups) or a set of group names
+    """
+    value = value.strip()
+
+    if value.lower() in ('1', 'true', 'yes', 'all', '*'):
+        return True
+
+    if value.lower() in ('', '0', 'false', 'no'):
+        return frozenset()
+
+    return frozenset(name.strip() for name in value.split(',') if name.strip())
+
+
+def load_startup_config(path):
+    """
+    Applies options from a JSON file
+    """
+    with open(path, encoding='utf-8') as f:
+        options = json.load(f)
+
+    if not isinstance(options, dict):
+        raise TypeError('Startup config must be a JSON object')
+
+    config(options)
+
+
 def config(options=None, *, reset=False):
     """
     Starts the config update based on the provided dictionary of Options
@@ -86,6 +439,18 @@ def reset_config():
         'enabled': True,
         'default': True,
         'mode': ModeChoices.invariant,
+        'extra_keys': ExtraKeysChoices.ignore,
+        'trust_returns': False,
+        'parallel': None,
+        'background': None,
+        'violations': None,
+        'policies': None,
+        'sampling': None,
+        'budgets': None,
+        'governor': None,
+        'warmup': None,
+        'noop': None,
+        'modes': None,
         'groups': None}
 
     keys_to_remove = []
@@ -102,6 +467,16 @@ def reset_config():
             _GLOBAL_SETTINGS[key] = value
 
     _GLOBAL_SETTINGS['groups'].clear()
+    _GLOBAL_SETTINGS['parallel'] = dict(DEFAULT_PARALLEL_OPTIONS)
+    _GLOBAL_SETTINGS['background'] = dict(DEFAULT_BACKGROUND_OPTIONS)
+    _GLOBAL_SETTINGS['violations'] = dict(DEFAULT_VIOLATION_OPTIONS)
+    _GLOBAL_SETTINGS['policies'] = {}
+    _GLOBAL_SETTINGS['sampling'] = {}
+    _GLOBAL_SETTINGS['budgets'] = {}
+    _GLOBAL_SETTINGS['governor'] = dict(DEFAULT_GOVERNOR_OPTIONS)
+    _GLOBAL_SETTINGS['warmup'] = dict(DEFAULT_WARMUP_OPTIONS)
+    _GLOBAL_SETTINGS['noop'] = parse_noop(os.environ.get(NOOP_VARIABLE, ''))
+    _GLOBAL_SETTINGS['modes'] = {}
 
 
 def parse_config(options):
@@ -115,9 +490,44 @@ def parse_config(options):
             'disable_previous': False,
             'enable_previous': False,
             'clear_previous': False,
-            'default': None
+            'default': None,
+            'policies': {},
+            'sampling': {},
+            'budgets': {},
+            'modes': {}
+            },
+        'mode': None,
+        'extra_keys': None,
+        'trust_returns': None,
+        'noop': None,
+        'parallel': {
+            'executor': None,
+            'threshold': None,
+            'chunk_size': None,
+            'pending_chunks': None
+            },
+        'background': {
+            'queue_size': None,
+            'overflow': None,
+            'sample_rate': None,
+            'sink': None
+            },
+        'violations': {
+            'capacity': None,
+            'rate_limit': None,
+            'interval': None,
+            'sink': None,
+            'file': None
             },
-        'mode': None
+        'governor': {
+            'window': None,
+            'recovery': None,
+            'sample_rate': None,
+            'sink': None
+            },
+        'warmup': {
+            'check_rate': None
+            }
         }
 
     return merge_dictionaries(default_options, options)
@@ -126,79 +536,341 @@ def parse_config(options):
 def apply_config(options=None, reset=False):
     """
     Modifies the global settings object with a provided config updates
+
+    Updates are applied to a copy of the settings, so that an invalid update changes nothing,
+    and then published as a new snapshot at once
     """
-    if reset:
-        reset_config()
-    elif options is not None:
-        for key, value in options.items():
-            if key == 'enabled':
-                if value is not None:
-                    _GLOBAL_SETTINGS['enabled'] = value
-
-            elif key == 'groups':
-                # For x_previous options, the priority is as follows:
-                # 1. Clear
-                # 2. Enable
-                # 3. Disable
-
-                group_update = {}
-                previous_update = []
-
-                for k, v in value.items():
-                    if k == 'disable_previous':
-                        if v:
-                            previous_update.append('d')
-
-                    elif k == 'enable_previous':
-                        if v:
-                            previous_update.append('e')
-
-                    elif k == 'clear_previous':
-                        if v:
-                            previous_update.append('c')
-
-                    elif k == 'default':
-                        if v is not None:
-                            _GLOBAL_SETTINGS['default'] = value['default']
-
-                    elif k == 'set':
-                        for group_name, group_status in v.items():
-                            if group_name == 'default':
-                                raise KeyError('Cannot set \'default\' group status, use \'default\' option rather than \'set\'')
-                            if group_status is not None:
-                                group_update[group_name] = group_status
-
-                    else:
-                        raise KeyError('Unknown option for groups \'{}\''.format(k))
+    with _CONFIG_LOCK:
+        if reset:
+            reset_config()
+        elif options is not None:
+            state = {key: dict(value) if isinstance(value, dict) else value for key, value in _GLOBAL_SETTINGS.items()}
+
+            for key, value in options.items():
+                if key == 'enabled':
+                    if value is not None:
+                        state['enabled'] = value
+
+                elif key == 'groups':
+                    # For x_previous options, the priority is as follows:
+                    # 1. Clear
+                    # 2. Enable
+                    # 3. Disable
+
+                    group_update = {}
+                    group_policies = {}
+                    group_sampling = {}
+                    group_budgets = {}
+                    group_modes = {}
+                    previous_update = []
+
+                    for k, v in value.items():
+                        if k == 'disable_previous':
+                            if v:
+                                previous_update.append('d')
+
+                        elif k == 'enable_previous':
+                            if v:
+                                previous_update.append('e')
+
+                        elif k == 'clear_previous':
+                            if v:
+                                previous_update.append('c')
+
+                        elif k == 'default':
+                            if v is not None:
+                                state['default'] = value['default']
+
+                        elif k == 'policies':
+                            for group_name, policy in v.items():
+                                if policy is not None:
+                                    try:
+                                        group_policies[group_name] = PolicyChoices(policy)
+                                    except ValueError:
+                                        raise ValueError('Violation policy must be \'raise\', \'log\' or \'count\'')
+
+                        elif k == 'sampling':
+                            for group_name, rate in v.items():
+                                if rate is not None:
+                                    if isinstance(rate, bool) or not isinstance(rate, (int, float)) or not 0 <= rate <= 1:
+                                        raise ValueError('Sampling rate must be a number between 0 and 1')
+                                    group_sampling[group_name] = float(rate)
+
+                        elif k == 'modes':
+                            for group_name, mode in v.items():
+                                # A group mode cannot be removed by passing None, use False instead
+                                if mode is False:
+                                    group_modes[group_name] = None
+                                elif mode is not None:
+                                    try:
+                                        group_modes[group_name] = ModeChoices[mode]
+                                    except KeyError:
+                                        raise KeyError('Mode must be one of mode choices')
+
+                        elif k == 'budgets':
+                            for group_name, budget in v.items():
+                                # A budget cannot be removed by passing None, use False instead
+                                if budget is False:
+                                    group_budgets[group_name] = None
+                                elif budget is not None:
+                                    if isinstance(budget, bool) or not isinstance(budget, (int, float)) or not 0 < budget <= 1:
+                                        raise ValueError('Validation budget must be a number greater than 0 and at most 1')
+                                    group_budgets[group_name] = float(budget)
+
+                        elif k == 'set':
+                            for group_name, group_status in v.items():
+                                if group_name == 'default':
+                                    raise KeyError('Cannot set \'default\' group status, use \'default\' option rather than \'set\'')
+                                if group_status is not None:
+                                    group_update[group_name] = group_status
+
+                        else:
+                            raise KeyError('Unknown option for groups \'{}\''.format(k))
                 
-                if previous_update:
-                    if 'd' in previous_update:
-                        for group_name in _GLOBAL_SETTINGS['groups']:
-                            _GLOBAL_SETTINGS['groups'][group_name] = False
-
-                    if 'e' in previous_update:
-                        for group_name in _GLOBAL_SETTINGS['groups']:
-                            _GLOBAL_SETTINGS['groups'][group_name] = True
-
-                    if 'c' in previous_update:
-                        _GLOBAL_SETTINGS['groups'].clear()
-
-                _GLOBAL_SETTINGS['groups'].update(group_update)
-
-            elif key == 'mode':
-                if value is not None:
-                    try:
-                        _GLOBAL_SETTINGS['mode'] = ModeChoices[value]
-                    except KeyError:
-                        raise KeyError('Mode must be one of mode choices')
-            else:
-                raise KeyError('Unknown option \'{}\''.format(key))
+                    if previous_update:
+                        if 'd' in previous_update:
+                            for group_name in state['groups']:
+                                state['groups'][group_name] = False
+
+                        if 'e' in previous_update:
+                            for group_name in state['groups']:
+                                state['groups'][group_name] = True
+
+                        if 'c' in previous_update:
+                            state['groups'].clear()
+
+                    state['groups'].update(group_update)
+                    state['policies'].update(group_policies)
+
+                    for group_name, rate in group_sampling.items():
+                        # Fully validated groups are not stored, so that they skip sampling altogether
+                        if rate == 1:
+                            state['sampling'].pop(group_name, None)
+                        else:
+                            state['sampling'][group_name] = rate
+
+                    for group_name, mode in group_modes.items():
+                        if mode is None:
+                            state['modes'].pop(group_name, None)
+                        else:
+                            state['modes'][group_name] = mode
+
+                    for group_name, budget in group_budgets.items():
+                        if budget is None:
+                            state['budgets'].pop(group_name, None)
+                        else:
+                            state['budgets'][group_name] = budget
+
+                elif key == 'mode':
+                    if value is not None:
+                        try:
+                            state['mode'] = ModeChoices[value]
+                        except KeyError:
+                            raise KeyError('Mode must be one of mode choices')
+
+                elif key == 'extra_keys':
+                    if value is not None:
+                        try:
+                            state['extra_keys'] = ExtraKeysChoices[value]
+                        except KeyError:
+                            raise KeyError('Extra keys policy must be one of extra keys choices')
+
+                elif key == 'trust_returns':
+                    if value is not None:
+                        state['trust_returns'] = bool(value)
+
+                elif key == 'noop':
+                    if value is True or value is False:
+                        state['noop'] = True if value else frozenset()
+                    elif value is not None:
+                        if isinstance(value, str) or not all(isinstance(name, str) for name in value):
+                            raise TypeError('No-op option must be boolean or a collection of group names')
+                        state['noop'] = frozenset(value)
+
+                elif key == 'parallel':
+                    for k, v in value.items():
+                        if k == 'executor':
+                            # The executor cannot be reset to None by passing None, use False instead
+                            if v is False:
+                                state['parallel']['executor'] = None
+                            elif v is not None:
+                                state['parallel']['executor'] = v
+
+                        elif k in ('threshold', 'chunk_size', 'pending_chunks'):
+                            if v is not None:
+                                if not isinstance(v, int) or v < 1:
+                                    raise ValueError('Parallel \'{}\' option must be a positive integer'.format(k))
+                                state['parallel'][k] = v
+
+                        else:
+                            raise KeyError('Unknown option for parallel \'{}\''.format(k))
+
+                elif key == 'background':
+                    for k, v in value.items():
+                        if k == 'sink':
+                            # The sink cannot be reset to None by passing None, use False instead
+                            if v is False:
+                                state['background']['sink'] = None
+                            elif v is not None:
+                                if not callable(v):
+                                    raise TypeError('Background sink must be callable')
+                                state['background']['sink'] = v
+
+                        elif k == 'overflow':
+                            if v is not None:
+                                if v not in ('drop', 'sample'):
+                                    raise ValueError('Background overflow policy must be \'drop\' or \'sample\'')
+                                state['background']['overflow'] = v
+
+                        elif k in ('queue_size', 'sample_rate'):
+                            if v is not None:
+                                if not isinstance(v, int) or v < 1:
+                                    raise ValueError('Background \'{}\' option must be a positive integer'.format(k))
+                                state['background'][k] = v
+
+                        else:
+                            raise KeyError('Unknown option for background \'{}\''.format(k))
+
+                elif key == 'violations':
+                    for k, v in value.items():
+                        if k in ('sink', 'file'):
+                            # The sink and the file cannot be reset to None by passing None, use False instead
+                            if v is False:
+                                state['violations'][k] = None
+                            elif v is not None:
+                                if k == 'sink' and not callable(v):
+                                    raise TypeError('Violations sink must be callable')
+                                state['violations'][k] = v
+
+                        elif k in ('capacity', 'rate_limit'):
+                            if v is not None:
+                                if not isinstance(v, int) or v < 1:
+                                    raise ValueError('Violations \'{}\' option must be a positive integer'.format(k))
+                                state['violations'][k] = v
+
+                        elif k == 'interval':
+                            if v is not None:
+                                if not isinstance(v, (int, float)) or v <= 0:
+                                    raise ValueError('Violations flush interval must be a positive number')
+                                state['violations'][k] = v
+
+                        else:
+                            raise KeyError('Unknown option for violations \'{}\''.format(k))
+
+                elif key == 'governor':
+                    for k, v in value.items():
+                        if k == 'sink':
+                            # The sink cannot be reset to None by passing None, use False instead
+                            if v is False:
+                                state['governor']['sink'] = None
+                            elif v is not None:
+                                if not callable(v):
+                                    raise TypeError('Governor sink must be callable')
+                                state['governor']['sink'] = v
+
+                        elif k == 'window':
+                            if v is not None:
+                                if isinstance(v, bool) or not isinstance(v, (int, float)) or v <= 0:
+                                    raise ValueError('Governor window must be a positive number')
+                                state['governor'][k] = v
+
+                        elif k in ('recovery', 'sample_rate'):
+                            if v is not None:
+                                if isinstance(v, bool) or not isinstance(v, (int, float)) or not 0 < v <= 1:
+                                    raise ValueError('Governor \'{}\' option must be a number greater than 0 and at most 1'.format(k))
+                                state['governor'][k] = v
+
+                        else:
+                            raise KeyError('Unknown option for governor \'{}\''.format(k))
+
+                elif key == 'warmup':
+                    for k, v in value.items():
+                        if k == 'check_rate':
+                            if v is not None:
+                                if isinstance(v, bool) or not isinstance(v, int) or v < 1:
+                                    raise ValueError('Warmup check rate must be a positive integer')
+                                state['warmup'][k] = v
+
+                        else:
+                            raise KeyError('Unknown option for warmup \'{}\''.format(k))
+                else:
+                    raise KeyError('Unknown option \'{}\''.format(key))
+
+            _GLOBAL_SETTINGS.update(state)
+
+        publish_snapshot()
+
+    REGISTRY.refresh()
+
+
+def publish_snapshot():
+    """
+    Publishes an immutable snapshot of the global settings with the next epoch
+    """
+    global _SNAPSHOT
+
+    mode = _GLOBAL_SETTINGS['mode'] or ModeChoices.invariant
+    noop = _GLOBAL_SETTINGS['noop']
+
+    _SNAPSHOT = SettingsSnapshot(
+        epoch=_SNAPSHOT.epoch + 1 if _SNAPSHOT is not None else 0,
+        enabled=_GLOBAL_SETTINGS['enabled'],
+        groups=MappingProxyType(dict(_GLOBAL_SETTINGS['groups'])),
+        mode=mode,
+        modes=MappingProxyType(dict(_GLOBAL_SETTINGS['modes'])),
+        covariant=mode in (ModeChoices.covariant, ModeChoices.bivariant),
+        contravariant=mode in (ModeChoices.contravariant, ModeChoices.bivariant),
+        extra_keys=_GLOBAL_SETTINGS['extra_keys'],
+        trust_returns=_GLOBAL_SETTINGS['trust_returns'],
+        policies=MappingProxyType(dict(_GLOBAL_SETTINGS['policies'])),
+        sampling=MappingProxyType(dict(_GLOBAL_SETTINGS['sampling'])),
+        budgets=MappingProxyType(dict(_GLOBAL_SETTINGS['budgets'])),
+        parallel=MappingProxyType(dict(_GLOBAL_SETTINGS['parallel'])),
+        background=MappingProxyType(dict(_GLOBAL_SETTINGS['background'])),
+        violations=MappingProxyType(dict(_GLOBAL_SETTINGS['violations'])),
+        governor=MappingProxyType(dict(_GLOBAL_SETTINGS['governor'])),
+        warmup=MappingProxyType(dict(_GLOBAL_SETTINGS['warmup'])),
+        noop=noop if noop is True else frozenset(noop))
+
+
+def get_snapshot():
+    """
+    Returns the current snapshot of the global settings
+    """
+    return _SNAPSHOT
 
 
 _GLOBAL_SETTINGS = {
     'enabled': True,
     'default': True,
     'mode': ModeChoices.invariant,
+    'extra_keys': ExtraKeysChoices.ignore,
+    'trust_returns': False,
+    'parallel': dict(DEFAULT_PARALLEL_OPTIONS),
+    'background': dict(DEFAULT_BACKGROUND_OPTIONS),
+    'violations': dict(DEFAULT_VIOLATION_OPTIONS),
+    'policies': {},
+    'sampling': {},
+    'budgets': {},
+    'governor': dict(DEFAULT_GOVERNOR_OPTIONS),
+    'warmup': dict(DEFAULT_WARMUP_OPTIONS),
+    'noop': parse_noop(os.environ.get(NOOP_VARIABLE, '')),
+    'modes': {},
     'groups': {
         }
     }
+
+
+_CONFIG_LOCK = threading.RLock()
+
+_SNAPSHOT = None
+
+publish_snapshot()
+
+
+if os.environ.get(CONFIG_VARIABLE):
+    # A broken startup config must not break the import, the defaults stay in place instead
+    try:
+        load_startup_config(os.environ[CONFIG_VARIABLE])
+    except Exception:
+        logger.exception('Startup config %s could not be applied', os.environ[CONFIG_VARIABLE])
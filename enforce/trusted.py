@@ -0,0 +1,88 @@
+import typing
+
+from .nodes import ATOMIC_TYPES
+from .utils import IdentityTable
+
+
+# Types of containers which cannot change after creation, as long as their items cannot change either
+IMMUTABLE_CONTAINER_TYPES = frozenset([tuple, frozenset])
+
+
+# Maps trusted values to dictionaries of type hints and the modes they were validated in
+_TRUSTED_VALUES = IdentityTable(max_size=4096)
+
+
+T = typing.TypeVar('T')
+
+
+def trust(value: T, hint: typing.Any, *, frozen: bool=False, mode: typing.Any=None) -> T:
+    """
+    Marks a value as already validated against the type hint and returns the value
+    Enforced functions accept trusted values for the same type hint without validating them again
+
+    A value validated in a specific type checking mode is trusted only by functions with the same mode,
+    without a mode, the value is trusted in all modes
+    Values which can change must be marked as frozen, i.e. guaranteed not to be changed by the caller
+    """
+    if not frozen and not is_immutable(value):
+        raise ValueError('Only immutable values can be trusted, unless they are marked as frozen')
+
+    hints = _TRUSTED_VALUES.get(value)
+
+    if hints is None:
+        hints = {}
+        _TRUSTED_VALUES.set(value, hints)
+
+    hints[hint] = mode
+
+    return value
+
+
+def distrust(value: typing.Any) -> None:
+    """
+    Removes all the trust marks from the value
+    """
+    _TRUSTED_VALUES.pop(value)
+
+
+def is_trusted(value: typing.Any, hint: typing.Any, mode: typing.Any=None) -> bool:
+    """
+    Returns if the value was marked as already validated against the type hint
+    If the mode is given, values trusted in another mode are not accepted
+    """
+    if not _TRUSTED_VALUES:
+        return False
+
+    hints = _TRUSTED_VALUES.get(value)
+
+    if hints is None:
+        return False
+
+    try:
+        trusted_mode = hints[hint]
+    except (KeyError, TypeError):
+        return False
+
+    return mode is None or trusted_mode is None or trusted_mode is mode
+
+
+def is_immutable(value: typing.Any) -> bool:
+    """
+    Returns if neither the value nor any of its items can change
+    """
+    values = [value]
+
+    while values:
+        value = values.pop()
+        value_type = type(value)
+
+        if value_type in ATOMIC_TYPES:
+            continue
+
+        if value_type in IMMUTABLE_CONTAINER_TYPES:
+            values.extend(value)
+            continue
+
+        return False
+
+    return True
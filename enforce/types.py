@@ -10,6 +10,16 @@ try:
 except ImportError:
     UnionMeta = Union
 
+# Literal is a part of typing starting from Python 3.8
+# Older versions can get it from the optional typing_extensions package
+try:
+    from typing import Literal
+except ImportError:
+    try:
+        from typing_extensions import Literal
+    except ImportError:
+        Literal = None
+
 from .utils import visit
 
 
@@ -218,6 +228,38 @@ def is_type_of_type(data: Union[type, str, None],
                 return any(data in d.__mro__ for d in constraints)
 
 
+class TypeChecks:
+    """
+    Precomputed results of is_type_of_type for types of data checked against a single expected type
+
+    Results are kept separately for each variance mode, so that a node can check its data
+    with a single lookup for as long as its mode does not change
+    Only a limited number of types of data is remembered per mode, the rest is checked every time
+    """
+
+    max_size = 1024
+
+    def __init__(self, expected_type: Any) -> None:
+        self.expected_type = expected_type
+        # Indexed by covariant + 2 * contravariant
+        self.results = [{}, {}, {}, {}]
+
+    def check(self, input_type: type, covariant: bool = False, contravariant: bool = False) -> bool:
+        results = self.results[covariant + 2 * contravariant]
+
+        try:
+            return results[input_type]
+        except KeyError:
+            pass
+
+        result = is_type_of_type(input_type, self.expected_type, covariant=covariant, contravariant=contravariant)
+
+        if len(results) < self.max_size:
+            results[input_type] = result
+
+        return result
+
+
 def perform_subclasscheck(data, data_type, covariant, contravariant):
     """
     Calls a __subclasscheck__ method with provided types according to the covariant and contravariant property
@@ -322,3 +364,61 @@ def is_named_tuple(data):
 
     else:
         return True
+
+
+def is_literal(hint):
+    """
+    Returns if the type hint is a parametrised Literal type
+    """
+    return get_literal_values(hint) is not None
+
+
+def get_literal_values(hint):
+    """
+    Returns a tuple of all values allowed by the Literal type (nested Literals are flattened)
+    If the type hint is not a parametrised Literal, returns None
+    """
+    if Literal is None:
+        return None
+
+    if getattr(hint, '__origin__', None) is Literal:
+        values = hint.__args__
+    elif type(hint) is type(Literal) and getattr(hint, '__values__', None) is not None:
+        values = hint.__values__
+    else:
+        return None
+
+    flat_values = []
+
+    for value in values:
+        nested_values = get_literal_values(value)
+        if nested_values is None:
+            flat_values.append(value)
+        else:
+            flat_values.extend(nested_values)
+
+    return tuple(flat_values)
+
+
+def is_typed_dict(hint):
+    """
+    Returns if the type hint is a TypedDict class
+    """
+    return (isinstance(hint, type) and
+            issubclass(hint, dict) and
+            hasattr(hint, '__annotations__') and
+            hasattr(hint, '__total__'))
+
+
+def get_typed_dict_keys(hint):
+    """
+    Returns a tuple of sets of required and optional keys of a TypedDict class
+    """
+    try:
+        return frozenset(hint.__required_keys__), frozenset(hint.__optional_keys__)
+    except AttributeError:
+        keys = frozenset(hint.__annotations__)
+        if hint.__total__:
+            return keys, frozenset()
+        else:
+            return frozenset(), keys
@@ -1,5 +1,14 @@
 import typing
+import weakref
+import threading
 from copy import deepcopy
+from itertools import islice
+from collections import OrderedDict
+
+try:
+    from contextvars import ContextVar
+except ImportError:
+    ContextVar = None
 
 
 def visit(generator):
@@ -39,3 +48,136 @@ def merge_dictionaries(original_data, update, merge_lists=False):
             merged_data[key] = value
 
     return merged_data
+
+
+def sample_items(data, length, size=16):
+    """
+    Returns a tuple of items of a list or of keys and values of a dictionary sampled from its first 'length' items
+    They are compared by identity in order to detect changes of an append-only container
+
+    Lists are sampled evenly, dictionaries cannot be accessed by index, so their first items are sampled
+    The last item is always sampled: a deletion followed by an insertion keeps the length but changes the last item
+    """
+    if not length:
+        return ()
+
+    if isinstance(data, dict):
+        items = list(islice(data.items(), min(length, size)))
+        if length > size:
+            items.extend(islice(data.items(), length - 1, length))
+        return tuple(item for pair in items for item in pair)
+
+    step = max(length // size, 1)
+    indices = list(range(0, length, step))
+    indices.append(length - 1)
+
+    return tuple(data[i] for i in indices)
+
+
+class IdentityTable:
+    """
+    A bounded mapping from objects (compared by identity) to arbitrary values
+
+    Objects supporting weak references are referenced weakly
+    All the other objects are kept alive while they are in the table, so that their ids cannot be reused
+    Once the size limit is reached, the least recently stored entries are dropped
+    Updates are guarded by a lock, so that the table can be shared by threads
+    """
+
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, obj, default=None):
+        """
+        Returns a value stored for the object or default if there is none
+        """
+        try:
+            reference, value = self.entries[id(obj)]
+        except KeyError:
+            return default
+
+        if reference is obj or (type(reference) is weakref.ref and reference() is obj):
+            return value
+
+        return default
+
+    def set(self, obj, value):
+        """
+        Stores a value for the object, dropping the oldest entries if there is no space left
+        """
+        try:
+            reference = weakref.ref(obj)
+        except TypeError:
+            reference = obj
+
+        key = id(obj)
+
+        with self.lock:
+            self.entries[key] = (reference, value)
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def pop(self, obj, default=None):
+        """
+        Removes the object from the table, returning its value or default if there is none
+        """
+        with self.lock:
+            value = self.get(obj, self)
+
+            if value is self:
+                return default
+
+            del self.entries[id(obj)]
+
+        return value
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class ContextLocal:
+    """
+    Holds a value local to the current context
+
+    Context variables are used when available (Python 3.7+), so that every asyncio task has its own value
+    Otherwise, the value is stored per thread
+    """
+
+    def __init__(self, name: str):
+        if ContextVar is not None:
+            self.variable = ContextVar(name, default=None)
+            self.local = None
+        else:
+            self.variable = None
+            self.local = threading.local()
+
+    def get(self) -> typing.Any:
+        if self.variable is not None:
+            return self.variable.get()
+
+        return getattr(self.local, 'value', None)
+
+    def set(self, value: typing.Any) -> typing.Any:
+        """
+        Sets the current value, returns a token for restoring the previous one
+        """
+        if self.variable is not None:
+            return self.variable.set(value)
+
+        previous = getattr(self.local, 'value', None)
+        self.local.value = value
+        return previous
+
+    def reset(self, token: typing.Any) -> None:
+        if self.variable is not None:
+            self.variable.reset(token)
+        else:
+            self.local.value = token
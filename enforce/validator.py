@@ -2,20 +2,40 @@ import typing
 
 from .nodes import BaseNode
 from .parsers import get_parser
+from .settings import ModeChoices
 from .utils import visit
 
 
 class Validator:
 
-    def __init__(self, parent: typing.Optional['Validator']=None):
+    def __init__(self, parent: typing.Optional['Validator']=None, namespace: typing.Optional[typing.Dict]=None):
         self.parent = parent
+        self.namespace = namespace
         self.settings = None
+        # Shallow validation skips the items of Lists, Sets and Dicts
+        self.shallow = False
+        # The type checking mode of the settings, it is resolved once per validation pass
+        self.mode = ModeChoices.invariant
+        self.covariant = False
+        self.contravariant = False
+        self.forward_refs = {}
+        # Data validated during the current validation pass, keyed by the data identity and node identity
+        self.memo = {}
         self.errors = []
         self.globals = {}
         self.data_out = {}
         self.roots = {}
         self.all_nodes = []
 
+    @property
+    def incremental(self) -> bool:
+        """
+        Returns if append-only containers can be validated incrementally
+        Validators with TypeVars must see all the data in order to bind their type variables
+        """
+        return (self.settings is not None and self.settings.incremental and
+                not self.globals and self.parent is None)
+
     def validate(self, data: typing.Any, param_name: str) -> bool:
         """
         Validate Syntax Tree of given function using generators
@@ -32,17 +52,68 @@ class Validator:
 
         return validation_result.valid
 
+    def resolve_forward_ref(self, forward_ref) -> BaseNode:
+        """
+        Returns a syntax tree for a forward reference, parsing it only once per reference name
+        """
+        name = forward_ref.__forward_arg__
+
+        try:
+            return self.forward_refs[name]
+        except KeyError:
+            pass
+
+        if getattr(forward_ref, '__forward_evaluated__', False):
+            hint = forward_ref.__forward_value__
+        else:
+            validator = self
+            while validator.namespace is None and validator.parent is not None:
+                validator = validator.parent
+
+            try:
+                hint = eval(name, validator.namespace or {})
+            except NameError:
+                raise NameError('Cannot resolve forward reference \'{}\''.format(name))
+
+        if hint is None:
+            hint = type(None)
+
+        syntax_tree = visit(get_parser(None, hint, self))
+        self.forward_refs[name] = syntax_tree
+
+        return syntax_tree
+
+    def end_pass(self) -> None:
+        """
+        Drops all the data kept for the duration of a validation pass
+        """
+        self.memo = {}
+
     def reset(self) -> None:
         """
         Prepares the validator for yet another round of validation by clearing all the temporary data
         """
         self.errors = []
         self.data_out = {}
+        self.memo = {}
         for node in self.all_nodes:
             node.reset()
+        self.resolve_mode()
         if self.parent is not None:
             self.parent.reset()
 
+    def resolve_mode(self) -> None:
+        """
+        Reads the type checking mode from the settings, together with the overrides of the current context
+        Nodes read the resolved mode instead of the settings for every validated item
+        """
+        if self.settings is None:
+            return
+
+        self.mode = self.settings.mode
+        self.covariant = self.mode in (ModeChoices.covariant, ModeChoices.bivariant)
+        self.contravariant = self.mode in (ModeChoices.contravariant, ModeChoices.bivariant)
+
     #def __str__(self) -> str:
     #    """
     #    Returns a debugging info abuot the validator's current status
@@ -57,11 +128,14 @@ class Validator:
     #    return str_repr
 
 
-def init_validator(hints: typing.Dict, parent: typing.Optional[Validator]=None) -> Validator:
+def init_validator(hints: typing.Dict,
+                   parent: typing.Optional[Validator]=None,
+                   namespace: typing.Optional[typing.Dict]=None) -> Validator:
     """
     Returns a new validator instance from a given dictionary of type hints
+    Forward references are resolved in the given namespace
     """
-    validator = Validator(parent)
+    validator = Validator(parent, namespace)
 
     for name, hint in hints.items():
         if hint is None:
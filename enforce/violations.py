@@ -0,0 +1,194 @@
+import time
+import atexit
+import typing
+import logging
+import threading
+from collections import deque, Counter
+
+from .settings import Settings
+
+
+logger = logging.getLogger('enforce')
+
+
+Violation = typing.NamedTuple('Violation', [('function', str),
+                                            ('parameter', str),
+                                            ('hint', str),
+                                            ('actual_type', str),
+                                            ('count', int),
+                                            ('time', float)])
+
+
+class ViolationLog:
+    """
+    Collects type violations without blocking the functions which caused them
+
+    Violations are kept in a bounded ring buffer and written out by a background flusher
+    Repeated violations (the same function, parameter and actual type) are only counted until the next flush
+    New violations over the rate limit are only counted as suppressed
+    The buffer and the pending counts are only changed under a lock, flush swaps them for empty ones at once
+    Only the MAX_COUNTS most frequent violations are counted, the rarest are dropped once there are more
+    """
+
+    MAX_COUNTS = 10000
+
+    def __init__(self):
+        self.settings = Settings()
+        self.buffer = deque(maxlen=self.options['capacity'])
+        self.pending = {}
+        self.counts = Counter()
+        self.suppressed = 0
+        self.dropped = 0
+        self.tokens = float(self.options['rate_limit'])
+        self.last_refill = time.monotonic()
+        self.flusher = None
+        self.lock = threading.Lock()
+        self.flusher_lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+
+    @property
+    def options(self):
+        return self.settings.violation_options
+
+    def record(self, function, parameter, hint, actual_type, log=True):
+        """
+        Counts a violation and, if it should be logged, adds it to the buffer unless it is a duplicate
+        """
+        key = (function, parameter, actual_type)
+
+        with self.lock:
+            self.counts[key] += 1
+
+            if len(self.counts) > self.MAX_COUNTS:
+                # Keeps half of the limit, so that the counts are not trimmed again with every new violation
+                self.counts = Counter(dict(self.counts.most_common(self.MAX_COUNTS // 2)))
+
+            if not log:
+                return
+
+            try:
+                self.pending[key] += 1
+                return
+            except KeyError:
+                pass
+
+            if not self.take_token():
+                self.suppressed += 1
+                return
+
+            self.pending[key] = 1
+            self.buffer.append((key, str(hint), time.time()))
+
+        if self.flusher is None:
+            self.start_flusher()
+
+    def take_token(self):
+        """
+        Returns if a new violation can be logged within the rate limit (violations per second)
+        """
+        rate_limit = self.options['rate_limit']
+        now = time.monotonic()
+
+        self.tokens = min(float(rate_limit), self.tokens + (now - self.last_refill) * rate_limit)
+        self.last_refill = now
+
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        return True
+
+    def flush(self):
+        """
+        Writes out all the buffered violations together with the numbers of their repetitions
+        """
+        with self.flush_lock:
+            with self.lock:
+                buffer, self.buffer = self.buffer, deque(maxlen=self.options['capacity'])
+                pending, self.pending = self.pending, {}
+
+            records = []
+
+            for key, hint, timestamp in buffer:
+                function, parameter, actual_type = key
+                count = pending.pop(key, 1)
+                records.append(Violation(function, parameter, hint, actual_type, count, timestamp))
+
+            with self.lock:
+                # Violations which are still pending were overwritten in the full buffer
+                self.dropped += len(pending)
+
+            if records:
+                self.write(records)
+
+    def write(self, records):
+        options = self.options
+
+        if options['sink'] is not None:
+            options['sink'](records)
+        elif options['file'] is not None:
+            with open(options['file'], 'a') as f:
+                for record in records:
+                    f.write(format_violation(record) + '\n')
+        else:
+            for record in records:
+                logger.warning(format_violation(record))
+
+    def start_flusher(self):
+        with self.flusher_lock:
+            if self.flusher is not None:
+                return
+
+            flusher = threading.Thread(target=self.run_flusher, name='enforce-violations-flusher', daemon=True)
+            flusher.start()
+
+            self.flusher = flusher
+
+    def run_flusher(self):
+        while True:
+            time.sleep(self.options['interval'])
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('Writing of type violations failed')
+
+    def clear(self):
+        """
+        Drops all the buffered violations and resets all the counters
+        """
+        with self.flush_lock, self.lock:
+            self.buffer.clear()
+            self.pending.clear()
+            self.counts.clear()
+            self.suppressed = 0
+            self.dropped = 0
+
+
+def format_violation(record):
+    return 'Runtime type violation in {0}: {1} was not of type {2}. Actual type was {3}. ({4} times)'.format(
+        record.function,
+        'Return value' if record.parameter == 'return' else 'Argument \'{}\''.format(record.parameter),
+        record.hint,
+        record.actual_type,
+        record.count)
+
+
+VIOLATIONS = ViolationLog()
+
+atexit.register(VIOLATIONS.flush)
+
+
+def flush():
+    """
+    Writes out all the buffered violations immediately
+    """
+    VIOLATIONS.flush()
+
+
+def get_counts():
+    """
+    Returns numbers of recorded violations by (function, parameter, actual type)
+    Functions are identified by their module and qualified name, only the most frequent violations are kept
+    """
+    with VIOLATIONS.lock:
+        return dict(VIOLATIONS.counts)
@@ -0,0 +1,121 @@
+import typing
+
+
+class WarmupGuard:
+    """
+    Downgrades the validation of a function with stable argument types to a check of these types
+
+    After 'threshold' consecutive successful calls, calls with the types of arguments and of the result
+    seen during the warm-up are fully validated only once every 'check_rate' calls
+    The first failure or a new type returns the function to full validation
+    Functions whose validation transforms data (e.g. wraps callables) never warm up
+    """
+
+    def __init__(self, threshold: int):
+        self.threshold = threshold
+        self.warm = False
+        self.transforming = False
+        self.successes = 0
+        self.input_types = set()
+        self.output_types = set()
+
+        # The state of the current call: its input types, if it skips validation and if its inputs were valid
+        self.key = None
+        self.guarded_call = False
+        self.inputs_valid = False
+
+        self.calls = 0
+        self.validations = 0
+        self.guarded = 0
+        self.failures = 0
+        self.snapbacks = 0
+
+    def enter(self, args: typing.Sequence, kwargs: typing.Dict, check_rate: int) -> bool:
+        """
+        Starts a call, returns if its arguments can skip validation
+        """
+        self.calls += 1
+        self.key = key = (tuple(type(arg) for arg in args), tuple((k, type(v)) for k, v in kwargs.items()))
+        self.inputs_valid = False
+
+        if self.warm:
+            if key not in self.input_types:
+                self.snap_back()
+            elif self.calls % check_rate:
+                self.guarded_call = True
+                self.guarded += 1
+                return True
+
+        self.guarded_call = False
+        self.validations += 1
+
+        return False
+
+    def skip_output(self, output: typing.Any) -> bool:
+        """
+        Returns if the result of the current call can skip validation
+        A result of a new type is validated, returning the function to full validation
+        """
+        if not self.guarded_call:
+            return False
+
+        self.guarded_call = False
+
+        if type(output) in self.output_types:
+            return True
+
+        self.snap_back()
+
+        return False
+
+    def validated_inputs(self, transformed: bool) -> None:
+        self.inputs_valid = True
+        self.transforming = self.transforming or transformed
+
+    def validated_output(self, output: typing.Any, transformed: bool) -> None:
+        """
+        Counts a successful call, warming up the function after enough consecutive successes
+        """
+        self.transforming = self.transforming or transformed
+
+        if not self.inputs_valid:
+            # The arguments of the call were not validated
+            return
+
+        self.inputs_valid = False
+        self.successes += 1
+        self.input_types.add(self.key)
+        self.output_types.add(type(output))
+
+        if self.successes >= self.threshold and not self.transforming:
+            self.warm = True
+
+    def fail(self) -> None:
+        """
+        Returns the function to full validation after a failed validation
+        """
+        self.failures += 1
+        self.guarded_call = False
+        self.inputs_valid = False
+        self.successes = 0
+
+        if self.warm:
+            self.snap_back()
+
+    def snap_back(self) -> None:
+        self.warm = False
+        self.successes = 0
+        self.snapbacks += 1
+
+    def stats(self) -> typing.Dict:
+        """
+        Returns the state of the guard and counters of its calls
+        """
+        return {
+            'state': 'warm' if self.warm else 'cold',
+            'calls': self.calls,
+            'validations': self.validations,
+            'guarded': self.guarded,
+            'failures': self.failures,
+            'snapbacks': self.snapbacks
+        }
@@ -0,0 +1,139 @@
+import typing
+import unittest
+
+from enforce import runtime_validation, config
+from enforce.background import BackgroundValidator
+from enforce.decorators import BackgroundValidation, RunLock
+from enforce.enforcers import Parameters
+from enforce.exceptions import RuntimeTypeError
+
+
+class BackgroundValidationTests(unittest.TestCase):
+
+    def setUp(self):
+        config(reset=True)
+        self.violations = []
+        config({'background': {'sink': lambda func, error: self.violations.append((func, error))}})
+
+    def tearDown(self):
+        BackgroundValidation.flush()
+        config(reset=True)
+
+    def test_violations_are_reported(self):
+        @runtime_validation(background=True)
+        def sample(a: int) -> str:
+            return a
+
+        self.assertEqual(sample('a'), 'a')
+        self.assertEqual(sample(1), 1)
+
+        BackgroundValidation.flush()
+
+        self.assertEqual(len(self.violations), 2)
+        func, error = self.violations[0]
+        self.assertIs(func, sample.__wrapped__)
+        self.assertIsInstance(error, RuntimeTypeError)
+        self.assertIn("Argument 'a' was not of type <class 'int'>", str(error))
+        self.assertIn('Return value was not of type', str(self.violations[1][1]))
+
+    def test_valid_calls(self):
+        class Sample:
+            @runtime_validation(background=True)
+            def method(self, data: typing.List[int]) -> int:
+                return len(data)
+
+        self.assertEqual(Sample().method([1, 2]), 2)
+        self.assertEqual(Sample().method(data=[]), 0)
+
+        BackgroundValidation.flush()
+
+        self.assertEqual(self.violations, [])
+
+    def test_disabled(self):
+        @runtime_validation(background=True, group='background')
+        def sample(a: int) -> int:
+            return a
+
+        config({'groups': {'set': {'background': False}}})
+
+        sample('a')
+        BackgroundValidation.flush()
+
+        self.assertEqual(self.violations, [])
+
+    def test_overflow(self):
+        @runtime_validation(background=True)
+        def sample(a: int) -> int:
+            return a
+
+        config({'background': {'queue_size': 4}})
+
+        validator = BackgroundValidator(RunLock)
+        validator.start(queue_size=4)
+
+        # The worker cannot validate anything while the lock is taken, so the queue fills up
+        with RunLock:
+            for i in range(10):
+                validator.submit(sample.__enforcer__, Parameters(('a',), {}, False), 'a')
+
+            # The worker may have already taken one call from the queue
+            self.assertIn(validator.stats()['dropped'], (5, 6))
+
+        validator.flush()
+
+        self.assertEqual(validator.stats()['submitted'], 10)
+        self.assertEqual(validator.stats()['violations'] + validator.stats()['dropped'], 10)
+
+    def test_sampled_overflow(self):
+        @runtime_validation(background=True)
+        def sample(a: int) -> int:
+            return a
+
+        config({'background': {'overflow': 'sample', 'sample_rate': 10, 'queue_size': 100}})
+
+        validator = BackgroundValidator(RunLock)
+        validator.start(queue_size=100)
+
+        with RunLock:
+            for i in range(200):
+                validator.submit(sample.__enforcer__, Parameters((1,), {}, False), 1)
+
+            queued = validator.queue.qsize()
+
+        validator.flush()
+
+        # Half of the queue is filled by all the calls, then only every 10th call is queued
+        self.assertTrue(60 <= queued <= 70)
+        self.assertEqual(validator.stats()['submitted'], 200)
+        self.assertEqual(validator.stats()['violations'], 0)
+
+    def test_queue_size_changes(self):
+        @runtime_validation(background=True)
+        def sample(a: int) -> int:
+            return a
+
+        config({'background': {'queue_size': 4}})
+
+        validator = BackgroundValidator(RunLock)
+
+        with RunLock:
+            validator.submit(sample.__enforcer__, Parameters((1,), {}, False), 1)
+            self.assertEqual(validator.queue.maxsize, 4)
+
+            config({'background': {'queue_size': 2}})
+
+            for i in range(9):
+                validator.submit(sample.__enforcer__, Parameters((1,), {}, False), 1)
+
+            self.assertEqual(validator.queue.maxsize, 2)
+
+            # The worker may have already taken one call from the queue
+            self.assertIn(validator.stats()['dropped'], (7, 8))
+
+        validator.flush()
+
+        self.assertEqual(validator.stats()['submitted'], 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+import typing
+import unittest
+import threading
+
+from enforce import compile, check, stream, config
+from enforce import compiled
+from enforce.compiled import CompiledValidator
+from enforce.exceptions import RuntimeTypeError
+
+
+JSON = typing.Union[typing.Dict[str, 'JSON'], typing.List['JSON'], str, int, float, bool, None]
+
+
+class CompiledValidatorTests(unittest.TestCase):
+
+    def setUp(self):
+        config(reset=True)
+
+    def tearDown(self):
+        config(reset=True)
+
+    def test_is_valid(self):
+        validator = compile(typing.Dict[str, typing.List[int]])
+
+        self.assertTrue(validator.is_valid({'a': [1, 2]}))
+        self.assertTrue(validator.is_valid({}))
+        self.assertFalse(validator.is_valid({'a': [1, '2']}))
+        self.assertFalse(validator.is_valid([]))
+
+    def test_check(self):
+        validator = compile(typing.List[int])
+
+        data = [1, 2]
+        self.assertIs(validator.check(data), data)
+        self.assertIs(check(data, typing.List[int]), data)
+
+        with self.assertRaises(RuntimeTypeError) as context:
+            validator.check([1, '2'])
+
+        self.assertIn('Value was not of type typing.List[int]', str(context.exception))
+
+        with self.assertRaises(RuntimeTypeError):
+            check('a', int)
+
+    def test_validate_many(self):
+        validator = compile(typing.Optional[int])
+
+        self.assertEqual(validator.validate_many(iter([1, None, 3])), [1, None, 3])
+        self.assertEqual(validator.validate_many([]), [])
+
+        with self.assertRaises(RuntimeTypeError) as context:
+            validator.validate_many([1, None, 'a', 'b'])
+
+        self.assertIn('Item 2 was not of type', str(context.exception))
+
+    def test_type_variables(self):
+        T = typing.TypeVar('T')
+        validator = compile(typing.Tuple[T, T])
+
+        self.assertTrue(validator.is_valid((1, 2)))
+        self.assertTrue(validator.is_valid(('a', 'b')))
+        self.assertFalse(validator.is_valid((1, 'b')))
+
+    def test_cache(self):
+        self.assertIs(compile(typing.List[int]), compile(typing.List[int]))
+        self.assertIsNot(compile(typing.List[int]), compile(typing.List[str]))
+        self.assertIsInstance(compile(int), CompiledValidator)
+
+    def test_cache_size(self):
+        """
+        Verifies that the least recently used validators are dropped once the cache is full
+        """
+        size = compiled.MAX_COMPILED_VALIDATORS
+        compiled.MAX_COMPILED_VALIDATORS = 2
+
+        try:
+            validator = compile(typing.List[int])
+            other_validator = compile(typing.List[str])
+
+            self.assertIs(compile(typing.List[int]), validator)
+
+            compile(typing.List[float])
+
+            self.assertLessEqual(len(compiled._COMPILED_VALIDATORS), 2)
+            self.assertIs(compile(typing.List[int]), validator)
+            self.assertIsNot(compile(typing.List[str]), other_validator)
+        finally:
+            compiled.MAX_COMPILED_VALIDATORS = size
+
+    def test_recursive_hints(self):
+        namespace = {'JSON': JSON}
+        validator = compile(JSON, namespace)
+
+        self.assertIs(compile(JSON, namespace), validator)
+        self.assertTrue(validator.is_valid({'a': [1, 2.0, 'b', None, {'c': [[], {}]}]}))
+        self.assertFalse(validator.is_valid({'a': [1, {'b': object()}]}))
+
+        self.assertEqual(check([{'a': 1}], JSON, namespace), [{'a': 1}])
+        self.assertEqual(list(stream([1, {'a': [None]}], JSON, namespace=namespace)), [1, {'a': [None]}])
+
+        with self.assertRaises(RuntimeTypeError):
+            check({'a': {1: 'b'}}, JSON, namespace)
+
+    def test_threads(self):
+        validator = compile(typing.List[typing.Union[int, str]])
+        data = [[i, str(i)] * 50 for i in range(20)]
+        results = []
+
+        def worker():
+            results.append(all(validator.is_valid(item) for item in data))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [True] * 4)
+
+
+class StreamTests(unittest.TestCase):
+
+    def setUp(self):
+        config(reset=True)
+
+    def tearDown(self):
+        config(reset=True)
+
+    def test_lazy_validation(self):
+        pulled = []
+
+        def source():
+            for i in range(10):
+                pulled.append(i)
+                yield i
+
+        items = stream(source(), int, chunk_size=3)
+
+        self.assertEqual(pulled, [])
+        self.assertEqual(next(items), 0)
+        self.assertEqual(pulled, [0, 1, 2])
+        self.assertEqual(list(items), list(range(1, 10)))
+
+    def test_raise(self):
+        items = stream(iter([1, 2, 'a', 3]), int)
+
+        self.assertEqual(next(items), 1)
+        self.assertEqual(next(items), 2)
+
+        with self.assertRaises(RuntimeTypeError) as context:
+            next(items)
+
+        self.assertIn('Item 2 was not of type', str(context.exception))
+
+    def test_drop(self):
+        data = [[1], ['a'], [], [2, 'b'], [3]]
+
+        for chunk_size in (None, 1, 2, 10):
+            self.assertEqual(list(stream(data, typing.List[int], on_failure='drop', chunk_size=chunk_size)),
+                             [[1], [], [3]])
+
+    def test_sink(self):
+        rejected = []
+        data = [1, 'a', 2.0, 3, 'b']
+
+        result = list(stream(data, int, on_failure=lambda i, item: rejected.append((i, item)), chunk_size=2))
+
+        self.assertEqual(result, [1, 3])
+        self.assertEqual(rejected, [(1, 'a'), (2, 2.0), (4, 'b')])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            stream([], int, on_failure='ignore')
+
+        with self.assertRaises(ValueError):
+            stream([], int, chunk_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,7 @@
 import typing
 
 from enforce import runtime_validation, config
-from enforce.exceptions import RuntimeTypeError
+from enforce.exceptions import RuntimeTypeError, BatchRuntimeTypeError
 
 
 class DecoratorsTests(unittest.TestCase):
@@ -452,5 +452,129 @@ class DecoratorArgumentsTests(unittest.TestCase):
         test3(5)
 
 
+class BatchCallTests(unittest.TestCase):
+
+    def setUp(self):
+        config(reset=True)
+
+    def tearDown(self):
+        config(reset=True)
+
+    def test_map(self):
+        @runtime_validation
+        def square(a: int) -> int:
+            return a * a
+
+        self.assertEqual(square.map(range(5)), [0, 1, 4, 9, 16])
+        self.assertEqual(square.map([]), [])
+
+        with self.assertRaises(BatchRuntimeTypeError) as context:
+            square.map([1, 2, 'a', 4])
+
+        self.assertEqual(context.exception.index, 2)
+        self.assertEqual(context.exception.results, [1, 4])
+        self.assertIsInstance(context.exception, RuntimeTypeError)
+        self.assertIn('Call 2 of the batch failed', str(context.exception))
+        self.assertIn("Argument 'a' was not of type <class 'int'>", str(context.exception))
+
+    def test_starmap(self):
+        @runtime_validation
+        def join(a: str, b: typing.List[str], c: str=',') -> str:
+            return c.join([a] + b)
+
+        self.assertEqual(join.starmap([('a', ['b']), ('c', [], ';'), ('d', ['e', 'f'], '')]), ['a,b', 'c', 'def'])
+
+        with self.assertRaises(BatchRuntimeTypeError) as context:
+            join.starmap([('a', ['b']), ('c', ['d', 1])])
+
+        self.assertEqual(context.exception.index, 1)
+
+    def test_return_values(self):
+        @runtime_validation
+        def parse(a: str) -> int:
+            return int(a) if a.isdigit() else a
+
+        self.assertEqual(parse.map(['1', '2']), [1, 2])
+
+        with self.assertRaises(BatchRuntimeTypeError) as context:
+            parse.map(['1', '2', 'a'])
+
+        self.assertEqual(context.exception.index, 2)
+        self.assertIn('Return value was not of type', str(context.exception))
+
+    def test_type_variables(self):
+        T = typing.TypeVar('T')
+
+        @runtime_validation
+        def first(a: T, b: T) -> T:
+            return a
+
+        self.assertEqual(first.starmap([(1, 2), ('a', 'b')]), [1, 'a'])
+
+        with self.assertRaises(BatchRuntimeTypeError) as context:
+            first.starmap([(1, 2), ('a', 'b'), (1, 'b')])
+
+        self.assertEqual(context.exception.index, 2)
+
+    def test_disabled(self):
+        @runtime_validation(enabled=False)
+        def square(a: int) -> int:
+            return a * a
+
+        self.assertEqual(square.map([2, 2.5]), [4, 6.25])
+
+
+
+class NoopModeTests(unittest.TestCase):
+
+    def setUp(self):
+        config(reset=True)
+
+    def tearDown(self):
+        config(reset=True)
+
+    def test_noop_groups(self):
+        config({'noop': ['db']})
+
+        def foo(a: int) -> int:
+            return a
+
+        class Foo:
+            def bar(self, a: int) -> int:
+                return a
+
+        self.assertIs(runtime_validation(group='db')(foo), foo)
+        self.assertIs(runtime_validation(foo, group='db'), foo)
+        self.assertIs(runtime_validation(group='db')(Foo), Foo)
+        self.assertIs(Foo.bar, vars(Foo)['bar'])
+        self.assertFalse(hasattr(foo, '__enforcer__'))
+
+        decorated = runtime_validation(group='api')(foo)
+        self.assertIsNot(decorated, foo)
+
+        config({'groups': {'set': {'api': True}}})
+
+        with self.assertRaises(RuntimeTypeError):
+            decorated('a')
+
+    def test_noop_everything(self):
+        config({'noop': True})
+
+        def foo(a: int) -> int:
+            return a
+
+        prop = property(lambda self: 1, foo)
+
+        self.assertIs(runtime_validation(foo), foo)
+        self.assertIs(runtime_validation(foo, enabled=True), foo)
+        self.assertIs(runtime_validation(prop), prop)
+        point = typing.NamedTuple('Point', [('x', int)])
+        self.assertIs(runtime_validation(point), point)
+
+        # Arguments are still checked
+        with self.assertRaises(TypeError):
+            runtime_validation(foo, group=1)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -4,10 +4,18 @@ import numbers
 import re
 
 from enforce import runtime_validation, config
-from enforce.types import EnhancedTypeVar
+from enforce.types import EnhancedTypeVar, Literal
+
+try:
+    from typing_extensions import TypedDict
+except ImportError:
+    TypedDict = getattr(typing, 'TypedDict', None)
 from enforce.exceptions import RuntimeTypeError
 
 
+JSON = typing.Union[typing.Dict[str, 'JSON'], typing.List['JSON'], str, int, float, bool, None]
+
+
 class GeneralTests(unittest.TestCase):
     """
     A container for general tests
@@ -404,6 +412,21 @@ class ComplexTypesTests(unittest.TestCase):
         with self.assertRaises(RuntimeTypeError):
             sample_bad('')
 
+    def test_optional_union(self):
+        @runtime_validation
+        def sample(data: typing.Optional[typing.Union[int, typing.List[str]]]):
+            return data
+
+        self.assertEqual(sample(1), 1)
+        self.assertEqual(sample(['a']), ['a'])
+        self.assertIsNone(sample(None))
+
+        with self.assertRaises(RuntimeTypeError):
+            sample('')
+
+        with self.assertRaises(RuntimeTypeError):
+            sample([None])
+
     def test_tuple(self):
         @runtime_validation
         def sample(data: typing.Tuple[int, str]) -> typing.Tuple[int, str]:
@@ -695,6 +718,78 @@ class ListTypesTests(unittest.TestCase):
         with self.assertRaises(RuntimeTypeError):
             func([[12]])
 
+    def test_list_of_named_tuples(self):
+        from collections import namedtuple
+
+        Record = typing.NamedTuple('Record', [('id', int), ('name', str), ('tags', typing.List[str])])
+
+        @runtime_validation
+        def func(records: typing.List[Record]) -> typing.List[Record]:
+            return records
+
+        good = [Record(1, 'a', []), Record(2, 'b', ['x', 'y'])]
+
+        self.assertIs(func(good), good)
+        self.assertEqual(func([]), [])
+
+        with self.assertRaises(RuntimeTypeError):
+            func([Record(1, 'a', []), Record('2', 'b', [])])
+
+        with self.assertRaises(RuntimeTypeError):
+            func([Record(1, 'a', [1])])
+
+        with self.assertRaises(RuntimeTypeError):
+            func([Record(1, 'a', []), (1, 'a', [])])
+
+        with self.assertRaises(RuntimeTypeError):
+            func([namedtuple('Record', ['id', 'name', 'tags'])(1, 'a', [])])
+
+    def test_list_of_named_tuples_failures(self):
+        Record = typing.NamedTuple('Record', [('a', int), ('b', str)])
+
+        @runtime_validation
+        def func(records: typing.List[Record]):
+            return records
+
+        records = [Record(1, 'a'), Record('x', 'b'), (1, 'c'), Record(4, 4), Record('y', 5)]
+
+        expected_failures = "Record with invalid fields (row, field): (1, 'a'), (2, None), (3, 'b'), (4, 'a'), (4, 'b')"
+
+        with self.assertRaisesRegex(RuntimeTypeError, re.escape('typing.List[' + expected_failures + ']')):
+            func(records)
+
+    def test_list_of_named_tuples_reported_failures(self):
+        Record = typing.NamedTuple('Record', [('a', int), ('b', str)])
+
+        @runtime_validation
+        def func(records: typing.List[Record]):
+            return records
+
+        records = [Record(i, 'b') for i in range(100)] + [Record('x', 'b')] * 15
+
+        expected_failures = ', '.join(str((i, 'a')) for i in range(100, 110)) + ' and 5 more'
+
+        with self.assertRaisesRegex(RuntimeTypeError, re.escape(expected_failures + ']')):
+            func(records)
+
+    @unittest.skipIf(Literal is None, 'Literal types are not available')
+    def test_list_of_named_tuples_optional_and_literal_columns(self):
+        Record = typing.NamedTuple('Record', [('a', typing.Optional[int]), ('b', Literal['x', 'y'])])
+
+        @runtime_validation
+        def func(records: typing.List[Record]):
+            return records
+
+        records = [Record(1, 'x'), Record(None, 'y')]
+        self.assertIs(func(records), records)
+
+        records = [Record(1, 'x'), Record(None, 'z'), Record('2', 'y'), Record(None, 'x')]
+
+        expected_failures = "Record with invalid fields (row, field): (1, 'b'), (2, 'a')"
+
+        with self.assertRaisesRegex(RuntimeTypeError, re.escape(expected_failures)):
+            func(records)
+
 
 class UnionTypesTests(unittest.TestCase):
     """
@@ -766,6 +861,407 @@ class UnionTypesTests(unittest.TestCase):
 
         test([["a","b"],["x","y"]])
 
+    def test_wide_union(self):
+        @runtime_validation
+        def sample(data: typing.Union[int, str, bytes, float, typing.List[int], typing.List[str], None]):
+            return data
+
+        for data in (1, 'a', b'a', 1.0, [1, 2], ['a', 'b'], [], None):
+            self.assertEqual(sample(data), data)
+
+        for data in (True, [1, 'a'], {1}, (1,)):
+            with self.assertRaises(RuntimeTypeError):
+                sample(data)
+
+        config({'mode': 'covariant'})
+
+        self.assertEqual(sample(True), True)
+
+        config(reset=True)
+
+        with self.assertRaises(RuntimeTypeError):
+            sample(True)
+
+
+class EnumTypesTests(unittest.TestCase):
+
+    def setUp(self):
+        config(reset=True)
+
+    def tearDown(self):
+        config(reset=True)
+
+    def test_enum(self):
+        import enum
+
+        class Status(enum.Enum):
+            active = 1
+            disabled = 2
+
+        class Level(enum.IntEnum):
+            low = 1
+            high = 2
+
+        @runtime_validation
+        def sample(status: Status, level: typing.Optional[Level] = None) -> Status:
+            return status
+
+        self.assertIs(sample(Status.active), Status.active)
+        self.assertIs(sample(Status.disabled, Level.high), Status.disabled)
+
+        with self.assertRaises(RuntimeTypeError):
+            sample(1)
+
+        with self.assertRaises(RuntimeTypeError):
+            sample(Level.low)
+
+        with self.assertRaises(RuntimeTypeError):
+            sample(Status.active, 1)
+
+
+@unittest.skipIf(Literal is None, 'Literal types are not available')
+class LiteralTypesTests(unittest.TestCase):
+
+    def setUp(self):
+        config(reset=True)
+
+    def tearDown(self):
+        config(reset=True)
+
+    def test_literal(self):
+        @runtime_validation
+        def sample(opcode: Literal['get', 'set', 1]) -> Literal['ok', None]:
+            return 'ok' if opcode != 1 else None
+
+        self.assertEqual(sample('get'), 'ok')
+        self.assertEqual(sample('set'), 'ok')
+        self.assertIsNone(sample(1))
+
+        for opcode in ('del', 1.0, True, 2, [], None):
+            with self.assertRaises(RuntimeTypeError):
+                sample(opcode)
+
+    def test_literal_exception(self):
+        @runtime_validation
+        def sample(opcode: Literal['get', 'set']):
+            return opcode
+
+        with self.assertRaisesRegex(RuntimeTypeError, re.escape("Actual type was Literal['del']")):
+            sample('del')
+
+        with self.assertRaisesRegex(RuntimeTypeError, re.escape("Actual type was int")):
+            sample(1)
+
+    def test_nested_literal(self):
+        @runtime_validation
+        def sample(opcode: typing.List[Literal[Literal[1, 2], 3]]):
+            return opcode
+
+        self.assertEqual(sample([1, 2, 3]), [1, 2, 3])
+
+        with self.assertRaises(RuntimeTypeError):
+            sample([1, 4])
+
+
+@unittest.skipIf(TypedDict is None, 'TypedDict types are not available')
+class TypedDictTypesTests(unittest.TestCase):
+
+    def setUp(self):
+        config(reset=True)
+
+        # Class based syntax is used for mixing required and optional keys
+        # It is executed separately as variable annotations are not supported by Python 3.5
+        template = """
+class Point(TypedDict):
+    x: int
+    y: int
+
+class Payload(Point, total=False):
+    label: str
+    tags: typing.List[str]
+"""
+        scope = {'TypedDict': TypedDict, 'typing': typing}
+        exec(template, scope)
+
+        self.Payload = scope['Payload']
+
+    def tearDown(self):
+        config(reset=True)
+
+    def test_typed_dict(self):
+        @runtime_validation
+        def sample(data: self.Payload) -> self.Payload:
+            return data
+
+        good = {'x': 1, 'y': 2}
+        self.assertIs(sample(good), good)
+        self.assertEqual(sample({'x': 1, 'y': 2, 'label': 'a', 'tags': ['b']}), {'x': 1, 'y': 2, 'label': 'a', 'tags': ['b']})
+        self.assertEqual(sample({'x': 1, 'y': 2, 'other': None}), {'x': 1, 'y': 2, 'other': None})
+
+        for bad in ({'x': 1}, {'x': 1, 'y': '2'}, {'x': 1, 'y': 2, 'tags': [1]}, [('x', 1), ('y', 2)], None):
+            with self.assertRaises(RuntimeTypeError):
+                sample(bad)
+
+    def test_typed_dict_extra_keys(self):
+        @runtime_validation
+        def sample(data: self.Payload):
+            return data
+
+        config({'extra_keys': 'forbid'})
+
+        self.assertEqual(sample({'x': 1, 'y': 2, 'label': 'a'}), {'x': 1, 'y': 2, 'label': 'a'})
+
+        with self.assertRaisesRegex(RuntimeTypeError, re.escape("'other' -> unexpected")):
+            sample({'x': 1, 'y': 2, 'other': None})
+
+    def test_typed_dict_exception(self):
+        @runtime_validation
+        def sample(data: self.Payload):
+            return data
+
+        message = "Actual type was typing.Dict with invalid keys: 'y' -> missing, 'label' -> int."
+
+        with self.assertRaisesRegex(RuntimeTypeError, re.escape(message)):
+            sample({'x': 1, 'label': 1})
+
+
+class RecursiveTypesTests(unittest.TestCase):
+
+    def setUp(self):
+        config(reset=True)
+
+    def tearDown(self):
+        config(reset=True)
+
+    def test_recursive_type(self):
+        @runtime_validation
+        def sample(document: JSON) -> JSON:
+            return document
+
+        good = {'a': [1, 2.0, 'b', None, {'c': [[], {}]}], 'd': {'e': {'f': -1}}}
+
+        self.assertEqual(sample(good), good)
+        self.assertEqual(sample([]), [])
+        self.assertEqual(sample('a'), 'a')
+        self.assertIsNone(sample(None))
+
+        for bad in ({'a': [1, (2, 3)]}, {1: 'a'}, [{'a': {'b': [b'c']}}], {'a', 'b'}):
+            with self.assertRaises(RuntimeTypeError):
+                sample(bad)
+
+    def test_deeply_nested_recursive_type(self):
+        @runtime_validation
+        def sample(document: JSON) -> JSON:
+            return document
+
+        good = []
+        for _ in range(2000):
+            good = [{'a': good}]
+
+        self.assertIs(sample(good), good)
+
+        bad = [object()]
+        for _ in range(2000):
+            bad = [{'a': bad}]
+
+        with self.assertRaises(RuntimeTypeError):
+            sample(bad)
+
+
+class IncrementalValidationTests(unittest.TestCase):
+
+    def setUp(self):
+        config(reset=True)
+
+    def tearDown(self):
+        config(reset=True)
+
+    def test_append_only_list(self):
+        @runtime_validation(incremental=True)
+        def sample(log: typing.List[int]) -> int:
+            return len(log)
+
+        log = list(range(100))
+
+        self.assertEqual(sample(log), 100)
+
+        log.extend(range(10))
+        self.assertEqual(sample(log), 110)
+
+        # Items which are not sampled are not checked again, as the list is expected to only grow
+        log[1] = 'a'
+        self.assertEqual(sample(log), 110)
+
+        log.append('b')
+        with self.assertRaises(RuntimeTypeError):
+            sample(log)
+
+        # Failed validation drops the state, so the whole list is checked again
+        log.pop()
+        with self.assertRaises(RuntimeTypeError):
+            sample(log)
+
+        log[1] = 1
+        self.assertEqual(sample(log), 110)
+
+    def test_changed_list(self):
+        @runtime_validation(incremental=True)
+        def sample(log: typing.List[int]) -> int:
+            return len(log)
+
+        log = list(range(100))
+        self.assertEqual(sample(log), 100)
+
+        # Shrinking is detected
+        log.pop()
+        log[1] = 'a'
+        with self.assertRaises(RuntimeTypeError):
+            sample(log)
+
+        log = list(range(100))
+        self.assertEqual(sample(log), 100)
+
+        # Replacement of the last validated item is detected
+        log[-1] = 'a'
+        with self.assertRaises(RuntimeTypeError):
+            sample(log)
+
+    def test_append_only_dict(self):
+        @runtime_validation(incremental=True)
+        def sample(counters: typing.Dict[str, int]) -> int:
+            return len(counters)
+
+        counters = {str(i): i for i in range(100)}
+
+        self.assertEqual(sample(counters), 100)
+
+        counters['a'] = 1
+        self.assertEqual(sample(counters), 101)
+
+        # Only the first items of dictionaries are sampled
+        counters['50'] = 'a'
+        self.assertEqual(sample(counters), 101)
+
+        counters['b'] = 'b'
+        with self.assertRaises(RuntimeTypeError):
+            sample(counters)
+
+    def test_same_length_dict_replacement(self):
+        @runtime_validation(incremental=True)
+        def sample(counters: typing.Dict[str, int]) -> int:
+            return len(counters)
+
+        counters = {str(i): i for i in range(100)}
+        self.assertEqual(sample(counters), 100)
+
+        # A deletion followed by an insertion keeps the length, but changes the last item
+        del counters['50']
+        counters['bad'] = 'x'
+        with self.assertRaises(RuntimeTypeError):
+            sample(counters)
+
+    def test_incremental_mode_is_opt_in(self):
+        @runtime_validation
+        def sample(log: typing.List[int]) -> int:
+            return len(log)
+
+        log = list(range(100))
+        self.assertEqual(sample(log), 100)
+
+        log[1] = 'a'
+        with self.assertRaises(RuntimeTypeError):
+            sample(log)
+
+        with self.assertRaises(TypeError):
+            runtime_validation(incremental=1)
+
+    def test_type_variables(self):
+        T = typing.TypeVar('T')
+
+        @runtime_validation(incremental=True)
+        def sample(log: typing.List[T], item: T) -> T:
+            return item
+
+        log = list(range(100))
+        self.assertEqual(sample(log, 1), 1)
+
+        log[1] = 'a'
+        with self.assertRaises(RuntimeTypeError):
+            sample(log, 1)
+
+
+class VarianceModesTests(unittest.TestCase):
+    """
+    Tests for the type checking modes of groups and of single functions
+    """
+
+    def setUp(self):
+        config(reset=True)
+
+    def tearDown(self):
+        config(reset=True)
+
+    def test_decorator_mode(self):
+        @runtime_validation(mode='covariant')
+        def covariant(data: numbers.Number) -> numbers.Number:
+            return data
+
+        @runtime_validation
+        def invariant(data: numbers.Number) -> numbers.Number:
+            return data
+
+        self.assertEqual(covariant(1), 1)
+        with self.assertRaises(RuntimeTypeError):
+            invariant(1)
+
+        # The mode of the function is not affected by the global one
+        config({'mode': 'contravariant'})
+        self.assertEqual(covariant(1.5), 1.5)
+
+        with self.assertRaises(TypeError):
+            runtime_validation(mode=1)
+
+        with self.assertRaises(KeyError):
+            runtime_validation(mode='hello world')(lambda: None)
+
+    def test_group_mode(self):
+        @runtime_validation(group='db')
+        def sample(data: typing.List[numbers.Number]) -> typing.List[numbers.Number]:
+            return data
+
+        config({'groups': {'set': {'db': True}}})
+
+        with self.assertRaises(RuntimeTypeError):
+            sample([1, 2.5])
+
+        config({'groups': {'modes': {'db': 'covariant'}}})
+        self.assertEqual(sample([1, 2.5]), [1, 2.5])
+
+        config({'groups': {'modes': {'db': False}}})
+        with self.assertRaises(RuntimeTypeError):
+            sample([1, 2.5])
+
+    def test_mode_changes_of_leaf_checks(self):
+        """
+        Results of type checks of the same node must not leak from one mode to another
+        """
+        @runtime_validation(group='db')
+        def sample(data: typing.List[float]) -> typing.List[float]:
+            return data
+
+        config({'groups': {'set': {'db': True}}})
+
+        self.assertEqual(sample([1.5, 2.5]), [1.5, 2.5])
+        with self.assertRaises(RuntimeTypeError):
+            sample([1.5, 2])
+
+        config({'groups': {'modes': {'db': 'covariant'}}})
+        self.assertEqual(sample([1.5, 2]), [1.5, 2])
+
+        config({'groups': {'modes': {'db': 'invariant'}}, 'mode': 'covariant'})
+        with self.assertRaises(RuntimeTypeError):
+            sample([1.5, 2])
+
 
 class ContainerTypesTests(unittest.TestCase):
     """
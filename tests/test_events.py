@@ -0,0 +1,197 @@
+import re
+import json
+import typing
+import unittest
+
+from enforce import config
+from enforce.events import EventValidator, JSONTokenizer, iter_json_events, validate_json
+from enforce.exceptions import RuntimeTypeError
+
+try:
+    from typing_extensions import TypedDict
+except ImportError:
+    TypedDict = getattr(typing, 'TypedDict', None)
+
+
+JSON = typing.Union[typing.Dict[str, 'JSON'], typing.List['JSON'], str, int, float, bool, None]
+
+
+def chunked(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class JSONTokenizerTests(unittest.TestCase):
+
+    def test_events(self):
+        document = '{"a": [1, 2.5, -3e2, true, false, null, "b\\"c"], "d": {}, "e": [[], {"f": "g"}]}'
+
+        expected_events = [
+            ('start_map', None), ('key', 'a'), ('start_array', None),
+            ('scalar', 1), ('scalar', 2.5), ('scalar', -300.0), ('scalar', True), ('scalar', False),
+            ('scalar', None), ('scalar', 'b"c'), ('end_array', None),
+            ('key', 'd'), ('start_map', None), ('end_map', None),
+            ('key', 'e'), ('start_array', None), ('start_array', None), ('end_array', None),
+            ('start_map', None), ('key', 'f'), ('scalar', 'g'), ('end_map', None), ('end_array', None),
+            ('end_map', None)
+        ]
+
+        for size in (1, 2, 3, 7, len(document)):
+            self.assertEqual(list(iter_json_events(chunked(document, size))), expected_events)
+
+        self.assertEqual(list(iter_json_events([b'["\xc3', b'\xa9"]'])),
+                         [('start_array', None), ('scalar', '\xe9'), ('end_array', None)])
+
+    def test_incremental_events(self):
+        tokenizer = JSONTokenizer()
+
+        self.assertEqual(tokenizer.feed('[12'), [('start_array', None)])
+        self.assertEqual(tokenizer.feed('3, tr'), [('scalar', 123)])
+        self.assertEqual(tokenizer.feed('ue]'), [('scalar', True), ('end_array', None)])
+        self.assertEqual(tokenizer.close(), [])
+
+    def test_invalid_documents(self):
+        for document in ('[1,]', '{"a" 1}', '[1 2]', 'tru', '1.', '{]', '[1]]', '01', '"a', '[', ''):
+            with self.assertRaises(ValueError):
+                list(iter_json_events([document]))
+
+
+class EventValidatorTests(unittest.TestCase):
+
+    def setUp(self):
+        config(reset=True)
+
+    def tearDown(self):
+        config(reset=True)
+
+    def assertValid(self, document, hint, namespace=None):
+        self.assertTrue(validate_json(chunked(json.dumps(document), 3), hint, namespace))
+
+    def assertInvalid(self, document, hint, namespace=None):
+        with self.assertRaises(RuntimeTypeError):
+            validate_json(chunked(json.dumps(document), 3), hint, namespace)
+
+    def test_simple_types(self):
+        self.assertValid(1, int)
+        self.assertValid('a', str)
+        self.assertValid(None, typing.Optional[int])
+        self.assertValid([1, 'a', None], list)
+        self.assertValid({'a': [{}]}, typing.Any)
+
+        self.assertInvalid('a', int)
+        self.assertInvalid([], dict)
+        self.assertInvalid({}, typing.List[int])
+
+    def test_containers(self):
+        hint = typing.Dict[str, typing.List[typing.Optional[int]]]
+
+        self.assertValid({'a': [1, None], 'b': []}, hint)
+        self.assertInvalid({'a': [1, 'b']}, hint)
+        self.assertInvalid({'a': {}}, hint)
+        self.assertInvalid([], hint)
+
+        self.assertValid({'1': 1}, typing.Dict[str, int])
+        self.assertInvalid({'1': 1}, typing.Dict[int, int])
+
+    def test_unions(self):
+        hint = typing.Union[typing.List[int], typing.List[str], typing.Dict[str, int]]
+
+        self.assertValid([1, 2], hint)
+        self.assertValid(['a', 'b'], hint)
+        self.assertValid([], hint)
+        self.assertValid({'a': 1}, hint)
+
+        self.assertInvalid([1, 'a'], hint)
+        self.assertInvalid({'a': 'b'}, hint)
+
+    def test_recursive_types(self):
+        namespace = {'JSON': JSON}
+
+        self.assertValid({'a': [1, 2.0, 'b', None, {'c': [[], {}]}], 'd': {'e': {'f': -1}}}, JSON, namespace)
+
+    @unittest.skipIf(TypedDict is None, 'TypedDict is not available')
+    def test_typed_dict(self):
+        template = """
+class Point(TypedDict):
+    x: int
+    y: int
+
+class Payload(Point, total=False):
+    label: str
+    tags: typing.List[str]
+"""
+        scope = {'TypedDict': TypedDict, 'typing': typing}
+        exec(template, scope)
+        payload = scope['Payload']
+
+        self.assertValid({'x': 1, 'y': 2, 'tags': ['a'], 'other': [1]}, payload)
+        self.assertInvalid({'x': 1, 'tags': ['a']}, payload)
+        self.assertInvalid({'x': 1, 'y': 2, 'tags': [1]}, payload)
+
+        config({'extra_keys': 'forbid'})
+        self.assertInvalid({'x': 1, 'y': 2, 'other': [1]}, payload)
+
+        message = "The first invalid value was at $ (missing keys: 'y')."
+        with self.assertRaisesRegex(RuntimeTypeError, re.escape(message)):
+            validate_json(['{"x": 1}'], payload)
+
+    def test_materialized_types(self):
+        hint = typing.List[typing.Tuple[int, int]]
+
+        # Arrays are decoded as lists, so they can never be Tuples
+        self.assertInvalid([[1, 2]], hint)
+
+        validator = EventValidator(typing.List[typing.Set[int]])
+        validator.feed([('start_array', None), ('end_array', None)])
+        self.assertTrue(validator.close())
+
+    def test_materialized_content_is_released(self):
+        """
+        Verifies that the content of a materialized container is not kept in the memo once the container ends
+        """
+        validator = EventValidator(typing.List[typing.Union[typing.Tuple[int, int], typing.List[int]]])
+        validator.feed([('start_array', None), ('start_array', None), ('scalar', 1), ('scalar', 2), ('end_array', None)])
+
+        self.assertEqual(validator.validator.memo, {})
+
+        validator.feed([('end_array', None)])
+        self.assertTrue(validator.close())
+
+    def test_early_failure(self):
+        def document():
+            yield '{"items": [1, 2, "a", '
+            raise AssertionError('The rest of the document must not be requested')
+
+        message = "The first invalid value was at $['items'][2] (str)."
+        with self.assertRaisesRegex(RuntimeTypeError, re.escape(message)):
+            validate_json(document(), typing.Dict[str, typing.List[int]])
+
+    def test_events(self):
+        validator = EventValidator(typing.Dict[str, typing.List[int]])
+
+        validator.start_map()
+        validator.key('a')
+        validator.start_array()
+        validator.scalar(1)
+        validator.end()
+
+        with self.assertRaises(ValueError):
+            validator.close()
+
+        with self.assertRaises(ValueError):
+            validator.scalar(1)
+
+        validator.end()
+        self.assertTrue(validator.close())
+
+        with self.assertRaises(ValueError):
+            validator.start_map()
+
+        validator.reset()
+
+        validator.start_map()
+        with self.assertRaises(RuntimeTypeError):
+            validator.key(1)
+
+
+if __name__ == '__main__':
+    unittest.main()
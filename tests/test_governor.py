@@ -0,0 +1,241 @@
+import typing
+import unittest
+
+from enforce import runtime_validation, config
+from enforce.exceptions import RuntimeTypeError
+from enforce.settings import Settings
+from enforce.governor import GOVERNOR, GovernorLevel, GroupGovernor
+
+
+class GroupGovernorTests(unittest.TestCase):
+
+    def setUp(self):
+        config(reset=True)
+        self.transitions = []
+        sink = lambda group, previous, level, overhead: self.transitions.append((group, previous, level))
+        # Every recorded call ends a window
+        config({'governor': {'window': 1e-9, 'sink': sink}})
+
+    def tearDown(self):
+        config(reset=True)
+
+    def test_step_down(self):
+        governor = GroupGovernor('db', 0.05)
+
+        governor.record('foo', 0.01, 0.09)
+        self.assertIs(governor.level, GovernorLevel.sampled)
+        self.assertAlmostEqual(governor.overhead, 0.1)
+
+        governor.record('foo', 0.01, 0.09)
+        self.assertIs(governor.level, GovernorLevel.shallow)
+
+        governor.record('foo', 0.01, 0.09)
+        self.assertIs(governor.level, GovernorLevel.off)
+
+        governor.record('foo', 0.01, 0.09)
+        self.assertIs(governor.level, GovernorLevel.off)
+
+        self.assertEqual(self.transitions, [
+            ('db', GovernorLevel.full, GovernorLevel.sampled),
+            ('db', GovernorLevel.sampled, GovernorLevel.shallow),
+            ('db', GovernorLevel.shallow, GovernorLevel.off)
+        ])
+
+    def test_step_up(self):
+        governor = GroupGovernor('db', 0.1)
+        governor.level = GovernorLevel.off
+
+        # Within the budget, but not under the recovery threshold
+        governor.record('foo', 0.07, 0.93)
+        self.assertIs(governor.level, GovernorLevel.off)
+
+        governor.record('foo', 0.0, 1.0, validated=False)
+        self.assertIs(governor.level, GovernorLevel.shallow)
+
+        governor.record('foo', 0.01, 0.99)
+        self.assertIs(governor.level, GovernorLevel.sampled)
+
+        governor.record('foo', 0.01, 0.99)
+        self.assertIs(governor.level, GovernorLevel.full)
+
+        governor.record('foo', 0.01, 0.99)
+        self.assertIs(governor.level, GovernorLevel.full)
+        self.assertEqual(governor.transitions, 3)
+
+    def test_sampled_projection(self):
+        config({'governor': {'window': 3600}})
+
+        governor = GroupGovernor('db', 0.1)
+        governor.level = GovernorLevel.sampled
+
+        # Only 1 of 10 calls was validated, so full validation would take 10 times longer
+        governor.record('foo', 0.01, 0.1)
+        for _ in range(9):
+            governor.record('foo', 0.0, 0.1, validated=False)
+
+        config({'governor': {'window': 1e-9}})
+        governor.record('foo', 0.0, 0.1, validated=False)
+
+        self.assertIs(governor.level, GovernorLevel.sampled)
+
+    def test_window(self):
+        config({'governor': {'window': 3600}})
+
+        governor = GroupGovernor('db', 0.05)
+
+        for _ in range(10):
+            governor.record('foo', 1.0, 0.1)
+
+        self.assertIs(governor.level, GovernorLevel.full)
+        self.assertEqual(governor.calls, 10)
+
+    def test_sink_uses_governor(self):
+        """
+        Verifies that the sink is called after the lock is released, so that it can read the governor
+        """
+        governor = GroupGovernor('db', 0.05)
+        stats = []
+        config({'governor': {'sink': lambda group, previous, level, overhead: stats.append(governor.stats())}})
+
+        governor.record('foo', 0.01, 0.09)
+
+        self.assertEqual(len(stats), 1)
+        self.assertEqual(stats[0]['level'], 'sampled')
+        self.assertEqual(stats[0]['transitions'], 1)
+
+    def test_stats(self):
+        governor = GroupGovernor('db', 0.5)
+
+        governor.record('foo', 0.25, 0.75)
+        governor.record('bar', 0.0, 1.0, validated=False)
+
+        stats = governor.stats()
+
+        self.assertEqual(stats['level'], 'full')
+        self.assertEqual(stats['budget'], 0.5)
+        self.assertEqual(stats['overhead'], 0.0)
+        self.assertEqual(stats['transitions'], 0)
+        self.assertEqual(stats['functions'], {
+            'foo': {'calls': 1, 'validation_time': 0.25, 'call_time': 0.75},
+            'bar': {'calls': 1, 'validation_time': 0.0, 'call_time': 1.0}
+        })
+
+
+class GovernedEnforcementTests(unittest.TestCase):
+
+    def setUp(self):
+        config(reset=True)
+        GOVERNOR.reset()
+        config({'governor': {'window': 3600}})
+
+        @runtime_validation(group='db')
+        def foo(a: typing.List[int]) -> typing.List[int]:
+            return a
+
+        self.foo = foo
+
+    def tearDown(self):
+        config(reset=True)
+        GOVERNOR.reset()
+
+    def set_level(self, level):
+        GOVERNOR.get(Settings(group='db')).level = level
+
+    def test_ungoverned(self):
+        config({'groups': {'set': {'db': True}}})
+
+        self.assertIsNone(GOVERNOR.get(Settings(group='db')))
+
+        with self.assertRaises(RuntimeTypeError):
+            self.foo(['a'])
+
+    def test_levels(self):
+        config({'groups': {'set': {'db': True}, 'budgets': {'db': 0.05}}})
+
+        with self.assertRaises(RuntimeTypeError):
+            self.foo(['a'])
+
+        self.set_level(GovernorLevel.shallow)
+
+        self.assertEqual(self.foo(['a']), ['a'])
+
+        with self.assertRaises(RuntimeTypeError):
+            self.foo('a')
+
+        self.set_level(GovernorLevel.off)
+
+        self.assertEqual(self.foo('a'), 'a')
+
+        self.set_level(GovernorLevel.full)
+
+        with self.assertRaises(RuntimeTypeError):
+            self.foo(['a'])
+
+        stats = GOVERNOR.stats()['db']
+        # Calls which raised are measured as well
+        self.assertEqual(sum(function['calls'] for function in stats['functions'].values()), 5)
+
+    def test_failed_calls(self):
+        config({'groups': {'set': {'db': True}, 'budgets': {'db': 0.05}}})
+
+        @runtime_validation(group='db')
+        def bar(a: int) -> int:
+            return str(a)
+
+        with self.assertRaises(RuntimeTypeError):
+            self.foo(['a'])
+
+        with self.assertRaises(RuntimeTypeError):
+            bar(1)
+
+        functions = GOVERNOR.stats()['db']['functions']
+        foo = next(function for name, function in functions.items() if name.endswith('foo'))
+        bar = next(function for name, function in functions.items() if name.endswith('bar'))
+
+        # The function itself is not called when its arguments are invalid
+        self.assertEqual(foo['calls'], 1)
+        self.assertGreater(foo['validation_time'], 0)
+        self.assertEqual(foo['call_time'], 0)
+
+        self.assertEqual(bar['calls'], 1)
+        self.assertGreater(bar['validation_time'], 0)
+        self.assertGreater(bar['call_time'], 0)
+
+    def test_sampled(self):
+        config({'groups': {'set': {'db': True}, 'budgets': {'db': 0.05}}, 'governor': {'sample_rate': 0.2}})
+
+        self.set_level(GovernorLevel.sampled)
+
+        failures = 0
+        for _ in range(500):
+            try:
+                self.foo(['a'])
+            except RuntimeTypeError:
+                failures += 1
+
+        self.assertTrue(50 < failures < 150)
+
+    def test_budget_change(self):
+        config({'groups': {'set': {'db': True}, 'budgets': {'db': 0.05}}})
+
+        self.set_level(GovernorLevel.off)
+        self.assertEqual(self.foo('a'), 'a')
+
+        config({'groups': {'budgets': {'db': 0.1}}})
+
+        with self.assertRaises(RuntimeTypeError):
+            self.foo('a')
+
+    def test_step_down(self):
+        transitions = []
+        sink = lambda group, previous, level, overhead: transitions.append(level)
+
+        config({'groups': {'set': {'db': True}, 'budgets': {'db': 0.01}}, 'governor': {'window': 1e-9, 'sink': sink}})
+
+        self.foo(list(range(1000)))
+
+        self.assertEqual(transitions, [GovernorLevel.sampled])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,13 +1,72 @@
+import typing
 import unittest
 from enforce.utils import visit
-from enforce.nodes import CallableNode
-from typing import Callable
+from enforce.validator import Validator, init_validator
+from enforce.nodes import CallableNode, SimpleNode, UnionNode, BranchStatistics, is_column_leaf
+from enforce.settings import Settings, config
+from typing import Callable, List, Union, TypeVar
 
 
 class NodesTests(unittest.TestCase):
     pass
 
 
+class SimpleNodeTests(unittest.TestCase):
+    def setUp(self):
+        self.validator = Validator()
+        self.validator.settings = Settings(enabled=True)
+
+    def test_column_leaves(self):
+        validator = init_validator({'a': int, 'b': typing.Optional[int], 'c': typing.Optional[List[int]], 'd': List[int]})
+
+        self.assertTrue(is_column_leaf(validator.roots['a']))
+        self.assertTrue(is_column_leaf(validator.roots['b']))
+        self.assertFalse(is_column_leaf(validator.roots['c']))
+        self.assertFalse(is_column_leaf(validator.roots['d']))
+
+        validator.settings = Settings(enabled=True)
+        self.assertEqual(validator.roots['b'].validate_column(validator, [1, None, 'a', None, 2.0]), [2, 4])
+
+    def test_validate_column(self):
+        node = SimpleNode(int)
+
+        self.assertEqual(node.validate_column(self.validator, []), [])
+        self.assertEqual(node.validate_column(self.validator, [1, 2, 3]), [])
+        self.assertEqual(node.validate_column(self.validator, [1, 'a', 3, 4.0]), [1, 3])
+        self.assertEqual(node.validate_column(self.validator, [int, 1, str]), [2])
+
+
+class UnionNodeTests(unittest.TestCase):
+    def setUp(self):
+        self.validator = init_validator({'data': Union[int, str, List[int], List[str]]})
+        self.validator.settings = Settings(enabled=True)
+        self.node = self.validator.roots['data']
+
+    def test_branches_are_sorted(self):
+        self.assertIs(type(self.node), UnionNode)
+        self.assertEqual(self.node.leaf_branches, [0, 1])
+        self.assertEqual(self.node.ambiguous_branches, [2, 3])
+
+    def test_dispatch_index(self):
+        self.assertTrue(self.validator.validate('a', 'data'))
+        self.assertTrue(self.validator.validate(1, 'data'))
+        self.assertFalse(self.validator.validate(1.0, 'data'))
+        self.assertTrue(self.validator.validate(['a'], 'data'))
+
+        self.assertEqual(self.node.dispatch_index[(False, False)], {str: (1,), int: (0,), float: (), list: ()})
+
+    def test_dispatch_index_size(self):
+        self.node.DISPATCH_INDEX_SIZE = 2
+
+        classes = [type('Dynamic{}'.format(i), (int,), {}) for i in range(5)]
+
+        for cls in classes:
+            self.assertFalse(self.validator.validate(cls(1), 'data'))
+
+        self.assertEqual(len(self.node.dispatch_index[(False, False)]), 2)
+        self.assertFalse(self.validator.validate(classes[-1](1), 'data'))
+
+
 class CallableNodeTests(unittest.TestCase):
     def setUp(self):
         self.node = CallableNode(Callable[[int], int])
@@ -43,5 +102,72 @@ class CallableNodeTests(unittest.TestCase):
         self.assertTrue(visit(self.node.validate(AddOne(), '')).valid)
 
 
+class BranchStatisticsTests(unittest.TestCase):
+    def test_reordering(self):
+        statistics = BranchStatistics(reorder_period=3)
+
+        for branch in (0, 2, 5):
+            statistics.add_branch(branch)
+
+        statistics.record(5)
+        statistics.record(2)
+        self.assertEqual(statistics.order, [0, 2, 5])
+
+        statistics.record(5)
+        self.assertEqual(statistics.order, [5, 2, 0])
+        self.assertEqual(statistics.hits, {0: 0, 2: 1, 5: 2})
+
+        statistics.record(2)
+        statistics.record(2)
+        statistics.record(0)
+        self.assertEqual(statistics.order, [2, 5, 0])
+
+    def test_ambiguous_union_branches_are_reordered(self):
+        validator = init_validator({'data': Union[List[int], List[str]]})
+        validator.settings = Settings(enabled=True)
+        node = validator.roots['data']
+        node.branch_statistics.reorder_period = 4
+
+        for _ in range(4):
+            validator.reset()
+            self.assertTrue(validator.validate(['a'], 'data'))
+
+        self.assertEqual(node.ambiguous_branches, [1, 0])
+        self.assertEqual(node.branch_statistics.hits, {0: 0, 1: 4})
+
+        validator.reset()
+        self.assertTrue(validator.validate([1], 'data'))
+        validator.reset()
+        self.assertFalse(validator.validate([1.0], 'data'))
+
+    def test_type_var_constraints_keep_declaration_order(self):
+        """
+        The constraint a TypeVar binds to must not depend on the history of calls
+        """
+        class A:
+            pass
+
+        class B(A):
+            pass
+
+        T = TypeVar('T', B, A)
+        validator = init_validator({'a': T, 'b': T})
+        validator.settings = Settings(enabled=True)
+        config({'mode': 'covariant'})
+
+        try:
+            for _ in range(BranchStatistics.REORDER_PERIOD + 1):
+                validator.reset()
+                self.assertTrue(validator.validate(A(), 'a'))
+                self.assertTrue(validator.validate(A(), 'b'))
+
+            validator.reset()
+            self.assertTrue(validator.validate(B(), 'a'))
+            self.assertFalse(validator.validate(A(), 'b'))
+            self.assertEqual([child.expected_data_type for child in validator.roots['a'].children], [B])
+        finally:
+            config(reset=True)
+
+
 if __name__ == '__main__':
     unittest.main()
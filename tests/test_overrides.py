@@ -0,0 +1,186 @@
+import typing
+import unittest
+import threading
+
+import enforce
+from enforce import runtime_validation, config
+from enforce.exceptions import RuntimeTypeError
+from enforce.overrides import get_overrides
+from enforce.settings import Settings, ModeChoices
+
+
+class OverridesTests(unittest.TestCase):
+
+    def setUp(self):
+        config(reset=True)
+
+    def tearDown(self):
+        config(reset=True)
+
+    def test_disabled(self):
+        @runtime_validation
+        def foo(a: int) -> int:
+            return a
+
+        with enforce.disabled():
+            self.assertEqual(foo('a'), 'a')
+            self.assertEqual(foo.map(['a']), ['a'])
+            self.assertFalse(Settings(enabled=True).enabled)
+
+        self.assertIsNone(get_overrides())
+
+        with self.assertRaises(RuntimeTypeError):
+            foo('a')
+
+    def test_groups(self):
+        @runtime_validation(group='db')
+        def foo(a: int) -> int:
+            return a
+
+        @runtime_validation(group='api')
+        def bar(a: int) -> int:
+            return a
+
+        config({'groups': {'set': {'api': True}}})
+
+        self.assertEqual(foo('a'), 'a')
+
+        with enforce.overrides(groups={'db': True, 'api': False}):
+            with self.assertRaises(RuntimeTypeError):
+                foo('a')
+
+            with self.assertRaises(RuntimeTypeError):
+                foo.map(['a'])
+
+            self.assertEqual(bar('a'), 'a')
+
+        self.assertEqual(foo('a'), 'a')
+
+        with self.assertRaises(RuntimeTypeError):
+            bar('a')
+
+    def test_global_switch(self):
+        @runtime_validation(group='db')
+        def foo(a: int) -> int:
+            return a
+
+        config({'enabled': False, 'groups': {'set': {'db': True}}})
+
+        self.assertEqual(foo('a'), 'a')
+
+        with enforce.overrides(enabled=True):
+            with self.assertRaises(RuntimeTypeError):
+                foo('a')
+
+    def test_nesting(self):
+        settings = Settings(group='db')
+
+        with enforce.overrides(groups={'db': True}, mode='covariant', sampling={'db': 0.5}):
+            with enforce.overrides(groups={'api': True}, sampling={'db': 0}):
+                overrides = get_overrides()
+
+                self.assertEqual(overrides.groups, {'db': True, 'api': True})
+                self.assertEqual(overrides.sampling, {'db': 0})
+                self.assertIs(overrides.mode, ModeChoices.covariant)
+                self.assertIsNone(overrides.enabled)
+                self.assertFalse(settings.sample())
+
+                with enforce.disabled():
+                    self.assertFalse(settings.enabled)
+                    self.assertIs(get_overrides().mode, ModeChoices.covariant)
+
+                self.assertTrue(settings.enabled)
+
+            self.assertEqual(settings.sampling_rate, 0.5)
+
+        self.assertIsNone(get_overrides())
+        self.assertFalse(settings.enabled)
+        self.assertEqual(settings.sampling_rate, 1.0)
+
+    def test_mode(self):
+        class A:
+            pass
+
+        class B(A):
+            pass
+
+        @runtime_validation
+        def foo(a: A) -> A:
+            return a
+
+        with self.assertRaises(RuntimeTypeError):
+            foo(B())
+
+        with enforce.overrides(mode='covariant'):
+            self.assertTrue(Settings().covariant)
+            self.assertFalse(Settings().contravariant)
+            self.assertIs(Settings().mode, ModeChoices.covariant)
+            foo(B())
+
+        with self.assertRaises(RuntimeTypeError):
+            foo(B())
+
+    def test_sampling(self):
+        @runtime_validation(group='db')
+        def foo(a: int) -> int:
+            return a
+
+        config({'groups': {'set': {'db': True}}})
+
+        with enforce.overrides(sampling={'db': 0}):
+            self.assertEqual(foo('a'), 'a')
+
+        with self.assertRaises(RuntimeTypeError):
+            foo('a')
+
+    def test_threads(self):
+        @runtime_validation
+        def foo(a: int) -> int:
+            return a
+
+        entered = threading.Event()
+        done = threading.Event()
+        results = []
+
+        def worker():
+            entered.wait()
+            try:
+                foo('a')
+            except RuntimeTypeError:
+                results.append('raised')
+            done.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+
+        with enforce.disabled():
+            entered.set()
+            done.wait()
+            self.assertEqual(foo('a'), 'a')
+
+        thread.join()
+
+        self.assertEqual(results, ['raised'])
+
+    def test_invalid_overrides(self):
+        with self.assertRaises(TypeError):
+            with enforce.overrides(enabled=1):
+                pass
+
+        with self.assertRaises(KeyError):
+            with enforce.overrides(mode='unknown'):
+                pass
+
+        with self.assertRaises(TypeError):
+            with enforce.overrides(groups={'db': None}):
+                pass
+
+        with self.assertRaises(ValueError):
+            with enforce.overrides(sampling={'db': 2}):
+                pass
+
+        self.assertIsNone(get_overrides())
+
+
+if __name__ == '__main__':
+    unittest.main()
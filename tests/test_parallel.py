@@ -0,0 +1,195 @@
+import typing
+import unittest
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor
+
+from enforce import runtime_validation, config
+from enforce.exceptions import RuntimeTypeError
+from enforce import parallel
+from enforce.parallel import is_parallel_safe, validate_chunk, get_worker_validator
+from enforce.validator import init_validator
+
+
+JSON = typing.Union[typing.Dict[str, 'JSON'], typing.List['JSON'], str, int, float, bool, None]
+
+
+class RecordingExecutor(Executor):
+    """
+    Runs tasks right away and records the maximum number of submitted tasks whose results were not taken yet
+    """
+
+    def __init__(self):
+        self.pending = 0
+        self.max_pending = 0
+        self.submitted = 0
+
+    def submit(self, fn, *args, **kwargs):
+        executor = self
+
+        class RecordingFuture(Future):
+            def result(self, timeout=None):
+                executor.pending -= 1
+                return super().result(timeout)
+
+        future = RecordingFuture()
+        future.set_result(fn(*args, **kwargs))
+
+        self.submitted += 1
+        self.pending += 1
+        self.max_pending = max(self.max_pending, self.pending)
+
+        return future
+
+
+class ParallelValidationTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = ThreadPoolExecutor(max_workers=4)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def setUp(self):
+        config(reset=True)
+        config({'parallel': {'executor': self.executor, 'threshold': 10, 'chunk_size': 4}})
+
+    def tearDown(self):
+        config(reset=True)
+
+    def test_list(self):
+        @runtime_validation
+        def sample(data: typing.List[typing.Optional[int]]) -> int:
+            return len(data)
+
+        data = [1, None] * 50
+
+        self.assertEqual(sample(data), 100)
+
+        data[77] = 'a'
+        data[93] = 'b'
+
+        with self.assertRaisesRegex(RuntimeTypeError, r'typing.List\[.*str.*\]'):
+            sample(data)
+
+    def test_dict(self):
+        @runtime_validation
+        def sample(data: typing.Dict[str, typing.List[int]]) -> typing.Dict[str, typing.List[int]]:
+            return data
+
+        data = {str(i): [i] for i in range(100)}
+
+        result = sample(data)
+        self.assertEqual(result, data)
+        self.assertIsNot(result, data)
+
+        data['50'] = ['a']
+
+        with self.assertRaises(RuntimeTypeError):
+            sample(data)
+
+    def test_small_containers(self):
+        @runtime_validation
+        def sample(data: typing.List[int]) -> int:
+            return len(data)
+
+        with self.assertRaises(RuntimeTypeError):
+            sample([1, 'a'])
+
+    def test_unsafe_nodes(self):
+        validator = init_validator({
+            'safe': typing.List[typing.Union[int, typing.Tuple[str, ...], typing.Dict[str, float]]],
+            'callable': typing.List[typing.Callable[[int], int]],
+            'type_var': typing.List[typing.TypeVar('T')]
+        })
+
+        self.assertTrue(is_parallel_safe(validator.roots['safe'], validator))
+
+        # Callables are wrapped in proxies, which take the lock when called
+        self.assertFalse(is_parallel_safe(validator.roots['callable'], validator))
+        self.assertFalse(is_parallel_safe(validator.roots['type_var'], validator))
+
+    def test_pending_chunks(self):
+        executor = RecordingExecutor()
+        config({'parallel': {'executor': executor, 'pending_chunks': 3}})
+
+        @runtime_validation
+        def sample(data: typing.List[int]) -> int:
+            return len(data)
+
+        self.assertEqual(sample(list(range(100))), 100)
+        self.assertEqual(executor.submitted, 25)
+        self.assertEqual(executor.max_pending, 3)
+
+        # The invalid item is in the third chunk, which is pending together with the next two
+        executor.submitted = 0
+        with self.assertRaises(RuntimeTypeError):
+            sample([1] * 10 + ['a'] + [1] * 89)
+        self.assertEqual(executor.submitted, 5)
+
+    def test_forward_references(self):
+        validator = init_validator({'data': typing.List[JSON]}, namespace={'JSON': JSON})
+        root = validator.roots['data']
+
+        self.assertTrue(is_parallel_safe(root, validator))
+
+        # Processes cannot resolve forward references without the namespace
+        self.assertFalse(is_parallel_safe(root, validator, processes=True))
+
+    def test_worker_options(self):
+        """
+        Verifies that worker processes apply the options received with chunks only when they change
+        """
+        applied = []
+        options = parallel._WORKER_OPTIONS
+        parallel.config = applied.append
+
+        try:
+            hints = (int,)
+            self.assertEqual(validate_chunk(hints, None, {'extra_keys': 'allow'}, [1, 2]), (['int'], None))
+            self.assertEqual(validate_chunk(hints, None, {'extra_keys': 'allow'}, [3, 'a']), (['int'], 1))
+            self.assertEqual(applied, [{'extra_keys': 'allow'}])
+
+            validate_chunk(hints, None, {'extra_keys': 'forbid'}, [1])
+            validate_chunk(hints, None, None, [1])
+            self.assertEqual(applied, [{'extra_keys': 'allow'}, {'extra_keys': 'forbid'}])
+        finally:
+            parallel.config = config
+            parallel._WORKER_OPTIONS = options
+
+    def test_worker_validators(self):
+        """
+        Verifies that workers keep only the most recently used validators
+        """
+        size = parallel.MAX_WORKER_VALIDATORS
+        parallel.MAX_WORKER_VALIDATORS = 2
+
+        try:
+            roots, validator = get_worker_validator((int,), None)
+
+            self.assertIs(get_worker_validator((int,), None)[1], validator)
+            get_worker_validator((str,), None)
+            get_worker_validator((int,), None)
+            get_worker_validator((float,), None)
+
+            self.assertEqual(len(parallel._WORKER_STATE.validators), 2)
+            self.assertIs(get_worker_validator((int,), None)[1], validator)
+        finally:
+            parallel.MAX_WORKER_VALIDATORS = size
+
+    def test_process_pool(self):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            config({'parallel': {'executor': executor}})
+
+            @runtime_validation
+            def sample(data: typing.List[int]) -> int:
+                return len(data)
+
+            self.assertEqual(sample(list(range(100))), 100)
+
+            with self.assertRaises(RuntimeTypeError):
+                sample(list(range(50)) + ['a'] + list(range(50)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,41 @@
+import typing
 import unittest
 
+from enforce.nodes import OptionalNode, SimpleNode, UnionNode
+from enforce.validator import init_validator
+
 
 class ParsersTests(unittest.TestCase):
     pass
 
 
+class UnionParserTests(unittest.TestCase):
+
+    def parse(self, hint):
+        return init_validator({'data': hint}).roots['data']
+
+    def test_union(self):
+        node = self.parse(typing.Union[int, str])
+
+        self.assertIs(type(node), UnionNode)
+        self.assertEqual([child.expected_data_type for child in node.children], [int, str])
+
+    def test_optional(self):
+        node = self.parse(typing.Optional[int])
+
+        self.assertIs(type(node), OptionalNode)
+        self.assertEqual(len(node.children), 1)
+        self.assertIs(type(node.children[0]), SimpleNode)
+        self.assertIs(node.children[0].expected_data_type, int)
+
+    def test_optional_union(self):
+        node = self.parse(typing.Union[int, None, str])
+
+        self.assertIs(type(node), OptionalNode)
+        self.assertEqual(len(node.children), 1)
+        self.assertIs(type(node.children[0]), UnionNode)
+        self.assertEqual([child.expected_data_type for child in node.children[0].children], [int, str])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,116 @@
+import sys
+import unittest
+
+from enforce import runtime_validation, config
+from enforce.exceptions import RuntimeTypeError
+from enforce.decorators import EnforcedFunctionWrapper
+from enforce.overrides import overrides
+
+
+@runtime_validation(group='registry')
+def module_function(a: int) -> int:
+    return a
+
+
+@runtime_validation(group='registry')
+class ModuleClass:
+
+    def method(self, a: int) -> int:
+        return a
+
+    @staticmethod
+    def static_method(a: int) -> int:
+        return a
+
+
+module = sys.modules[__name__]
+
+
+class WrapperRegistryTests(unittest.TestCase):
+
+    def setUp(self):
+        config(reset=True)
+        config({'groups': {'set': {'registry': True}}})
+        self.wrapper = vars(module)['module_function']
+        self.method_wrapper = vars(ModuleClass)['method']
+
+    def tearDown(self):
+        config(reset=True)
+        config({'groups': {'set': {'registry': True}}})
+
+    def test_bypass_functions(self):
+        config({'groups': {'set': {'registry': False}}})
+
+        # Disabled functions stay in their modules and classes, their wrappers pass the calls through
+        self.assertIsInstance(module_function, EnforcedFunctionWrapper)
+        self.assertIs(vars(module)['module_function'], self.wrapper)
+        self.assertIs(vars(ModuleClass)['method'], self.method_wrapper)
+        self.assertTrue(self.wrapper.__enforcer__.bypassed)
+        self.assertEqual(module_function('a'), 'a')
+        self.assertEqual(ModuleClass().method('a'), 'a')
+        self.assertEqual(ModuleClass.static_method('a'), 'a')
+
+        config({'groups': {'set': {'registry': True}}})
+
+        self.assertFalse(self.wrapper.__enforcer__.bypassed)
+
+        with self.assertRaises(RuntimeTypeError):
+            module_function('a')
+
+        with self.assertRaises(RuntimeTypeError):
+            ModuleClass().method('a')
+
+        with self.assertRaises(RuntimeTypeError):
+            ModuleClass.static_method('a')
+
+    def test_overrides_of_bypassed_functions(self):
+        config({'groups': {'set': {'registry': False}}})
+
+        with overrides(groups={'registry': True}):
+            with self.assertRaises(RuntimeTypeError):
+                module_function('a')
+
+            with self.assertRaises(RuntimeTypeError):
+                ModuleClass().method('a')
+
+        self.assertEqual(module_function('a'), 'a')
+
+    def test_local_functions(self):
+        @runtime_validation(group='registry')
+        def foo(a: int) -> int:
+            return a
+
+        @runtime_validation(group='unknown')
+        def bar(a: int) -> int:
+            return a
+
+        self.assertFalse(foo.__enforcer__.bypassed)
+        self.assertTrue(bar.__enforcer__.bypassed)
+        self.assertEqual(bar('a'), 'a')
+        self.assertEqual(bar.map(['a']), ['a'])
+
+        config({'groups': {'set': {'registry': False}}})
+        self.assertTrue(foo.__enforcer__.bypassed)
+        self.assertEqual(foo('a'), 'a')
+
+        config({'groups': {'set': {'registry': True}}})
+        self.assertFalse(foo.__enforcer__.bypassed)
+
+        with self.assertRaises(RuntimeTypeError):
+            foo('a')
+
+    def test_local_settings(self):
+        @runtime_validation(enabled=True)
+        def foo(a: int) -> int:
+            return a
+
+        foo.__enforcer__.settings.enabled = False
+        self.assertEqual(foo('a'), 'a')
+
+        foo.__enforcer__.settings.enabled = True
+        with self.assertRaises(RuntimeTypeError):
+            foo('a')
+
+
+if __name__ == '__main__':
+    unittest.main()
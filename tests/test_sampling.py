@@ -0,0 +1,134 @@
+import unittest
+import threading
+
+from enforce import runtime_validation, config
+from enforce.exceptions import RuntimeTypeError
+from enforce.sampling import request, set_request_id, reset_request_id, get_request_id, get_fraction, sample
+
+
+class SamplingTests(unittest.TestCase):
+
+    def test_fraction(self):
+        fraction = get_fraction('request-1')
+
+        self.assertTrue(0 <= fraction < 1)
+        self.assertEqual(get_fraction('request-1'), fraction)
+        self.assertEqual(get_fraction(b'request-1'), fraction)
+        self.assertEqual(get_fraction(12), get_fraction('12'))
+        self.assertEqual(len({get_fraction(i) for i in range(100)}), 100)
+
+    def test_request_id(self):
+        self.assertIsNone(get_request_id())
+
+        with request('outer'):
+            self.assertEqual(get_request_id(), 'outer')
+
+            with request('inner'):
+                self.assertEqual(get_request_id(), 'inner')
+
+            self.assertEqual(get_request_id(), 'outer')
+
+        self.assertIsNone(get_request_id())
+
+        token = set_request_id('manual')
+        self.assertEqual(get_request_id(), 'manual')
+        reset_request_id(token)
+        self.assertIsNone(get_request_id())
+
+    def test_request_id_threads(self):
+        results = []
+
+        def worker():
+            results.append(get_request_id())
+
+        with request('main'):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+
+        self.assertEqual(results, [None])
+
+    def test_deterministic_sampling(self):
+        for i in range(100):
+            with request(i):
+                fraction = get_fraction(i)
+                decisions = [sample(rate) for rate in (0.0, 0.1, 0.5, 0.9, 1.0)]
+                self.assertEqual(decisions, [fraction < rate for rate in (0.0, 0.1, 0.5, 0.9, 1.0)])
+                self.assertEqual(decisions, [sample(rate) for rate in (0.0, 0.1, 0.5, 0.9, 1.0)])
+
+    def test_random_sampling(self):
+        self.assertFalse(any(sample(0.0) for _ in range(100)))
+        self.assertTrue(all(sample(1.0) for _ in range(100)))
+
+        count = sum(sample(0.5) for _ in range(10000))
+        self.assertTrue(4000 < count < 6000)
+
+
+class SampledEnforcementTests(unittest.TestCase):
+
+    def setUp(self):
+        config(reset=True)
+
+    def tearDown(self):
+        config(reset=True)
+
+    def get_function(self, group):
+        @runtime_validation(group=group)
+        def foo(a: int) -> int:
+            return a
+
+        return foo
+
+    def count_failures(self, func, calls):
+        failures = 0
+        for _ in range(calls):
+            try:
+                func('a')
+            except RuntimeTypeError:
+                failures += 1
+        return failures
+
+    def test_group_rates(self):
+        db = self.get_function('db')
+        api = self.get_function('api')
+
+        config({'groups': {'set': {'db': True, 'api': True}, 'sampling': {'db': 0.1}}})
+
+        self.assertEqual(self.count_failures(api, 100), 100)
+        self.assertTrue(0 < self.count_failures(db, 1000) < 200)
+
+        config({'groups': {'sampling': {'db': 0}}})
+        self.assertEqual(self.count_failures(db, 100), 0)
+        self.assertEqual(db.map(['a', 'b']), ['a', 'b'])
+
+        config({'groups': {'sampling': {'db': 1}}})
+        self.assertEqual(self.count_failures(db, 100), 100)
+
+    def test_consistent_requests(self):
+        db = self.get_function('db')
+        api = self.get_function('api')
+
+        config({'groups': {'set': {'db': True, 'api': True}, 'sampling': {'db': 0.2, 'api': 0.5}}})
+
+        for i in range(200):
+            with request('request-{}'.format(i)):
+                db_failures = self.count_failures(db, 5)
+                api_failures = self.count_failures(api, 5)
+
+            self.assertIn(db_failures, (0, 5))
+            self.assertIn(api_failures, (0, 5))
+
+            # Requests validated in a group with a lower rate are validated in groups with higher rates as well
+            if db_failures:
+                self.assertEqual(api_failures, 5)
+
+    def test_disabled_group(self):
+        db = self.get_function('db')
+
+        config({'groups': {'set': {'db': False}, 'sampling': {'db': 1}}})
+
+        self.assertEqual(self.count_failures(db, 10), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,14 @@
+import os
+import sys
+import json
+import subprocess
+import tempfile
 import unittest
 
-from enforce.settings import Settings, _GLOBAL_SETTINGS, ModeChoices, config
+from enforce.settings import Settings, _GLOBAL_SETTINGS, ModeChoices, ExtraKeysChoices, PolicyChoices, config
+from enforce.settings import is_noop, parse_noop, load_startup_config, NOOP_VARIABLE, CONFIG_VARIABLE
+from enforce.settings import publish_snapshot, get_snapshot
+from enforce.overrides import overrides
 
 
 class SettingsTests(unittest.TestCase):
@@ -384,6 +392,498 @@ class SettingsTests(unittest.TestCase):
         with self.assertRaises(KeyError):
             config({'mode': 'hello world'})
 
+    def test_config_group_modes(self):
+        """
+        Verifies that the type checking mode can be configured per group
+        """
+        self.assertEqual(_GLOBAL_SETTINGS['modes'], {})
+
+        config({'groups': {'modes': {'db': 'covariant', 'api': 'bivariant'}}})
+        self.assertEqual(_GLOBAL_SETTINGS['modes'], {'db': ModeChoices.covariant, 'api': ModeChoices.bivariant})
+        self.assertEqual(_GLOBAL_SETTINGS['mode'], ModeChoices.invariant)
+
+        config({'groups': {'modes': {'db': None, 'api': False}}})
+        self.assertEqual(_GLOBAL_SETTINGS['modes'], {'db': ModeChoices.covariant})
+
+        with self.assertRaises(KeyError):
+            config({'groups': {'modes': {'db': 'hello world'}}})
+
+        self.assertEqual(_GLOBAL_SETTINGS['modes'], {'db': ModeChoices.covariant})
+
+        config(reset=True)
+        self.assertEqual(_GLOBAL_SETTINGS['modes'], {})
+
+    def test_mode_resolution(self):
+        """
+        Verifies that a mode set on the decorator takes precedence over the mode of the group,
+        which takes precedence over the global mode, and that overrides take precedence over all of them
+        """
+        default = Settings(enabled=True)
+        grouped = Settings(group='db')
+        local = Settings(group='db', mode='contravariant')
+
+        config({'mode': 'bivariant', 'groups': {'modes': {'db': 'covariant'}}})
+
+        self.assertEqual(default.mode, ModeChoices.bivariant)
+        self.assertEqual(grouped.mode, ModeChoices.covariant)
+        self.assertTrue(grouped.covariant)
+        self.assertFalse(grouped.contravariant)
+        self.assertEqual(local.mode, ModeChoices.contravariant)
+        self.assertFalse(local.covariant)
+        self.assertTrue(local.contravariant)
+
+        with overrides(mode='invariant'):
+            self.assertEqual(local.mode, ModeChoices.invariant)
+            self.assertFalse(grouped.covariant)
+
+        config({'groups': {'modes': {'db': False}}})
+
+        self.assertEqual(grouped.mode, ModeChoices.bivariant)
+        self.assertEqual(local.mode, ModeChoices.contravariant)
+
+        with self.assertRaises(KeyError):
+            Settings(mode='hello world')
+
+    def test_config_extra_keys(self):
+        """
+        Verifies that the policy for unknown keys of TypedDicts can be configured
+        """
+        settings = Settings(enabled=True)
+
+        self.assertEqual(settings.extra_keys, ExtraKeysChoices.ignore)
+        config({'extra_keys': 'forbid'})
+        self.assertEqual(settings.extra_keys, ExtraKeysChoices.forbid)
+        config({'extra_keys': None})
+        self.assertEqual(settings.extra_keys, ExtraKeysChoices.forbid)
+        config({'extra_keys': 'ignore'})
+        self.assertEqual(settings.extra_keys, ExtraKeysChoices.ignore)
+
+        with self.assertRaises(KeyError):
+            config({'extra_keys': 'hello world'})
+
+    def test_config_trust_returns(self):
+        """
+        Verifies that trusting of validated return values can be switched on and off
+        """
+        settings = Settings(enabled=True)
+
+        self.assertFalse(settings.trust_returns)
+        config({'trust_returns': True})
+        self.assertTrue(settings.trust_returns)
+        config({'trust_returns': None})
+        self.assertTrue(settings.trust_returns)
+        config({'trust_returns': False})
+        self.assertFalse(settings.trust_returns)
+
+    def test_config_parallel(self):
+        """
+        Verifies that options of parallel validation can be configured
+        """
+        settings = Settings(enabled=True)
+        executor = object()
+
+        self.assertIsNone(settings.parallel['executor'])
+
+        config({'parallel': {'executor': executor, 'threshold': 10}})
+        self.assertIs(settings.parallel['executor'], executor)
+        self.assertEqual(settings.parallel['threshold'], 10)
+        self.assertEqual(settings.parallel['chunk_size'], 10000)
+
+        config({'parallel': {'chunk_size': 5}})
+        self.assertIs(settings.parallel['executor'], executor)
+        self.assertEqual(settings.parallel['chunk_size'], 5)
+
+        config({'parallel': {'pending_chunks': 2}})
+        self.assertEqual(settings.parallel['pending_chunks'], 2)
+
+        config({'parallel': {'executor': False}})
+        self.assertIsNone(settings.parallel['executor'])
+
+        with self.assertRaises(ValueError):
+            config({'parallel': {'threshold': 0}})
+
+        with self.assertRaises(KeyError):
+            config({'parallel': {'workers': 4}})
+
+    def test_config_background(self):
+        """
+        Verifies that options of background validation can be configured
+        """
+        settings = Settings(enabled=True, background=True)
+        sink = lambda func, error: None
+
+        self.assertTrue(settings.background)
+        self.assertFalse(Settings(enabled=True).background)
+
+        config({'background': {'overflow': 'sample', 'sample_rate': 5, 'sink': sink}})
+        self.assertEqual(settings.background_options['overflow'], 'sample')
+        self.assertEqual(settings.background_options['sample_rate'], 5)
+        self.assertIs(settings.background_options['sink'], sink)
+
+        config({'background': {'sink': False}})
+        self.assertIsNone(settings.background_options['sink'])
+
+        with self.assertRaises(ValueError):
+            config({'background': {'overflow': 'block'}})
+
+        with self.assertRaises(ValueError):
+            config({'background': {'queue_size': 0}})
+
+        with self.assertRaises(TypeError):
+            config({'background': {'sink': 'log'}})
+
+        with self.assertRaises(KeyError):
+            config({'background': {'workers': 4}})
+
+    def test_config_policies(self):
+        """
+        Verifies that violation policies can be set per group
+        """
+        settings = Settings(group='db')
+
+        self.assertIs(settings.policy, PolicyChoices.raise_error)
+
+        config({'groups': {'policies': {'db': 'log', 'cache': 'count'}}})
+        self.assertIs(settings.policy, PolicyChoices.log)
+        self.assertIs(Settings(group='cache').policy, PolicyChoices.count)
+        self.assertIs(Settings().policy, PolicyChoices.raise_error)
+
+        config({'groups': {'policies': {'db': None}}})
+        self.assertIs(settings.policy, PolicyChoices.log)
+
+        config({'groups': {'policies': {'db': 'raise'}}})
+        self.assertIs(settings.policy, PolicyChoices.raise_error)
+
+        with self.assertRaises(ValueError):
+            config({'groups': {'policies': {'db': 'ignore'}}})
+
+    def test_config_sampling(self):
+        """
+        Verifies that sampling rates can be set per group
+        """
+        settings = Settings(group='db')
+
+        self.assertEqual(settings.sampling_rate, 1.0)
+        self.assertTrue(settings.sample())
+
+        config({'groups': {'sampling': {'db': 0, 'api': 0.5}}})
+        self.assertEqual(settings.sampling_rate, 0.0)
+        self.assertFalse(settings.sample())
+        self.assertEqual(Settings(group='api').sampling_rate, 0.5)
+        self.assertEqual(Settings().sampling_rate, 1.0)
+
+        config({'groups': {'sampling': {'db': None}}})
+        self.assertEqual(settings.sampling_rate, 0.0)
+
+        config({'groups': {'sampling': {'db': 1}}})
+        self.assertEqual(settings.sampling_rate, 1.0)
+        self.assertNotIn('db', _GLOBAL_SETTINGS['sampling'])
+
+        for rate in (-0.1, 1.5, '0.5', True):
+            with self.assertRaises(ValueError):
+                config({'groups': {'sampling': {'db': rate}}})
+
+    def test_config_budgets(self):
+        """
+        Verifies that validation budgets can be set per group
+        """
+        settings = Settings(group='db')
+
+        self.assertIsNone(settings.budget)
+
+        config({'groups': {'budgets': {'db': 0.05, 'api': 1}}})
+        self.assertEqual(settings.budget, 0.05)
+        self.assertEqual(Settings(group='api').budget, 1.0)
+        self.assertIsNone(Settings().budget)
+
+        config({'groups': {'budgets': {'db': None}}})
+        self.assertEqual(settings.budget, 0.05)
+
+        config({'groups': {'budgets': {'db': False}}})
+        self.assertIsNone(settings.budget)
+
+        for budget in (0, -0.1, 1.5, '0.5', True):
+            with self.assertRaises(ValueError):
+                config({'groups': {'budgets': {'db': budget}}})
+
+    def test_config_governor(self):
+        """
+        Verifies that options of the validation overhead governor can be configured
+        """
+        settings = Settings()
+        sink = lambda group, previous, level, overhead: None
+
+        config({'governor': {'window': 5, 'recovery': 0.25, 'sample_rate': 0.01, 'sink': sink}})
+        self.assertEqual(settings.governor_options, {'window': 5, 'recovery': 0.25, 'sample_rate': 0.01, 'sink': sink})
+
+        config({'governor': {'sink': False}})
+        self.assertIsNone(settings.governor_options['sink'])
+
+        with self.assertRaises(ValueError):
+            config({'governor': {'window': 0}})
+
+        with self.assertRaises(ValueError):
+            config({'governor': {'recovery': 2}})
+
+        with self.assertRaises(ValueError):
+            config({'governor': {'sample_rate': 0}})
+
+        with self.assertRaises(TypeError):
+            config({'governor': {'sink': 'log'}})
+
+        with self.assertRaises(KeyError):
+            config({'governor': {'budget': 0.1}})
+
+    def test_config_warmup(self):
+        """
+        Verifies that the check rate of warmed up functions can be configured
+        """
+        settings = Settings(warmup=10)
+
+        self.assertEqual(settings.warmup, 10)
+        self.assertEqual(settings.warmup_check_rate, 1000)
+
+        config({'warmup': {'check_rate': 5}})
+        self.assertEqual(settings.warmup_check_rate, 5)
+
+        config({'warmup': {'check_rate': None}})
+        self.assertEqual(settings.warmup_check_rate, 5)
+
+        with self.assertRaises(ValueError):
+            config({'warmup': {'check_rate': 0}})
+
+        with self.assertRaises(KeyError):
+            config({'warmup': {'threshold': 5}})
+
+    def test_config_noop(self):
+        """
+        Verifies that no-op mode can be set for all or some groups
+        """
+        self.assertFalse(is_noop())
+        self.assertFalse(is_noop('db'))
+
+        config({'noop': ['db', 'default']})
+        self.assertTrue(is_noop('db'))
+        self.assertTrue(is_noop())
+        self.assertFalse(is_noop('api'))
+
+        config({'noop': None})
+        self.assertTrue(is_noop('db'))
+
+        config({'noop': True})
+        self.assertTrue(is_noop('api'))
+
+        config({'noop': False})
+        self.assertFalse(is_noop('db'))
+
+        with self.assertRaises(TypeError):
+            config({'noop': 'db'})
+
+        with self.assertRaises(TypeError):
+            config({'noop': [1]})
+
+    def test_parse_noop(self):
+        """
+        Verifies parsing of the no-op environment variable
+        """
+        for value in ('1', 'true', 'TRUE', 'all', '*', ' yes '):
+            self.assertIs(parse_noop(value), True)
+
+        for value in ('', '0', 'false', 'no'):
+            self.assertEqual(parse_noop(value), frozenset())
+
+        self.assertEqual(parse_noop('db, cache,,'), frozenset(['db', 'cache']))
+
+    def test_noop_environment_variable(self):
+        """
+        Verifies that reset restores no-op mode from the environment
+        """
+        previous = os.environ.get(NOOP_VARIABLE)
+        os.environ[NOOP_VARIABLE] = 'db'
+
+        try:
+            config(reset=True)
+            self.assertTrue(is_noop('db'))
+            self.assertFalse(is_noop('api'))
+        finally:
+            if previous is None:
+                del os.environ[NOOP_VARIABLE]
+            else:
+                os.environ[NOOP_VARIABLE] = previous
+            config(reset=True)
+
+    def test_startup_config(self):
+        """
+        Verifies that options can be loaded from a JSON file
+        """
+        handle, path = tempfile.mkstemp(suffix='.json')
+
+        try:
+            with os.fdopen(handle, 'w') as f:
+                json.dump({'noop': ['db'], 'groups': {'set': {'api': True}}, 'mode': 'covariant'}, f)
+
+            load_startup_config(path)
+
+            self.assertTrue(is_noop('db'))
+            self.assertTrue(Settings(group='api').enabled)
+            self.assertIs(Settings().mode, ModeChoices.covariant)
+
+            with open(path, 'w') as f:
+                json.dump(['db'], f)
+
+            with self.assertRaises(TypeError):
+                load_startup_config(path)
+        finally:
+            os.remove(path)
+
+    def test_startup_environment(self):
+        """
+        Verifies that the environment variables are applied at import
+        """
+        handle, path = tempfile.mkstemp(suffix='.json')
+
+        try:
+            with os.fdopen(handle, 'w') as f:
+                json.dump({'noop': ['db']}, f)
+
+            script = '\n'.join([
+                'from enforce import runtime_validation',
+                'def foo(a: int) -> int: return a',
+                'print(runtime_validation(foo, group="db") is foo, runtime_validation(foo, group="api") is foo)'
+            ])
+            environment = dict(os.environ)
+            environment[CONFIG_VARIABLE] = path
+            environment.pop(NOOP_VARIABLE, None)
+
+            output = subprocess.check_output([sys.executable, '-c', script], env=environment)
+            self.assertEqual(output.split(), [b'True', b'False'])
+
+            environment[NOOP_VARIABLE] = 'all'
+            environment.pop(CONFIG_VARIABLE)
+
+            output = subprocess.check_output([sys.executable, '-c', script], env=environment)
+            self.assertEqual(output.split(), [b'True', b'True'])
+        finally:
+            os.remove(path)
+
+    def test_broken_startup_config(self):
+        """
+        Verifies that a missing or malformed startup config is logged without breaking the import
+        """
+        handle, path = tempfile.mkstemp(suffix='.json')
+
+        try:
+            with os.fdopen(handle, 'w') as f:
+                f.write('{"noop": ')
+
+            script = 'import enforce; print(enforce.config is not None)'
+            environment = dict(os.environ)
+            environment.pop(NOOP_VARIABLE, None)
+
+            for config_path in (path, path + '.missing'):
+                environment[CONFIG_VARIABLE] = config_path
+
+                process = subprocess.Popen([sys.executable, '-c', script], env=environment,
+                                           stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                output, errors = process.communicate()
+
+                self.assertEqual(process.returncode, 0)
+                self.assertEqual(output.split(), [b'True'])
+                self.assertIn(b'Startup config', errors)
+        finally:
+            os.remove(path)
+
+    def test_snapshots(self):
+        """
+        Verifies that every config update publishes a new immutable snapshot
+        """
+        snapshot = get_snapshot()
+
+        config({'mode': 'covariant', 'groups': {'set': {'db': True}}})
+
+        new_snapshot = get_snapshot()
+
+        self.assertEqual(new_snapshot.epoch, snapshot.epoch + 1)
+        self.assertIs(snapshot.mode, ModeChoices.invariant)
+        self.assertFalse(snapshot.covariant)
+        self.assertIs(new_snapshot.mode, ModeChoices.covariant)
+        self.assertTrue(new_snapshot.covariant)
+        self.assertNotIn('db', snapshot.groups)
+        self.assertTrue(new_snapshot.groups['db'])
+
+        with self.assertRaises(TypeError):
+            new_snapshot.groups['db'] = False
+
+        with self.assertRaises(TypeError):
+            new_snapshot.parallel['threshold'] = 1
+
+        with self.assertRaises(AttributeError):
+            new_snapshot.mode = ModeChoices.invariant
+
+    def test_atomic_updates(self):
+        """
+        Verifies that an invalid config update changes nothing
+        """
+        snapshot = get_snapshot()
+
+        with self.assertRaises(ValueError):
+            config({'mode': 'covariant', 'groups': {'set': {'db': True}}, 'parallel': {'threshold': 0}})
+
+        self.assertIs(get_snapshot(), snapshot)
+        self.assertIs(_GLOBAL_SETTINGS['mode'], ModeChoices.invariant)
+        self.assertEqual(_GLOBAL_SETTINGS['groups'], {})
+        self.assertFalse(Settings(group='db').enabled)
+
+    def test_resolution_per_epoch(self):
+        """
+        Verifies that group dependent settings are resolved once per snapshot
+        """
+        settings = Settings(group='db')
+
+        self.assertFalse(settings.enabled)
+        self.assertEqual(settings._epoch, get_snapshot().epoch)
+
+        config({'groups': {'set': {'db': True}, 'sampling': {'db': 0}, 'policies': {'db': 'log'}}})
+
+        self.assertNotEqual(settings._epoch, get_snapshot().epoch)
+        self.assertTrue(settings.enabled)
+        self.assertFalse(settings.sample())
+        self.assertIs(settings.policy, PolicyChoices.log)
+
+        settings.enabled = False
+        self.assertFalse(settings.enabled)
+
+        config({'enabled': False})
+        settings.enabled = True
+        self.assertFalse(settings.enabled)
+
+    def test_config_violations(self):
+        """
+        Verifies that options of logging of type violations can be configured
+        """
+        settings = Settings()
+        sink = lambda violations: None
+
+        config({'violations': {'capacity': 10, 'rate_limit': 5, 'interval': 0.5, 'sink': sink, 'file': 'log.txt'}})
+        self.assertEqual(settings.violation_options,
+                         {'capacity': 10, 'rate_limit': 5, 'interval': 0.5, 'sink': sink, 'file': 'log.txt'})
+
+        config({'violations': {'sink': False, 'file': False}})
+        self.assertIsNone(settings.violation_options['sink'])
+        self.assertIsNone(settings.violation_options['file'])
+
+        with self.assertRaises(ValueError):
+            config({'violations': {'interval': 0}})
+
+        with self.assertRaises(ValueError):
+            config({'violations': {'capacity': 'a'}})
+
+        with self.assertRaises(TypeError):
+            config({'violations': {'sink': 'log'}})
+
+        with self.assertRaises(KeyError):
+            config({'violations': {'level': 'warning'}})
+
     def test_config_unknown_option(self):
         """
         Verifies that an unknown config option throws an exception
@@ -454,7 +954,9 @@ class SettingsTests(unittest.TestCase):
         self.assertTrue(settings.covariant)
         self.assertTrue(settings.contravariant)
 
+        # Direct changes of the global settings are visible only after a new snapshot is published
         _GLOBAL_SETTINGS['mode'] = None
+        publish_snapshot()
 
         self.assertEqual(settings.mode, ModeChoices.invariant)
         self.assertFalse(settings.covariant)
@@ -505,8 +1007,26 @@ class SettingsTests(unittest.TestCase):
         self.assertTrue(_GLOBAL_SETTINGS['default'])
         self.assertEqual(_GLOBAL_SETTINGS['mode'], ModeChoices.invariant)
         self.assertEqual(_GLOBAL_SETTINGS['groups'], {})
-
-        self.assertEqual(len(_GLOBAL_SETTINGS), 4)
+        self.assertEqual(_GLOBAL_SETTINGS['extra_keys'], ExtraKeysChoices.ignore)
+        self.assertFalse(_GLOBAL_SETTINGS['trust_returns'])
+        self.assertEqual(_GLOBAL_SETTINGS['parallel'],
+                         {'executor': None, 'threshold': 100000, 'chunk_size': 10000, 'pending_chunks': 16})
+        self.assertEqual(_GLOBAL_SETTINGS['background'],
+                         {'queue_size': 1024, 'overflow': 'drop', 'sample_rate': 10, 'sink': None})
+        self.assertEqual(_GLOBAL_SETTINGS['violations'],
+                         {'capacity': 1024, 'rate_limit': 100, 'interval': 1.0, 'sink': None, 'file': None})
+        self.assertEqual(_GLOBAL_SETTINGS['policies'], {})
+        self.assertEqual(_GLOBAL_SETTINGS['sampling'], {})
+        self.assertEqual(_GLOBAL_SETTINGS['budgets'], {})
+        self.assertEqual(_GLOBAL_SETTINGS['governor'], {'window': 1.0, 'recovery': 0.5, 'sample_rate': 0.1, 'sink': None})
+
+        self.assertEqual(_GLOBAL_SETTINGS['warmup'], {'check_rate': 1000})
+
+        self.assertEqual(_GLOBAL_SETTINGS['noop'], frozenset())
+
+        self.assertEqual(_GLOBAL_SETTINGS['modes'], {})
+
+        self.assertEqual(len(_GLOBAL_SETTINGS), 16)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,186 @@
+import unittest
+import typing
+
+from enforce import runtime_validation, trust, distrust, config
+from enforce.trusted import is_trusted
+from enforce.exceptions import RuntimeTypeError
+from enforce.settings import ModeChoices
+
+
+class TrustedValuesTests(unittest.TestCase):
+
+    def setUp(self):
+        config(reset=True)
+
+    def tearDown(self):
+        config(reset=True)
+
+    def test_trust(self):
+        """
+        Verifies that values are trusted only for the hints they were marked with
+        """
+        data = (1, 2, 3)
+        hint = typing.Tuple[int, int, int]
+
+        self.assertIs(trust(data, hint), data)
+        self.assertTrue(is_trusted(data, hint))
+        self.assertFalse(is_trusted(data, typing.Tuple[str, str, str]))
+        self.assertFalse(is_trusted((1, 2, 3), hint))
+
+        distrust(data)
+        self.assertFalse(is_trusted(data, hint))
+
+    def test_mutable_values(self):
+        """
+        Verifies that values which can change are trusted only if they are marked as frozen
+        """
+        data = [1, 2, 3]
+
+        with self.assertRaises(ValueError):
+            trust(data, typing.List[int])
+
+        with self.assertRaises(ValueError):
+            trust((1, frozenset([2]), [3]), typing.Tuple[int, typing.FrozenSet[int], typing.List[int]])
+
+        self.assertFalse(is_trusted(data, typing.List[int]))
+
+        trust(data, typing.List[int], frozen=True)
+        data.append('4')
+
+        self.assertTrue(is_trusted(data, typing.List[int]))
+
+    def test_mutated_returns(self):
+        """
+        Verifies that mutable return values are not trusted, so that their later changes are detected
+        """
+        @runtime_validation
+        def foo() -> typing.List[int]:
+            return list(range(1000))
+
+        @runtime_validation
+        def bar() -> typing.List[typing.List[int]]:
+            return [[1, 2], [3]]
+
+        @runtime_validation
+        def length(data: typing.List[int]) -> int:
+            return len(data)
+
+        @runtime_validation
+        def nested_length(data: typing.List[typing.List[int]]) -> int:
+            return len(data)
+
+        config({'trust_returns': True})
+
+        data = foo()
+        self.assertFalse(is_trusted(data, typing.List[int]))
+
+        data[500] = 'oops'
+
+        with self.assertRaises(RuntimeTypeError):
+            length(data)
+
+        data = bar()
+        self.assertFalse(is_trusted(data, typing.List[typing.List[int]]))
+
+        data[0].append('oops')
+
+        with self.assertRaises(RuntimeTypeError):
+            nested_length(data)
+
+    def test_trust_modes(self):
+        """
+        Verifies that values validated in one mode are not trusted by functions with another mode
+        """
+        hint = typing.Tuple[float, ...]
+
+        @runtime_validation(mode='covariant')
+        def foo() -> typing.Tuple[float, ...]:
+            return (1,)
+
+        @runtime_validation
+        def bar(data: typing.Tuple[float, ...]) -> int:
+            return len(data)
+
+        config({'trust_returns': True})
+
+        data = foo()
+        self.assertTrue(is_trusted(data, hint))
+        self.assertTrue(is_trusted(data, hint, ModeChoices.covariant))
+        self.assertFalse(is_trusted(data, hint, ModeChoices.invariant))
+
+        with self.assertRaises(RuntimeTypeError):
+            bar(data)
+
+        # Values trusted by the caller are trusted in all modes
+        trust(data, hint)
+        self.assertTrue(is_trusted(data, hint, ModeChoices.invariant))
+        self.assertEqual(bar(data), 1)
+
+    def test_trusted_arguments(self):
+        """
+        Verifies that enforced functions skip the validation of trusted arguments
+        """
+        @runtime_validation
+        def foo(data: typing.List[int]) -> int:
+            return len(data)
+
+        data = [1, 2, '3']
+
+        with self.assertRaises(RuntimeTypeError):
+            foo(data)
+
+        # The caller takes the responsibility for the trusted data
+        trust(data, typing.List[int], frozen=True)
+        self.assertEqual(foo(data), 3)
+
+        with self.assertRaises(RuntimeTypeError):
+            foo([1, 2, '3'])
+
+        distrust(data)
+
+        with self.assertRaises(RuntimeTypeError):
+            foo(data)
+
+    def test_trusted_type_variables(self):
+        """
+        Verifies that trusted values are still validated by functions with type variables
+        """
+        T = typing.TypeVar('T')
+
+        @runtime_validation
+        def foo(a: typing.List[T], b: T) -> T:
+            return b
+
+        data = trust([1, 2], typing.List[T], frozen=True)
+
+        self.assertEqual(foo(data, 1), 1)
+
+        with self.assertRaises(RuntimeTypeError):
+            foo(data, 'a')
+
+    def test_trusted_returns(self):
+        """
+        Verifies that validated return values can be automatically trusted by other enforced functions
+        """
+        hint = typing.Tuple[int, ...]
+
+        @runtime_validation
+        def foo() -> typing.Tuple[int, ...]:
+            return tuple([1, 2, 3])
+
+        @runtime_validation
+        def bar() -> int:
+            return 1
+
+        data = foo()
+        self.assertFalse(is_trusted(data, hint))
+
+        config({'trust_returns': True})
+
+        data = foo()
+        self.assertTrue(is_trusted(data, hint))
+        self.assertFalse(is_trusted(bar(), int))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,8 @@ from collections import namedtuple
 from collections.abc import Sized
 from typing import TypeVar, Any, Tuple, Dict, List, Union, Optional, Generic, NamedTuple
 
-from enforce.types import is_type_of_type, is_named_tuple, EnhancedTypeVar, Integer, Boolean
+from enforce.types import is_type_of_type, is_named_tuple, EnhancedTypeVar, Integer, Boolean, TypeChecks
+from enforce.types import Literal, is_literal, get_literal_values
 
 
 class Animal:
@@ -822,6 +823,57 @@ class TypeCheckingUtilityTests(unittest.TestCase):
         self.assertFalse(is_named_tuple(nt4))
         self.assertFalse(is_named_tuple(nt5))
 
+    @unittest.skipIf(Literal is None, 'Literal types are not available')
+    def test_literal_values(self):
+        self.assertTrue(is_literal(Literal[1, 'a']))
+        self.assertFalse(is_literal(Literal))
+        self.assertFalse(is_literal(int))
+        self.assertFalse(is_literal(Union[int, str]))
+
+        self.assertEqual(get_literal_values(Literal[1, 'a']), (1, 'a'))
+        self.assertEqual(get_literal_values(Literal[Literal[1, 2], None]), (1, 2, None))
+        self.assertIsNone(get_literal_values(int))
+
+
+class TypeChecksTests(unittest.TestCase):
+    """
+    Tests for the precomputed type checks of nodes
+    """
+
+    def test_same_results(self):
+        data_types = [int, bool, float, complex, str, type(None), list, Animal, Pet, Chihuahua, Integer]
+        expected_types = [int, bool, float, complex, numbers.Number, Sized, object, Any, Pet, List]
+        modes = [(False, False), (True, False), (False, True), (True, True)]
+
+        for expected_type in expected_types:
+            checks = TypeChecks(expected_type)
+            for covariant, contravariant in modes:
+                for data_type in data_types:
+                    expected = is_type_of_type(data_type, expected_type, covariant=covariant, contravariant=contravariant)
+                    # The second check is answered from the precomputed results
+                    self.assertEqual(checks.check(data_type, covariant, contravariant), expected)
+                    self.assertEqual(checks.check(data_type, covariant, contravariant), expected)
+
+    def test_results_per_mode(self):
+        checks = TypeChecks(Pet)
+
+        self.assertFalse(checks.check(Chihuahua))
+        self.assertTrue(checks.check(Chihuahua, covariant=True))
+        self.assertFalse(checks.check(Animal, covariant=True))
+        self.assertTrue(checks.check(Animal, contravariant=True))
+        self.assertTrue(checks.check(Animal, covariant=True, contravariant=True))
+        self.assertFalse(checks.check(Chihuahua))
+
+    def test_size_limit(self):
+        checks = TypeChecks(Animal)
+        checks.max_size = 2
+
+        for data_type in (Animal, Pet, Chihuahua):
+            self.assertTrue(checks.check(data_type, covariant=True))
+
+        self.assertEqual(len(checks.results[1]), 2)
+        self.assertTrue(checks.check(Chihuahua, covariant=True))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,7 @@
+import threading
 import unittest
 
-from enforce.utils import visit, merge_dictionaries
+from enforce.utils import visit, merge_dictionaries, IdentityTable, sample_items
 
 
 class UtilsTests(unittest.TestCase):
@@ -57,5 +58,112 @@ class UtilsTests(unittest.TestCase):
         self.assertDictEqual(d1, {})
 
 
+class SampleItemsTests(unittest.TestCase):
+
+    def test_sample_items(self):
+        """
+        Verifies that the first and the last items of lists and dictionaries are sampled
+        """
+        data = list(range(100))
+        samples = sample_items(data, 100, size=4)
+
+        self.assertEqual(samples, (0, 25, 50, 75, 99))
+        self.assertEqual(sample_items(data, 3, size=4), (0, 1, 2, 2))
+        self.assertEqual(sample_items(data, 0), ())
+
+        data = {str(i): i for i in range(10)}
+
+        self.assertEqual(sample_items(data, 10, size=2), ('0', 0, '1', 1, '9', 9))
+        self.assertEqual(sample_items(data, 2, size=2), ('0', 0, '1', 1))
+
+
+class IdentityTableTests(unittest.TestCase):
+
+    def test_lookup_by_identity(self):
+        """
+        Verifies that values are stored per object identity rather than per object equality
+        """
+        class Sample:
+            pass
+
+        table = IdentityTable()
+        a = [1, 2]
+        b = [1, 2]
+        c = Sample()
+
+        table.set(a, 'a')
+        table.set(c, 'c')
+
+        self.assertEqual(table.get(a), 'a')
+        self.assertIsNone(table.get(b))
+        self.assertEqual(table.get(b, 'missing'), 'missing')
+        self.assertEqual(table.get(c), 'c')
+        self.assertEqual(len(table), 2)
+
+        self.assertEqual(table.pop(a), 'a')
+        self.assertIsNone(table.pop(a))
+        self.assertIsNone(table.get(a))
+
+        table.clear()
+        self.assertEqual(len(table), 0)
+
+    def test_dead_references(self):
+        """
+        Verifies that weakly referenced objects are not kept alive and their ids are not confused
+        """
+        class Sample:
+            pass
+
+        table = IdentityTable()
+        a = Sample()
+        table.set(a, 'a')
+        del a
+
+        self.assertIsNone(table.get(Sample()))
+
+    def test_size_limit(self):
+        """
+        Verifies that the oldest entries are dropped once the size limit is reached
+        """
+        table = IdentityTable(max_size=2)
+        data = [[i] for i in range(3)]
+
+        for i, item in enumerate(data):
+            table.set(item, i)
+
+        self.assertEqual(len(table), 2)
+        self.assertIsNone(table.get(data[0]))
+        self.assertEqual(table.get(data[1]), 1)
+        self.assertEqual(table.get(data[2]), 2)
+
+
+    def test_concurrent_updates(self):
+        """
+        Verifies that threads can store and remove the same objects concurrently
+        """
+        table = IdentityTable(max_size=8)
+        data = [[i] for i in range(16)]
+        errors = []
+
+        def update():
+            try:
+                for _ in range(200):
+                    for item in data:
+                        table.set(item, 1)
+                        table.pop(item)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=update) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+
 if __name__ == '__main__':
     unittest.main()
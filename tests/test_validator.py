@@ -1,8 +1,148 @@
+import typing
 import unittest
 
+from enforce.settings import Settings, ModeChoices, config
+from enforce.overrides import overrides
+from enforce.validator import init_validator
+
 
 class ValidatorTests(unittest.TestCase):
-    pass
+
+    def tearDown(self):
+        config(reset=True)
+
+    def test_mode_is_resolved_per_pass(self):
+        """
+        Verifies that the type checking mode is read from the settings only when the validator is reset
+        """
+        validator = init_validator({'data': typing.List[float]})
+        validator.settings = Settings(enabled=True)
+        validator.reset()
+
+        self.assertIs(validator.mode, ModeChoices.invariant)
+        self.assertFalse(validator.validate([1.5, 2], 'data'))
+
+        config({'mode': 'covariant'})
+
+        self.assertFalse(validator.validate([1.5, 2], 'data'))
+
+        validator.reset()
+
+        self.assertIs(validator.mode, ModeChoices.covariant)
+        self.assertTrue(validator.covariant)
+        self.assertFalse(validator.contravariant)
+        self.assertTrue(validator.validate([1.5, 2], 'data'))
+
+        with overrides(mode='invariant'):
+            validator.reset()
+            self.assertFalse(validator.validate([1.5, 2], 'data'))
+
+
+class ForwardReferenceTests(unittest.TestCase):
+
+    def get_validator(self, hint, namespace=None):
+        validator = init_validator({'data': hint}, namespace=namespace)
+        validator.settings = Settings(enabled=True)
+        return validator
+
+    def test_forward_reference_is_resolved_lazily(self):
+        namespace = {}
+        validator = self.get_validator(typing.List['Item'], namespace)
+
+        self.assertEqual(validator.forward_refs, {})
+        self.assertTrue(validator.validate([], 'data'))
+
+        namespace['Item'] = int
+
+        self.assertTrue(validator.validate([1, 2], 'data'))
+        self.assertFalse(validator.validate([1, '2'], 'data'))
+        self.assertEqual(list(validator.forward_refs), ['Item'])
+
+    def test_recursive_forward_reference_is_shared(self):
+        namespace = {}
+        namespace['Tree'] = typing.List['Tree']
+        validator = self.get_validator(namespace['Tree'], namespace)
+
+        self.assertTrue(validator.validate([[], [[], [[]]]], 'data'))
+        self.assertFalse(validator.validate([[], [[1]]], 'data'))
+
+        tree = validator.forward_refs['Tree']
+        self.assertIs(tree.children[0].target, tree)
+
+    def test_unresolvable_forward_reference(self):
+        validator = self.get_validator(typing.List['Unknown'], {})
+
+        self.assertTrue(validator.validate([], 'data'))
+
+        with self.assertRaises(NameError):
+            validator.validate([1], 'data')
+
+
+
+class MemoTests(unittest.TestCase):
+
+    def get_validator(self, hint, namespace=None):
+        validator = init_validator({'data': hint}, namespace=namespace)
+        validator.settings = Settings(enabled=True)
+        return validator
+
+    def test_shared_data_is_validated_once(self):
+        validator = self.get_validator(typing.List[typing.Dict[str, int]])
+        shared = {'a': 1, 'b': 2}
+        data = [shared] * 1000
+
+        self.assertTrue(validator.validate(data, 'data'))
+        self.assertEqual(len(validator.memo), 2)
+        self.assertIs(validator.data_out['data'], data)
+
+        validator.end_pass()
+        self.assertEqual(validator.memo, {})
+
+        shared['c'] = 'c'
+        self.assertFalse(validator.validate(data, 'data'))
+
+    def test_optional_data_is_memoized(self):
+        validator = self.get_validator(typing.List[typing.Optional[typing.Dict[str, int]]])
+        shared = {'a': 1, 'b': 2}
+        data = [shared, None] * 500
+
+        self.assertTrue(validator.validate(data, 'data'))
+        self.assertEqual(len(validator.memo), 3)
+        self.assertIs(validator.data_out['data'], data)
+
+        validator.reset()
+        validator.shallow = True
+        shared['c'] = 'c'
+
+        self.assertTrue(validator.validate([shared, None], 'data'))
+
+        validator.reset()
+        validator.shallow = False
+
+        self.assertFalse(validator.validate([shared, None], 'data'))
+
+    def test_atomic_data_is_not_memoized(self):
+        validator = self.get_validator(typing.List[typing.Union[int, str]])
+
+        self.assertTrue(validator.validate([1, 'a', 1], 'data'))
+        self.assertEqual(len(validator.memo), 1)
+
+    def test_cyclic_data(self):
+        namespace = {}
+        namespace['Tree'] = typing.List['Tree']
+        validator = self.get_validator(namespace['Tree'], namespace)
+
+        data = []
+        data.append(data)
+        data.append([data, []])
+
+        self.assertTrue(validator.validate(data, 'data'))
+
+        validator.reset()
+
+        data.append([1])
+
+        self.assertFalse(validator.validate(data, 'data'))
 
 
 if __name__ == '__main__':
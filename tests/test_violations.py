@@ -0,0 +1,225 @@
+import os
+import time
+import typing
+import tempfile
+import threading
+import unittest
+
+from enforce import runtime_validation, config
+from enforce.exceptions import RuntimeTypeError
+from enforce.violations import ViolationLog, VIOLATIONS, flush, get_counts
+
+
+class ViolationLogTests(unittest.TestCase):
+
+    def setUp(self):
+        config(reset=True)
+        self.records = []
+        config({'violations': {'sink': self.records.extend, 'interval': 60}})
+        self.log = ViolationLog()
+        # The flusher is not needed, as all the tests flush explicitly
+        self.log.flusher = object()
+
+    def tearDown(self):
+        config(reset=True)
+
+    def test_deduplication(self):
+        for _ in range(3):
+            self.log.record('foo', 'a', int, 'str')
+        self.log.record('foo', 'a', int, 'float')
+        self.log.record('foo', 'return', int, 'str', log=False)
+
+        self.log.flush()
+
+        self.assertEqual([(r.function, r.parameter, r.hint, r.actual_type, r.count) for r in self.records],
+                         [('foo', 'a', "<class 'int'>", 'str', 3), ('foo', 'a', "<class 'int'>", 'float', 1)])
+
+        self.assertEqual(self.log.counts[('foo', 'a', 'str')], 3)
+        self.assertEqual(self.log.counts[('foo', 'return', 'str')], 1)
+
+        # Duplicates are counted only until the next flush
+        self.log.record('foo', 'a', int, 'str')
+        self.log.flush()
+
+        self.assertEqual(len(self.records), 3)
+        self.assertEqual(self.records[-1].count, 1)
+
+    def test_counts_limit(self):
+        """
+        Verifies that only the most frequent violations are counted once there are too many of them
+        """
+        self.log.MAX_COUNTS = 4
+
+        for i in range(4):
+            for _ in range(i + 1):
+                self.log.record('foo', 'a', int, str(i), log=False)
+
+        self.assertEqual(len(self.log.counts), 4)
+
+        self.log.record('foo', 'a', int, 'new', log=False)
+
+        self.assertEqual(dict(self.log.counts), {('foo', 'a', '3'): 4, ('foo', 'a', '2'): 3})
+
+    def test_rate_limit(self):
+        config({'violations': {'rate_limit': 5}})
+        self.log = ViolationLog()
+        self.log.flusher = object()
+
+        for i in range(10):
+            self.log.record('foo', 'a', int, str(i))
+
+        self.log.flush()
+
+        self.assertEqual(len(self.records), 5)
+        self.assertEqual(self.log.suppressed, 5)
+
+    def test_capacity(self):
+        config({'violations': {'capacity': 3}})
+        self.log = ViolationLog()
+        self.log.flusher = object()
+
+        for i in range(5):
+            self.log.record('foo', 'a', int, str(i))
+
+        self.log.flush()
+
+        self.assertEqual([r.actual_type for r in self.records], ['2', '3', '4'])
+        self.assertEqual(self.log.dropped, 2)
+
+    def test_file(self):
+        handle, path = tempfile.mkstemp()
+        os.close(handle)
+
+        try:
+            config({'violations': {'sink': False, 'file': path}})
+
+            self.log.record('foo', 'a', int, 'str')
+            self.log.record('foo', 'return', int, 'str')
+            self.log.flush()
+
+            with open(path) as f:
+                lines = f.read().splitlines()
+        finally:
+            os.remove(path)
+
+        self.assertEqual(lines, [
+            "Runtime type violation in foo: Argument 'a' was not of type <class 'int'>. Actual type was str. (1 times)",
+            "Runtime type violation in foo: Return value was not of type <class 'int'>. Actual type was str. (1 times)"
+        ])
+
+    def test_concurrent_flush(self):
+        """
+        Verifies that every logged violation is written exactly once while other threads keep recording
+        """
+        config({'violations': {'rate_limit': 100000, 'capacity': 100000}})
+        self.log = ViolationLog()
+        self.log.flusher = object()
+
+        def record(thread):
+            for i in range(2000):
+                self.log.record('foo', str(thread), int, str(i % 50))
+
+        threads = [threading.Thread(target=record, args=(i,)) for i in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        while any(thread.is_alive() for thread in threads):
+            self.log.flush()
+
+        for thread in threads:
+            thread.join()
+
+        self.log.flush()
+
+        self.assertEqual(sum(record.count for record in self.records), 8000)
+        self.assertEqual(self.log.dropped, 0)
+
+    def test_flusher(self):
+        config({'violations': {'interval': 0.01}})
+        self.log = ViolationLog()
+
+        self.log.record('foo', 'a', int, 'str')
+
+        for _ in range(100):
+            if self.records:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(len(self.records), 1)
+
+
+class ViolationPolicyTests(unittest.TestCase):
+
+    def setUp(self):
+        config(reset=True)
+        flush()
+        VIOLATIONS.clear()
+        self.records = []
+        config({'violations': {'sink': self.records.extend}})
+
+    def tearDown(self):
+        flush()
+        VIOLATIONS.clear()
+        config(reset=True)
+
+    def test_policies(self):
+        @runtime_validation(group='raising')
+        def raising(a: int) -> int:
+            return a
+
+        @runtime_validation(group='logging')
+        def logging(a: int) -> int:
+            return a
+
+        @runtime_validation(group='counting')
+        def counting(a: typing.List[int]) -> int:
+            return a
+
+        config({'groups': {'set': {'raising': True, 'logging': True, 'counting': True},
+                           'policies': {'logging': 'log', 'counting': 'count'}}})
+
+        with self.assertRaises(RuntimeTypeError):
+            raising('a')
+
+        self.assertEqual(logging('a'), 'a')
+        self.assertEqual(logging('a'), 'a')
+        self.assertEqual(counting([1]), [1])
+
+        flush()
+
+        self.assertEqual(len(self.records), 2)
+        self.assertEqual(self.records[0].parameter, 'a')
+        self.assertEqual(self.records[0].count, 2)
+        self.assertTrue(self.records[0].function.endswith('logging'))
+        self.assertEqual(self.records[1].parameter, 'return')
+        self.assertEqual(self.records[1].count, 2)
+
+        counts = get_counts()
+        self.assertEqual(sum(count for key, count in counts.items() if key[0].endswith('counting')), 1)
+        self.assertEqual(sum(count for key, count in counts.items() if key[0].endswith('logging')), 4)
+
+    def test_functions_of_different_modules(self):
+        def create(module):
+            def handler(a: int) -> int:
+                return 1
+            handler.__module__ = module
+            return runtime_validation(group='logging')(handler)
+
+        first = create('first')
+        second = create('second')
+
+        config({'groups': {'set': {'logging': True}, 'policies': {'logging': 'log'}}})
+
+        first('a')
+        second('a')
+        flush()
+
+        self.assertEqual(len(self.records), 2)
+        self.assertTrue(self.records[0].function.startswith('first.'))
+        self.assertTrue(self.records[1].function.startswith('second.'))
+        self.assertEqual(len(get_counts()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
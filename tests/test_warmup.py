@@ -0,0 +1,208 @@
+import typing
+import unittest
+
+from enforce import runtime_validation, config
+from enforce.exceptions import RuntimeTypeError
+from enforce.warmup import WarmupGuard
+
+
+class WarmupGuardTests(unittest.TestCase):
+
+    def call(self, guard, args, output, check_rate=1000):
+        """
+        Simulates a successful call, returns if it skipped validation
+        """
+        if guard.enter(args, {}, check_rate):
+            return guard.skip_output(output)
+
+        guard.validated_inputs(False)
+        if not guard.skip_output(output):
+            guard.validated_output(output, False)
+
+        return False
+
+    def test_warm_up(self):
+        guard = WarmupGuard(3)
+
+        self.assertEqual([self.call(guard, (1, 'a'), 1) for _ in range(5)], [False, False, False, True, True])
+        self.assertEqual(guard.stats(),
+                         {'state': 'warm', 'calls': 5, 'validations': 3, 'guarded': 2, 'failures': 0, 'snapbacks': 0})
+
+    def test_types_seen_during_warm_up(self):
+        guard = WarmupGuard(3)
+
+        self.call(guard, (1,), 1)
+        self.call(guard, ('a',), 1)
+        self.call(guard, (1.0,), None)
+
+        self.assertTrue(guard.warm)
+        self.assertTrue(self.call(guard, ('b',), 1))
+        self.assertTrue(self.call(guard, (2,), None))
+
+    def test_new_input_type(self):
+        guard = WarmupGuard(2)
+
+        self.call(guard, (1,), 1)
+        self.call(guard, (1,), 1)
+
+        self.assertFalse(self.call(guard, ('a',), 1))
+        self.assertFalse(guard.warm)
+        self.assertEqual(guard.snapbacks, 1)
+
+        # The warm-up starts over
+        self.assertFalse(self.call(guard, ('a',), 1))
+        self.assertTrue(self.call(guard, (1,), 1))
+        self.assertTrue(self.call(guard, ('a',), 1))
+
+    def test_new_output_type(self):
+        guard = WarmupGuard(2)
+
+        self.call(guard, (1,), 1)
+        self.call(guard, (1,), 1)
+
+        self.assertTrue(guard.enter((1,), {}, 1000))
+        self.assertFalse(guard.skip_output('a'))
+        self.assertFalse(guard.warm)
+
+        # Unvalidated arguments do not count towards the warm-up
+        guard.validated_output('a', False)
+        self.assertEqual(guard.successes, 0)
+
+    def test_check_rate(self):
+        guard = WarmupGuard(1)
+
+        results = [self.call(guard, (1,), 1, check_rate=4) for _ in range(9)]
+
+        self.assertEqual(results, [False, True, True, False, True, True, True, False, True])
+
+    def test_failure(self):
+        guard = WarmupGuard(2)
+
+        self.call(guard, (1,), 1)
+        guard.enter((1,), {}, 1000)
+        guard.fail()
+        self.call(guard, (1,), 1)
+
+        self.assertFalse(guard.warm)
+        self.assertEqual(guard.failures, 1)
+
+        self.call(guard, (1,), 1)
+        self.assertTrue(guard.warm)
+
+        guard.enter((1,), {}, 1)
+        guard.fail()
+
+        self.assertFalse(guard.warm)
+        self.assertEqual(guard.snapbacks, 1)
+
+    def test_transforming(self):
+        guard = WarmupGuard(1)
+
+        guard.enter((1,), {}, 1000)
+        guard.validated_inputs(True)
+        guard.validated_output(1, False)
+
+        self.assertFalse(guard.warm)
+        self.assertFalse(self.call(guard, (1,), 1))
+
+
+class WarmupEnforcementTests(unittest.TestCase):
+
+    def setUp(self):
+        config(reset=True)
+
+    def tearDown(self):
+        config(reset=True)
+
+    def test_invalid_parameter(self):
+        for warmup in (0, -1, 1.5, True, '10'):
+            with self.assertRaises(TypeError):
+                runtime_validation(warmup=warmup)
+
+    def test_warm_function(self):
+        @runtime_validation(warmup=3)
+        def foo(a: typing.List[int], b: int=0) -> typing.List[int]:
+            return a
+
+        for _ in range(3):
+            foo([1])
+
+        self.assertEqual(foo.stats()['state'], 'warm')
+
+        # Only the types are checked once warmed up
+        self.assertEqual(foo(['a']), ['a'])
+
+        with self.assertRaises(RuntimeTypeError):
+            foo('a')
+
+        stats = foo.stats()
+        self.assertEqual(stats['state'], 'cold')
+        self.assertEqual(stats['failures'], 1)
+        self.assertEqual(stats['snapbacks'], 1)
+
+        with self.assertRaises(RuntimeTypeError):
+            foo(['a'])
+
+        # Keyword arguments have their own types
+        for _ in range(3):
+            foo([1], b=1)
+
+        self.assertEqual(foo([1], b=1), [1])
+        self.assertEqual(foo.stats()['guarded'], 2)
+
+        with self.assertRaises(RuntimeTypeError):
+            foo([1], b='b')
+
+    def test_check_rate(self):
+        config({'warmup': {'check_rate': 2}})
+
+        @runtime_validation(warmup=1)
+        def foo(a: typing.List[int]) -> None:
+            pass
+
+        foo([1])
+        foo([1])
+        foo(['a'])
+
+        with self.assertRaises(RuntimeTypeError):
+            foo(['a'])
+
+    def test_without_warmup(self):
+        @runtime_validation
+        def foo(a: int) -> int:
+            return a
+
+        self.assertIsNone(foo.stats())
+
+    def test_generic_function(self):
+        T = typing.TypeVar('T')
+
+        @runtime_validation(warmup=1)
+        def foo(a: T, b: T) -> T:
+            return a
+
+        foo(1, 1)
+        foo(1, 1)
+
+        self.assertIsNone(foo.stats())
+
+        with self.assertRaises(RuntimeTypeError):
+            foo(1, 'a')
+
+    def test_transforming_function(self):
+        @runtime_validation(warmup=1)
+        def foo(a: typing.Callable[[int], int]) -> int:
+            return a(1)
+
+        def bar(x: int) -> int:
+            return x
+
+        for _ in range(3):
+            foo(bar)
+
+        self.assertEqual(foo.stats()['state'], 'cold')
+        self.assertEqual(foo.stats()['guarded'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()